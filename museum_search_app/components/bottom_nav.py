@@ -10,6 +10,8 @@ from kivy.uix.label import Label
 from kivy.graphics import Color, Rectangle, RoundedRectangle
 from kivy.metrics import dp
 
+from utils.thumbnail_atlas import icon_source
+
 
 class BottomNavigation(BoxLayout):
     """Clean professional bottom navigation"""
@@ -35,13 +37,13 @@ class BottomNavigation(BoxLayout):
         self.bind(pos=self._update_bg, size=self._update_bg)
         
         # Buttons - 3 buttons now
-        self.back_btn = self._create_button('utils/Images/back.png', 'Tilbage', 'back', False)
+        self.back_btn = self._create_button(icon_source('back'), 'Tilbage', 'back', False)
         self.add_widget(self.back_btn)
         
-        self.home_btn = self._create_button('utils/Images/home.png', 'Hjem', 'home', True)
+        self.home_btn = self._create_button(icon_source('home'), 'Hjem', 'home', True)
         self.add_widget(self.home_btn)
         
-        self.saved_btn = self._create_button('utils/Images/bookmark-white.png', 'Gemte', 'saved', False)
+        self.saved_btn = self._create_button(icon_source('bookmark-white'), 'Gemte', 'saved', False)
         self.add_widget(self.saved_btn)
     
     def _create_button(self, icon_path, text, btn_id, active):
@@ -95,10 +97,9 @@ class BottomNavigation(BoxLayout):
             active = (btn.button_id == button_id)
             btn.is_active = active
             
-            # Update icon color
+            # Update icon color (tint only - the shared atlas texture is reused, no reload)
             if hasattr(btn, 'icon'):
                 btn.icon.color = (0.15, 0.15, 0.15, 1) if active else (0.65, 0.65, 0.65, 1)
-                btn.icon.reload()  # Reload for crisp rendering
             
             # Update label with texture refresh
             if hasattr(btn, 'label'):
@@ -7,11 +7,14 @@ Volt-style card carousel for displaying recent searches
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.scrollview import ScrollView
 from kivy.uix.label import Label
-from kivy.uix.image import AsyncImage
-from kivy.graphics import Color, RoundedRectangle, Line
+from kivy.graphics import Color, RoundedRectangle
 from kivy.metrics import dp
 from kivy.clock import Clock
 
+from components.grid_card import GridCard
+from utils.data_manager import DataManager
+from utils.image_fetcher import resolve_display_image
+
 
 class RecentSearchesCarousel(BoxLayout):
     """Volt-style carousel for displaying recent searches"""
@@ -25,9 +28,14 @@ class RecentSearchesCarousel(BoxLayout):
         self.spacing = dp(5)  # Reduced spacing between title and carousel
         
         self.item_click_callback = item_click_callback
+        self._cards = {}  # objectNumber -> CarouselCard currently shown
+        self._pool = []  # Unused cards kept for reuse
         
         self._create_carousel_layout()
         
+        # Follow recent search changes from any screen or thread
+        DataManager().add_listener(self._on_data_changed)
+        
     def safe_set_image_source(self, image_widget, local_path):
         """Sæt billede source sikkert på UI-tråden (Android-compatible)"""
         def _apply_source(dt):
@@ -96,181 +104,85 @@ class RecentSearchesCarousel(BoxLayout):
         
         self.carousel_scroll.add_widget(self.carousel_layout)
         
+        # "No recent searches" message, shown instead of cards
+        self.no_recent_label = Label(
+            text='Ingen seneste søgninger endnu\nSøg efter objekter for at se dem her',
+            size_hint_x=None,
+            width=dp(320),
+            font_size='16sp',
+            color=(0.6, 0.6, 0.6, 1),
+            halign='center',
+            valign='middle'
+        )
+        self.no_recent_label.bind(size=self.no_recent_label.setter('text_size'))
+        
         self.add_widget(divider)
         self.add_widget(title_layout)
         self.add_widget(self.carousel_scroll)
     
     def update_carousel(self, recent_searches):
-        """Update carousel with recent searches data"""
-        # Clear existing elements
-        self.carousel_layout.clear_widgets()
-        
+        """
+        Update carousel with recent searches data
+
+        Cards are pooled and keyed by object number: the new list is diffed against
+        the shown cards, so usually only the searched item moves to the front.
+        """
         if not recent_searches:
             # Show "no recent searches" message
-            no_recent_label = Label(
-                text='Ingen seneste søgninger endnu\nSøg efter objekter for at se dem her',
-                size_hint_x=None,
-                width=dp(320),
-                font_size='16sp',
-                color=(0.6, 0.6, 0.6, 1),
-                halign='center',
-                valign='middle'
-            )
-            no_recent_label.bind(size=no_recent_label.setter('text_size'))
-            self.carousel_layout.add_widget(no_recent_label)
+            for card in list(self._cards.values()):
+                self._release_card(card)
+            self._cards = {}
+            if self.no_recent_label.parent is None:
+                self.carousel_layout.add_widget(self.no_recent_label)
             return
         
-        # Add recent searches to carousel
+        if self.no_recent_label.parent is not None:
+            self.carousel_layout.remove_widget(self.no_recent_label)
+        
+        # Match items to existing cards, rebinding only what changed
+        old_cards = self._cards
+        self._cards = {}
+        wanted_cards = []
         for search_item in recent_searches:
-            card = self._create_carousel_card(search_item)
-            self.carousel_layout.add_widget(card)
+            key = search_item.get('objectNumber', '')
+            card = old_cards.pop(key, None)
+            if card is None:
+                card = self._pool.pop() if self._pool else CarouselCard(click_callback=self._on_card_click)
+            card.set_item(search_item)
+            self._cards[key] = card
+            wanted_cards.append(card)
+        
+        # Cards for items that dropped out go back to the pool
+        for card in old_cards.values():
+            self._release_card(card)
+        for child in list(self.carousel_layout.children):
+            if not any(child is card for card in wanted_cards):
+                self.carousel_layout.remove_widget(child)
+        
+        # Reorder: only cards that are not already at their position are moved
+        for position, card in enumerate(wanted_cards):
+            shown = self.carousel_layout.children[::-1]  # Kivy keeps children in reverse order
+            if position < len(shown) and shown[position] is card:
+                continue
+            if card.parent is not None:
+                card.parent.remove_widget(card)
+            self.carousel_layout.add_widget(card, index=len(self.carousel_layout.children) - position)
     
-    def _create_carousel_card(self, search_item):
-        """Create modern card for carousel with subtle shadow and border"""
-        # Card container - fixed width 145dp for 2 cards + peek on phone
-        # Add small padding to prevent clipping by rounded corners
-        card_container = BoxLayout(
-            orientation='vertical',
-            size_hint_x=None,
-            width=dp(145),  # Reduced from 200dp to fit 2 cards + peek
-            spacing=0,
-            padding=[dp(2), dp(2), dp(2), 0]  # Small padding on top and sides
-        )
-        
-        # Add card background (no shadow)
-        with card_container.canvas.before:
-            # Main card background (white)
-            Color(1, 1, 1, 1)
-            card_container.card_bg = RoundedRectangle(
-                pos=card_container.pos,
-                size=card_container.size,
-                radius=[dp(0), dp(0), dp(0), dp(0)]  # Square corners
-            )
-        
-        card_container.bind(pos=self._update_card_container_bg, size=self._update_card_container_bg)
-        
-        # Image section - fixed size 145x109dp (4:3 aspect ratio)
-        image_section = BoxLayout(
-            orientation='vertical',
-            size_hint_y=None,
-            height=dp(109)  # 145 * 3/4 for 4:3 aspect
-        )
-        
-        if search_item.get('hasImage') and search_item.get('primaryImage'):
-            image = AsyncImage(
-                source=search_item['primaryImage'],
-                fit_mode="cover",  # Cover to fill entire space and maintain consistent size
-                size_hint=(1, 1),
-                mipmap=True
-            )
-            image_section.add_widget(image)
-            
-            # Add rounded corner overlay - draw only in corners to avoid visible lines
-            with image_section.canvas.after:
-                Color(1, 1, 1, 1)  # White to match card background
-                # Create rounded border effect with minimal visibility
-                image_section.corner_border = Line(
-                    rounded_rectangle=(
-                        image_section.x, 
-                        image_section.y, 
-                        image_section.width, 
-                        image_section.height, 
-                        dp(8)  # radius
-                    ),
-                    width=dp(3)  # Moderate width for corner coverage
-                )
-            
-            image_section.bind(pos=self._update_image_overlay, size=self._update_image_overlay)
-        else:
-            # Placeholder with rounded corners
-            placeholder_container = BoxLayout(orientation='vertical')
-            
-            with placeholder_container.canvas.before:
-                Color(0.96, 0.97, 0.98, 1)
-                placeholder_container.placeholder_bg = RoundedRectangle(
-                    pos=placeholder_container.pos,
-                    size=placeholder_container.size,
-                    radius=[dp(8), dp(8), dp(8), dp(8)]  # Rounded corners on all sides
-                )
-            
-            placeholder_container.bind(pos=self._update_placeholder_bg, size=self._update_placeholder_bg)
-            
-            placeholder_label = Label(
-                text='No Image',
-                font_size='14sp',
-                color=(0.7, 0.7, 0.7, 1),
-                halign='center',
-                valign='middle'
-            )
-            placeholder_container.add_widget(placeholder_label)
-            image_section.add_widget(placeholder_container)
-        
-        # Text section - padding 8-12px, no separate background (uses card background)
-        text_section = BoxLayout(
-            orientation='vertical',
-            size_hint_y=None,
-            size_hint_x=1,
-            height=dp(60),  # Reduced from 70dp for smaller cards
-            padding=[dp(8), dp(8), dp(8), dp(8)],
-            spacing=dp(3)
-        )
-        
-        # Title - 14-16px semibold, max 1 line with ellipsis
-        title_text = search_item.get('title', 'No title')
-        if len(title_text) > 22:
-            title_text = title_text[:19] + '...'
-        
-        title_label = Label(
-            text=title_text,
-            font_size='13sp',  # Slightly smaller for smaller cards
-            bold=True,
-            color=(0.2, 0.2, 0.2, 1),
-            halign='center',
-            valign='top',
-            text_size=(dp(130), None),  # Reduced from 180dp
-            shorten=True,
-            shorten_from='right',
-            max_lines=1
-        )
-        
-        # Subtitle (object number if available) - 12-13px, color #757575
-        objektnummer = search_item.get('objectNumber', '')
-        if objektnummer:
-            subtitle_label = Label(
-                text=objektnummer,
-                font_size='11sp',  # Slightly smaller
-                color=(0.46, 0.46, 0.46, 1),  # #757575
-                halign='center',
-                valign='top',
-                text_size=(dp(130), None)  # Reduced from 180dp
-            )
-            text_section.add_widget(title_label)
-            text_section.add_widget(subtitle_label)
-        else:
-            text_section.add_widget(title_label)
-        
-        # Assemble card
-        card_container.add_widget(image_section)
-        card_container.add_widget(text_section)
-        
-        # Make card clickable - using the old working approach
-        def on_card_click(touch):
-            print(f"Carousel card clicked! Touch: {touch.pos}")
-            if card_container.collide_point(*touch.pos):
-                print(f"Carousel: Touch collision detected for item: {search_item.get('title', 'Unknown')}")
-                if self.item_click_callback:
-                    print("Carousel: Calling item_click_callback")
-                    self.item_click_callback(search_item)
-                else:
-                    print("Carousel: No item_click_callback set!")
-                return True
-            else:
-                print("Carousel: Touch outside card bounds")
-            return False
-        
-        card_container.on_touch_down = on_card_click
-        
-        return card_container
+    def _on_data_changed(self, event, index, item):
+        """DataManager change event (UI thread) - only recent searches concern the carousel"""
+        if event == 'recent_changed':
+            self.update_carousel(DataManager().get_recent_searches())
+    
+    def _release_card(self, card):
+        """Take a card out of the carousel and keep it for reuse"""
+        if card.parent is not None:
+            card.parent.remove_widget(card)
+        self._pool.append(card)
+    
+    def _on_card_click(self, search_item):
+        """Forward card clicks to the home screen"""
+        if self.item_click_callback:
+            self.item_click_callback(search_item)
     
     def _update_divider_bg(self, instance, value):
         """Update divider line"""
@@ -278,29 +190,57 @@ class RecentSearchesCarousel(BoxLayout):
             instance.line_rect.pos = instance.pos
             instance.line_rect.size = instance.size
     
-    def _update_card_container_bg(self, instance, value):
-        """Update card container background"""
-        if hasattr(instance, 'card_bg'):
-            instance.card_bg.pos = instance.pos
-            instance.card_bg.size = instance.size
+    def set_item_click_callback(self, callback):
+        """Set the callback for when carousel items are clicked"""
+        self.item_click_callback = callback
+
+
+class CarouselCard(GridCard):
+    """Card for the carousel - drawn in a single canvas by GridCard, rebound with set_item()"""
     
-    def _update_placeholder_bg(self, instance, value):
-        """Update placeholder background"""
-        if hasattr(instance, 'placeholder_bg'):
-            instance.placeholder_bg.pos = instance.pos
-            instance.placeholder_bg.size = instance.size
+    def __init__(self, click_callback=None, **kwargs):
+        # Fixed width 145dp for 2 cards + peek on phone, height follows the carousel
+        kwargs.setdefault('size_hint', (None, 1))
+        kwargs.setdefault('width', dp(145))
+        # Image 145x109dp (4:3 aspect ratio); full textures instead of atlas cells at this size
+        super().__init__(image_height=109, text_height=60, text_padding=8, title_font=13,
+                         subtitle_font=11, use_atlas=False, **kwargs)
+        
+        self.click_callback = click_callback
+        self.search_item = None
     
-    def _update_image_overlay(self, instance, value):
-        """Update image overlay border with rounded corners"""
-        if hasattr(instance, 'corner_border'):
-            instance.corner_border.rounded_rectangle = (
-                instance.x,
-                instance.y, 
-                instance.width,
-                instance.height,
-                dp(8)
+    def set_item(self, search_item):
+        """Bind the card to a recent search item (no-op if it already shows it)"""
+        if search_item is self.search_item:
+            return
+        self.search_item = search_item
+        
+        has_image = bool(search_item.get('hasImage') and (search_item.get('primaryImage') or search_item.get('primaryImageRef')))
+        
+        image_path = ''
+        if has_image:
+            # Missing cache files are re-fetched in the background and filled in later
+            image_path = resolve_display_image(
+                search_item, lambda path, item=search_item: self._on_image_resolved(item, path)
             )
+        
+        title_text = search_item.get('title', 'No title')
+        if len(title_text) > 22:
+            title_text = title_text[:19] + '...'
+        
+        self.set_content(
+            title_text,
+            subtitle=search_item.get('objectNumber', ''),
+            image_path=image_path,
+            has_image=has_image
+        )
     
-    def set_item_click_callback(self, callback):
-        """Set the callback for when carousel items are clicked"""
-        self.item_click_callback = callback
\ No newline at end of file
+    def _on_image_resolved(self, search_item, path):
+        """Show a re-fetched image unless the card was rebound meanwhile"""
+        if search_item is self.search_item:
+            self.set_image_path(path)
+    
+    def on_card_tap(self):
+        """Make card clickable"""
+        if self.click_callback:
+            self.click_callback(self.search_item)
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Grid Card Component for SARA Museum App
+Lightweight card drawn in one canvas - shared by result grid, saved grid and carousel
+"""
+
+from kivy.uix.widget import Widget
+from kivy.graphics import Color, Rectangle, RoundedRectangle, Line, Ellipse
+from kivy.core.text import Label as CoreLabel
+from kivy.core.text.markup import MarkupLabel
+from kivy.loader import Loader
+from kivy.metrics import dp, sp
+
+from utils.thumbnail_atlas import ThumbnailAtlas
+
+
+TITLE_COLOR = (0.2, 0.2, 0.2, 1)
+SUBTITLE_COLOR = (0.46, 0.46, 0.46, 1)  # #757575
+PLACEHOLDER_BG_COLOR = (0.96, 0.97, 0.98, 1)
+PLACEHOLDER_TEXT_COLOR = (0.7, 0.7, 0.7, 1)
+
+
+def render_text(text, font_size, width, color, bold=False, max_lines=1, markup=False):
+    """
+    Render text to a texture with a CoreLabel; returns the label (keeps the texture alive)
+
+    font_size is in sp - CoreLabel takes pixels and does not parse '12sp' strings.
+    """
+    label_class = MarkupLabel if markup else CoreLabel
+    label = label_class(
+        text=text,
+        font_size=sp(font_size),
+        bold=bold,
+        color=color,
+        halign='center',
+        text_size=(width, None),
+        shorten=True,
+        shorten_from='right',
+        max_lines=max_lines
+    )
+    label.refresh()
+    return label
+
+
+def cover_region(texture, width, height):
+    """Centered part of a texture with the aspect ratio of width x height (like fit_mode cover)"""
+    if not texture or width <= 0 or height <= 0:
+        return texture
+    tex_w, tex_h = texture.size
+    aspect = width / height
+    if tex_w / float(tex_h) > aspect:
+        crop_w = int(tex_h * aspect)
+        return texture.get_region(int((tex_w - crop_w) / 2), 0, crop_w, tex_h)
+    crop_h = int(tex_w / aspect)
+    return texture.get_region(0, int((tex_h - crop_h) / 2), tex_w, crop_h)
+
+
+class GridCard(Widget):
+    """
+    Card with image (or placeholder), rounded-corner mask, title and subtitle
+
+    Everything is drawn as instructions in this widget's own canvas - no child
+    widgets and only one pos/size binding. Text is rendered to textures when the
+    content changes, so moving a card (scrolling, recycling) only moves rectangles.
+    Subclasses set the content with set_content() and handle taps in on_card_tap().
+    """
+
+    def __init__(self, image_height=90, text_height=50, text_padding=5, title_font=12,
+                 subtitle_font=10, placeholder_font=14, use_atlas=True, show_remove=False, **kwargs):
+        kwargs.setdefault('size_hint', (None, None))
+        super().__init__(**kwargs)
+        self.image_height = dp(image_height)
+        self.text_height = dp(text_height)
+        self.text_padding = dp(text_padding)
+        self.title_font = title_font
+        self.subtitle_font = subtitle_font
+        self.placeholder_font = placeholder_font
+        self.use_atlas = use_atlas and ThumbnailAtlas().is_available()
+        self.show_remove = show_remove
+
+        self.image_path = ''
+        self._image_texture = None
+        self._proxy_image = None
+        self._content_key = None
+        self._title_label = None
+        self._subtitle_label = None
+        self._placeholder_label = None
+
+        with self.canvas:
+            # Card background (square corners)
+            Color(1, 1, 1, 1)
+            self.bg_rect = Rectangle()
+
+            # Placeholder - shown while there is no image texture
+            self.placeholder_color = Color(*PLACEHOLDER_BG_COLOR)
+            self.placeholder_rect = RoundedRectangle(radius=[dp(8)] * 4)
+            self.placeholder_text_color = Color(1, 1, 1, 0)
+            self.placeholder_text_rect = Rectangle()
+
+            # Image with rounded-corner mask on top (white line over the corners)
+            self.image_color = Color(1, 1, 1, 0)
+            self.image_rect = Rectangle()
+            self.mask_color = Color(1, 1, 1, 0)
+            self.mask_line = Line(width=dp(3))
+
+            # Title and subtitle textures (colors are baked into the textures)
+            Color(1, 1, 1, 1)
+            self.title_rect = Rectangle()
+            self.subtitle_rect = Rectangle()
+
+            # Circular remove button (saved grid only)
+            if show_remove:
+                Color(0.9, 0.2, 0.2, 0.95)  # Red background
+                self.remove_circle = Ellipse()
+                Color(1, 1, 1, 1)
+                self.remove_text_rect = Rectangle()
+
+        if show_remove:
+            self._remove_label = render_text('×', 20, None, (1, 1, 1, 1), bold=True)
+            self.remove_text_rect.texture = self._remove_label.texture
+
+        self.bind(pos=self._update_canvas, size=self._update_canvas)
+
+    # ---- content -------------------------------------------------------
+
+    def set_content(self, title, subtitle='', image_path='', has_image=False, placeholder_text='No Image',
+                    placeholder_markup=False):
+        """
+        Show new content. Text textures are only re-rendered when the text changes.
+
+        Args:
+            title: Title line (shortened with ellipsis)
+            subtitle: Second line, usually the object number ('' hides it)
+            image_path: Local image file ('' while it is being fetched)
+            has_image: Object has an image - placeholder text is hidden while loading
+            placeholder_text: Text in the placeholder for objects without an image
+            placeholder_markup: placeholder_text contains Kivy markup
+        """
+        text_width = self.width - 2 * self.text_padding
+        content_key = (title, subtitle, placeholder_text if not has_image else None, text_width)
+        if content_key != self._content_key:
+            self._content_key = content_key
+            self._title_label = render_text(title, self.title_font, text_width, TITLE_COLOR, bold=True) if title else None
+            self._subtitle_label = render_text(subtitle, self.subtitle_font, text_width, SUBTITLE_COLOR) if subtitle else None
+            self._placeholder_label = None
+            if not has_image and placeholder_text:
+                self._placeholder_label = render_text(
+                    placeholder_text, self.placeholder_font, self.width - dp(20), PLACEHOLDER_TEXT_COLOR,
+                    max_lines=4, markup=placeholder_markup
+                )
+            self.title_rect.texture = self._title_label.texture if self._title_label else None
+            self.subtitle_rect.texture = self._subtitle_label.texture if self._subtitle_label else None
+            self.placeholder_text_rect.texture = self._placeholder_label.texture if self._placeholder_label else None
+
+        self.placeholder_text_color.a = 1 if self._placeholder_label else 0
+        self.set_image_path(image_path if has_image else '')
+        self._update_canvas()
+
+    def set_image_path(self, image_path):
+        """Show another local image (safe to call repeatedly when rebinding)"""
+        if image_path == self.image_path:
+            return
+
+        if self.image_path:
+            if self.use_atlas:
+                ThumbnailAtlas().release(self.image_path, self)
+            self._drop_proxy_image()
+
+        self.image_path = image_path
+        self._set_image_texture(None)
+
+        if not image_path:
+            return
+        if self.use_atlas and ThumbnailAtlas().request(image_path, self):
+            return
+        self._load_image(image_path)
+
+    def on_atlas_region(self, path, region):
+        """Called by ThumbnailAtlas on the UI thread"""
+        if path != self.image_path:
+            ThumbnailAtlas().release(path, self)
+            return
+        if region is None:
+            # Atlas is full or decode failed - fall back to a regular texture
+            self._load_image(path)
+            return
+        self._set_image_texture(region)
+
+    def _load_image(self, path):
+        """Load a separate texture through the shared Loader (async, cached)"""
+        self._drop_proxy_image()
+        self._proxy_image = Loader.image(path)
+        if self._proxy_image.loaded:
+            self._set_image_texture(self._proxy_image.image.texture)
+        else:
+            self._proxy_image.bind(on_load=self._on_image_loaded)
+
+    def _on_image_loaded(self, proxy_image):
+        if proxy_image is self._proxy_image and proxy_image.image:
+            self._set_image_texture(proxy_image.image.texture)
+
+    def _drop_proxy_image(self):
+        if self._proxy_image is not None:
+            self._proxy_image.unbind(on_load=self._on_image_loaded)
+            self._proxy_image = None
+
+    def _set_image_texture(self, texture):
+        self._image_texture = texture
+        shown = texture is not None
+        self.image_color.a = 1 if shown else 0
+        self.mask_color.a = 1 if shown else 0
+        self._update_image_rect()
+
+    # ---- geometry ------------------------------------------------------
+
+    def _image_box(self):
+        """Position and size of the image area (2dp inset on top and sides)"""
+        inset = dp(2)
+        height = min(self.image_height, self.height - inset)
+        return self.x + inset, self.top - inset - height, self.width - 2 * inset, height
+
+    def _update_image_rect(self):
+        x, y, w, h = self._image_box()
+        self.image_rect.pos = (x, y)
+        self.image_rect.size = (w, h)
+        self.image_rect.texture = cover_region(self._image_texture, w, h)
+
+    def _update_canvas(self, *args):
+        """Place all instructions - the only layout work a card does"""
+        self.bg_rect.pos = self.pos
+        self.bg_rect.size = self.size
+
+        x, y, w, h = self._image_box()
+        self.placeholder_rect.pos = (x, y)
+        self.placeholder_rect.size = (w, h)
+        self.mask_line.rounded_rectangle = (x, y, w, h, dp(8))
+        self._update_image_rect()
+
+        texture = self.placeholder_text_rect.texture
+        if texture:
+            tw, th = texture.size
+            self.placeholder_text_rect.pos = (x + (w - tw) / 2, y + (h - th) / 2)
+            self.placeholder_text_rect.size = (tw, th)
+
+        # Text section under the image, lines stacked from the top
+        text_top = y - self.text_padding
+        for rect in (self.title_rect, self.subtitle_rect):
+            texture = rect.texture
+            if not texture:
+                rect.size = (0, 0)
+                continue
+            tw, th = texture.size
+            rect.pos = (self.x + (self.width - tw) / 2, text_top - th)
+            rect.size = (tw, th)
+            text_top -= th + dp(2)
+
+        if self.show_remove:
+            size = dp(28)
+            right = x + w * 0.92
+            top = y + h * 0.92
+            self.remove_circle.pos = (right - size, top - size)
+            self.remove_circle.size = (size, size)
+            tw, th = self.remove_text_rect.texture.size
+            self.remove_text_rect.pos = (right - size / 2 - tw / 2, top - size / 2 - th / 2)
+            self.remove_text_rect.size = (tw, th)
+
+    # ---- touch ---------------------------------------------------------
+
+    def on_touch_down(self, touch):
+        """Taps on the remove button go to on_remove_tap(), all others to on_card_tap()"""
+        if not self.collide_point(*touch.pos):
+            return False
+        if self.show_remove:
+            cx, cy = self.remove_circle.pos
+            size = self.remove_circle.size[0]
+            if cx <= touch.x <= cx + size and cy <= touch.y <= cy + size:
+                self.on_remove_tap()
+                return True
+        self.on_card_tap()
+        return True
+
+    def on_card_tap(self):
+        """Override in subclasses"""
+        pass
+
+    def on_remove_tap(self):
+        """Override in subclasses"""
+        pass
@@ -10,6 +10,8 @@ from kivy.uix.image import Image
 from kivy.graphics import Color, RoundedRectangle
 from kivy.metrics import dp, cm
 
+from utils.thumbnail_atlas import icon_source
+
 
 class SearchBar(BoxLayout):
     """Minimalist search bar with magnifying glass icon"""
@@ -58,7 +60,7 @@ class SearchBar(BoxLayout):
         
         # Magnifying glass icon - centered vertically
         icon = Image(
-            source='utils/Images/search.png',
+            source=icon_source('search'),
             size_hint=(1, None),
             height=dp(20),
             pos_hint={'center_y': 0.5},
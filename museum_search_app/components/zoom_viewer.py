@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Deep Zoom Viewer Component for SARA Museum App
+Pinch-zoom viewer that only decodes the tiles needed for the current viewport
+"""
+
+import math
+from pathlib import Path
+from kivy.uix.stencilview import StencilView
+from kivy.graphics import Color, Rectangle, InstructionGroup
+from kivy.loader import Loader
+from kivy.metrics import dp
+from kivy.clock import Clock
+
+from utils.tile_pyramid import get_tile_path
+
+
+class DeepZoomViewer(StencilView):
+    """Tile-based zoom/pan viewer for a pyramid built by utils.tile_pyramid"""
+
+    # Maximum zoom: screen pixels per full-resolution image pixel
+    MAX_SCALE = 2.0
+
+    def __init__(self, manifest=None, **kwargs):
+        super().__init__(**kwargs)
+        self.manifest = None
+        self.scale = 1.0  # Screen pixels per full-resolution pixel
+        self.view_x = 0.0  # Image coordinate (full resolution) at the widget's left edge
+        self.view_y = 0.0  # Image coordinate (full resolution) at the widget's top edge
+        self._touches = {}
+        self._tiles = {}  # (level, tile_x, tile_y) -> [Rectangle, ProxyImage]
+
+        with self.canvas:
+            Color(0.1, 0.1, 0.1, 1)
+            self.bg_rect = Rectangle(pos=self.pos, size=self.size)
+            Color(1, 1, 1, 1)
+            # Coarsest level stretched under the tiles, so there is never a blank area
+            self.overview_rect = Rectangle(pos=self.pos, size=(0, 0))
+        self.tile_group = InstructionGroup()
+        self.canvas.add(self.tile_group)
+        self._overview_image = None
+
+        self._trigger_update = Clock.create_trigger(self._update_tiles, 0)
+        self.bind(pos=self._on_layout, size=self._on_layout)
+
+        if manifest:
+            self.set_manifest(manifest)
+
+    def set_manifest(self, manifest):
+        """Show a pyramid (manifest from utils.tile_pyramid.build_pyramid)"""
+        self._release_tiles()
+        self.manifest = manifest
+        top_level = len(manifest['levels']) - 1
+        self._overview_image = Loader.image(
+            str(get_tile_path(self._pyramid_dir(), top_level, 0, 0)), nocache=True
+        )
+        self._overview_image.bind(on_load=self._on_overview_loaded)
+        self._on_overview_loaded(self._overview_image)
+        self.reset_view()
+
+    def _pyramid_dir(self):
+        return Path(self.manifest['dir'])
+
+    def _on_overview_loaded(self, proxy_image, *args):
+        if proxy_image is self._overview_image and proxy_image.loaded:
+            self.overview_rect.texture = proxy_image.image.texture
+
+    def _fit_scale(self):
+        """Scale at which the whole image fits in the widget"""
+        if not self.manifest or self.width <= 0 or self.height <= 0:
+            return 1.0
+        return min(self.width / self.manifest['width'], self.height / self.manifest['height'])
+
+    def reset_view(self):
+        """Fit the whole image in the viewport"""
+        self.scale = self._fit_scale()
+        self._clamp_view()
+        self._trigger_update()
+
+    def _on_layout(self, *args):
+        self.bg_rect.pos = self.pos
+        self.bg_rect.size = self.size
+        if self.manifest:
+            self.scale = max(self.scale, self._fit_scale())
+            self._clamp_view()
+            self._trigger_update()
+
+    def _clamp_view(self):
+        """Keep the image inside the viewport; center it along axes where it is smaller"""
+        if not self.manifest:
+            return
+        visible_w = self.width / self.scale
+        visible_h = self.height / self.scale
+        image_w = self.manifest['width']
+        image_h = self.manifest['height']
+
+        if visible_w >= image_w:
+            self.view_x = (image_w - visible_w) / 2.0
+        else:
+            self.view_x = min(max(self.view_x, 0.0), image_w - visible_w)
+
+        if visible_h >= image_h:
+            self.view_y = (image_h - visible_h) / 2.0
+        else:
+            self.view_y = min(max(self.view_y, 0.0), image_h - visible_h)
+
+    def _to_image(self, x, y):
+        """Widget coordinates -> full-resolution image coordinates"""
+        return (self.view_x + (x - self.x) / self.scale,
+                self.view_y + (self.top - y) / self.scale)
+
+    def zoom_at(self, factor, x, y):
+        """Zoom by factor keeping the image point under (x, y) fixed"""
+        if not self.manifest:
+            return
+        image_x, image_y = self._to_image(x, y)
+        self.scale = min(max(self.scale * factor, self._fit_scale()), self.MAX_SCALE)
+        self.view_x = image_x - (x - self.x) / self.scale
+        self.view_y = image_y - (self.top - y) / self.scale
+        self._clamp_view()
+        self._trigger_update()
+
+    # Touch handling: one finger pans, two fingers pinch-zoom, double tap zooms in
+
+    def on_touch_down(self, touch):
+        if not self.collide_point(*touch.pos):
+            return super().on_touch_down(touch)
+
+        if touch.is_mouse_scrolling:
+            factor = 1.25 if touch.button == 'scrolldown' else 0.8
+            self.zoom_at(factor, *touch.pos)
+            return True
+
+        if touch.is_double_tap:
+            if self.scale >= self.MAX_SCALE * 0.99:
+                self.reset_view()
+            else:
+                self.zoom_at(2.0, *touch.pos)
+            return True
+
+        touch.grab(self)
+        self._touches[touch.uid] = touch.pos
+        return True
+
+    def on_touch_move(self, touch):
+        if touch.grab_current is not self or touch.uid not in self._touches:
+            return super().on_touch_move(touch)
+
+        if len(self._touches) == 1:
+            old_x, old_y = self._touches[touch.uid]
+            self.view_x -= (touch.x - old_x) / self.scale
+            self.view_y += (touch.y - old_y) / self.scale
+            self._touches[touch.uid] = touch.pos
+            self._clamp_view()
+            self._trigger_update()
+        elif len(self._touches) >= 2:
+            other_uid = next(uid for uid in self._touches if uid != touch.uid)
+            other_x, other_y = self._touches[other_uid]
+            old_x, old_y = self._touches[touch.uid]
+            old_distance = math.hypot(old_x - other_x, old_y - other_y)
+            new_distance = math.hypot(touch.x - other_x, touch.y - other_y)
+            self._touches[touch.uid] = touch.pos
+            if old_distance > dp(5):
+                center_x = (touch.x + other_x) / 2.0
+                center_y = (touch.y + other_y) / 2.0
+                self.zoom_at(new_distance / old_distance, center_x, center_y)
+        return True
+
+    def on_touch_up(self, touch):
+        if touch.grab_current is self:
+            touch.ungrab(self)
+            self._touches.pop(touch.uid, None)
+            return True
+        return super().on_touch_up(touch)
+
+    # Tile management
+
+    def _choose_level(self):
+        """Coarsest pyramid level that still has at least one image pixel per screen pixel"""
+        num_levels = len(self.manifest['levels'])
+        level = int(math.floor(math.log2(1.0 / self.scale))) if self.scale < 1.0 else 0
+        return min(max(level, 0), num_levels - 1)
+
+    def _update_tiles(self, *args):
+        """Load tiles for the viewport at the current zoom level and drop all others"""
+        if not self.manifest or self.width <= 0 or self.height <= 0:
+            return
+
+        image_w = self.manifest['width']
+        image_h = self.manifest['height']
+        tile_size = self.manifest['tile_size']
+
+        # Overview covers the whole image rectangle
+        self.overview_rect.pos = (self.x - self.view_x * self.scale,
+                                  self.top - (image_h - self.view_y) * self.scale)
+        self.overview_rect.size = (image_w * self.scale, image_h * self.scale)
+
+        level = self._choose_level()
+        level_factor = 2 ** level  # Full-resolution pixels per level pixel
+        level_w, level_h = self.manifest['levels'][level]
+        tile_span = tile_size * level_factor
+
+        first_x = max(0, int(self.view_x // tile_span))
+        first_y = max(0, int(self.view_y // tile_span))
+        last_x = min(int(math.ceil(level_w / tile_size)) - 1,
+                     int((self.view_x + self.width / self.scale) // tile_span))
+        last_y = min(int(math.ceil(level_h / tile_size)) - 1,
+                     int((self.view_y + self.height / self.scale) // tile_span))
+
+        wanted = set()
+        for tile_y in range(first_y, last_y + 1):
+            for tile_x in range(first_x, last_x + 1):
+                key = (level, tile_x, tile_y)
+                wanted.add(key)
+                if key not in self._tiles:
+                    self._load_tile(key)
+                self._position_tile(key, tile_span)
+
+        # Release everything outside the viewport/level - keeps memory bounded
+        for key in [key for key in self._tiles if key not in wanted]:
+            rect, proxy_image = self._tiles.pop(key)
+            proxy_image.unbind(on_load=self._on_tile_loaded)
+            # Tiles still loading were never added to the group
+            if rect in self.tile_group.children:
+                self.tile_group.remove(rect)
+
+    def _load_tile(self, key):
+        """Start asynchronous decode of a tile"""
+        level, tile_x, tile_y = key
+        rect = Rectangle(pos=(0, 0), size=(0, 0))
+        proxy_image = Loader.image(
+            str(get_tile_path(self._pyramid_dir(), level, tile_x, tile_y)), nocache=True
+        )
+        proxy_image.tile_key = key
+        proxy_image.bind(on_load=self._on_tile_loaded)
+        self._tiles[key] = [rect, proxy_image]
+        self._on_tile_loaded(proxy_image)
+
+    def _on_tile_loaded(self, proxy_image, *args):
+        """Attach texture once the Loader has decoded the tile"""
+        entry = self._tiles.get(getattr(proxy_image, 'tile_key', None))
+        if not entry or entry[1] is not proxy_image or not proxy_image.loaded:
+            return
+        rect = entry[0]
+        rect.texture = proxy_image.image.texture
+        if rect not in self.tile_group.children:
+            self.tile_group.add(rect)
+
+    def _position_tile(self, key, tile_span):
+        """Place a tile rectangle in widget coordinates"""
+        level, tile_x, tile_y = key
+        rect = self._tiles[key][0]
+        level_w, level_h = self.manifest['levels'][level]
+        tile_size = self.manifest['tile_size']
+        level_factor = 2 ** level
+
+        width = min(tile_size, level_w - tile_x * tile_size) * level_factor
+        height = min(tile_size, level_h - tile_y * tile_size) * level_factor
+        image_x = tile_x * tile_span
+        image_y = tile_y * tile_span
+
+        rect.pos = (self.x + (image_x - self.view_x) * self.scale,
+                    self.top - (image_y + height - self.view_y) * self.scale)
+        rect.size = (width * self.scale, height * self.scale)
+
+    def _release_tiles(self):
+        """Drop all tile textures"""
+        for rect, proxy_image in self._tiles.values():
+            proxy_image.unbind(on_load=self._on_tile_loaded)
+        self._tiles = {}
+        self.tile_group.clear()
+        self.overview_rect.texture = None
+        self._overview_image = None
+
+    def release(self):
+        """Free all textures (call when the viewer is closed)"""
+        self._release_tiles()
+        self.manifest = None
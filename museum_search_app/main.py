@@ -11,6 +11,8 @@ from screens.detail_screen import DetailScreen
 from screens.saved_screen import SavedScreen
 from components.bottom_nav import BottomNavigation
 from utils.data_manager import DataManager
+from utils.search_stream import SearchStream
+from utils.nav_history import HistoryEntry
 from sara_api import SaraAPI
 
 # Set window size to phone dimensions for testing
@@ -22,49 +24,107 @@ class SearchScreen(Screen):
         self.name = "search"
         self.data_manager = DataManager()
         self.sara_api = sara_api if sara_api else SaraAPI()
+        self.search_stream = None  # Running SearchStream, cancelled by the next search
+        self.search_total = 0
         self.home_screen = HomeScreen()
         self.home_screen.sara_api = self.sara_api  # Share the API instance
         self.home_screen.search_bar.set_search_callback(self.perform_search)
         if hasattr(self.home_screen, 'carousel'):
             def search_recent_wrapper(search_item):
+                # Stored copy first (stale-while-revalidate), a new search when there is none
+                self.cancel_search()
+                if self.home_screen.open_stored_item(search_item):
+                    return
                 obj_number = search_item.get('objectNumber', '')
                 if obj_number:
                     self.perform_search(obj_number)
             self.home_screen.carousel.item_click_callback = search_recent_wrapper
         self.add_widget(self.home_screen)
     
+    def cancel_search(self):
+        """Cancel the running search, if any, and take down its loading view"""
+        if self.search_stream is not None:
+            self.search_stream.cancel()
+            self.search_stream = None
+        self.home_screen._hide_loading()
+    
     def perform_search(self, query):
         if not query or not query.strip():
             return
         print(f"SearchScreen: Searching for: {query}")
-        try:
-            results = self.sara_api.search_objects_by_number(query)
-            if results:
-                print(f"SearchScreen: Found {len(results)} results")
-                self.data_manager.add_to_recent_searches(results[0])
-                self.home_screen.update_recent_carousel()
-                
-                # Get app instance to use navigation with history
-                from kivy.app import App
-                app = App.get_running_app()
-                
-                if len(results) == 1:
-                    detail_screen = self.manager.get_screen('detail')
-                    detail_screen.show_object(results[0])
-                    app._navigate_to('detail')
-                else:
-                    results_screen = self.manager.get_screen('results')
-                    results_screen.show_results(results, query)
-                    app._navigate_to('results')
-            else:
-                print("SearchScreen: No results found")
-                from kivy.app import App
-                app = App.get_running_app()
-                results_screen = self.manager.get_screen('results')
-                results_screen.show_results([], query)
-                app._navigate_to('results')
-        except Exception as e:
-            print(f"SearchScreen: Search error: {e}")
+        # A new search replaces the running one - its records and images are never shown
+        self.cancel_search()
+        self.home_screen._show_loading()
+        
+        # Records are pushed to the UI one by one as they are parsed; images follow
+        self.search_total = 0
+        self.search_stream = SearchStream(
+            self.sara_api, query,
+            on_start=lambda total: self._on_search_start(query, total),
+            on_record=lambda obj, index: self._on_search_record(query, obj, index),
+            on_images=self._on_search_images,
+            on_done=lambda results: self._on_search_done(query, results)
+        ).start()
+    
+    def _on_search_start(self, query, total):
+        """Response received - open the results screen right away for multiple hits"""
+        from kivy.app import App
+        app = App.get_running_app()
+        self.search_total = total
+        self.home_screen._hide_loading()
+        
+        if total == 0:
+            print("SearchScreen: No results found")
+            results_screen = self.manager.get_screen('results')
+            results_screen.show_results([], query)
+            app._navigate_to('results')
+        elif total > 1:
+            print(f"SearchScreen: Found {total} results")
+            results_screen = self.manager.get_screen('results')
+            results_screen.start_results(query)
+            app._navigate_to('results')
+    
+    def _on_search_record(self, query, obj, index):
+        """A parsed record arrived - show it as soon as possible"""
+        from kivy.app import App
+        app = App.get_running_app()
+        
+        if index == 0:
+            # The carousel follows through the DataManager change event
+            self.data_manager.add_to_recent_searches(obj)
+        
+        if self.search_total == 1:
+            detail_screen = self.manager.get_screen('detail')
+            detail_screen.show_object(obj)
+            app._navigate_to('detail')
+        else:
+            self.manager.get_screen('results').append_result(obj)
+    
+    def _on_search_images(self, obj, index):
+        """Images of a shown record were downloaded - refresh where it is displayed"""
+        if index == 0 and obj.get('primaryImage'):
+            image_refs = obj.get('imageRefs') or []
+            self.data_manager.update_image_path(
+                image_refs[0] if image_refs else '', 'primaryImage', obj['primaryImage'],
+                priref=obj.get('priref', '')
+            )
+        if index == 0:
+            # The recent search keeps the object with its images for the next tap
+            self.data_manager.update_recent_object(obj)
+        
+        self.manager.get_screen('results').refresh_result(obj)
+        
+        # Only the image section is rebound - the user may already be reading the page
+        self.manager.get_screen('detail').update_images(obj)
+    
+    def _on_search_done(self, query, results):
+        """All records processed"""
+        if self.search_total > 0 and not results:
+            # Records could not be parsed - show the no results message
+            from kivy.app import App
+            results_screen = self.manager.get_screen('results')
+            results_screen.show_results([], query)
+            App.get_running_app()._navigate_to('results')
 
 class SaraMuseumApp(App):
     def __init__(self, **kwargs):
@@ -72,7 +132,7 @@ class SaraMuseumApp(App):
         self.title = "DGB Assistent"
         self.sara_api = SaraAPI()  # Create shared instance
         self.connection_ready = False
-        self.screen_history = []  # Track navigation history
+        self.screen_history = []  # Navigation history - HistoryEntry with a snapshot of each screen
         self._setup_android_ui()
         self._warm_up_connection()
     
@@ -124,6 +184,35 @@ class SaraMuseumApp(App):
         
         threading.Thread(target=warm_up, daemon=True).start()
     
+    def on_start(self):
+        """Keep the image cache within the storage quota (offline packs count toward it), start background refresh"""
+        import threading
+        from utils.image_cache import enforce_storage_quota
+        from utils.offline_packs import OfflinePackManager
+        from utils.object_refresh import SavedItemRefresher
+        
+        def trim():
+            try:
+                enforce_storage_quota(OfflinePackManager().get_pinned_bytes())
+            except Exception as e:
+                print(f"App: Cache trim failed: {e}")
+        
+        threading.Thread(target=trim, daemon=True).start()
+        
+        # Saved items are re-checked against SARA when the app is idle on Wi-Fi
+        SavedItemRefresher().start(self.sara_api)
+    
+    def on_pause(self):
+        """Write pending data changes before Android may kill the paused app"""
+        from utils.object_refresh import SavedItemRefresher
+        SavedItemRefresher().interrupt()
+        DataManager().flush()
+        return True
+    
+    def on_stop(self):
+        """Write pending data changes before exit"""
+        DataManager().flush()
+    
     def _show_connection_status(self):
         """Show connection status indicator"""
         if hasattr(self, 'home_screen'):
@@ -176,13 +265,36 @@ class SaraMuseumApp(App):
         main_container.add_widget(self.bottom_nav)
         return main_container
     
+    def show_stored_object(self, obj):
+        """Open a stored object in the detail screen; it is refreshed from SARA in the background"""
+        self.screen_manager.get_screen('detail').show_stored_object(obj)
+        self._navigate_to('detail')
+    
+    def _capture_current_screen(self):
+        """Store a snapshot of the screen being left in its history entry"""
+        if not self.screen_history:
+            return
+        entry = self.screen_history[-1]
+        screen = self.screen_manager.get_screen(entry.screen_name)
+        get_snapshot = getattr(screen, 'get_snapshot', None)
+        if get_snapshot:
+            self.screen_history[-1] = entry._replace(snapshot=get_snapshot())
+
     def _go_back(self):
-        """Go back to previous screen in history"""
+        """Go back to previous screen in history, restored from its snapshot"""
         if len(self.screen_history) > 1:
             # Remove current screen
             self.screen_history.pop()
             # Get previous screen
-            previous_screen = self.screen_history[-1]
+            entry = self.screen_history[-1]
+            previous_screen = entry.screen_name
+
+            # Restore before switching, so the transition shows the old state
+            screen = self.screen_manager.get_screen(previous_screen)
+            restore_snapshot = getattr(screen, 'restore_snapshot', None)
+            if entry.snapshot is not None and restore_snapshot:
+                restore_snapshot(entry.snapshot)
+
             # Navigate without adding to history
             self.screen_manager.current = previous_screen
             
@@ -199,9 +311,10 @@ class SaraMuseumApp(App):
             self._navigate_to('search')
     
     def _navigate_to(self, screen_name):
-        # Add to history if it's a new screen
-        if not self.screen_history or self.screen_history[-1] != screen_name:
-            self.screen_history.append(screen_name)
+        # Add to history if it's a new screen; the screen being left keeps a snapshot
+        self._capture_current_screen()
+        if not self.screen_history or self.screen_history[-1].screen_name != screen_name:
+            self.screen_history.append(HistoryEntry(screen_name))
         
         self.screen_manager.current = screen_name
         
@@ -210,14 +323,7 @@ class SaraMuseumApp(App):
             self.bottom_nav.set_active_button('home')
         elif screen_name == 'saved':
             self.bottom_nav.set_active_button('saved')
-        
-        # Refresh saved screen if navigating to it
-        if screen_name == 'saved':
-            saved_screen_wrapper = self.screen_manager.get_screen('saved')
-            if saved_screen_wrapper.children:
-                saved_screen = saved_screen_wrapper.children[0]
-                if hasattr(saved_screen, 'refresh_saved_items'):
-                    saved_screen.refresh_saved_items()
+        # Saved screen keeps itself up to date through DataManager change notifications
 
 if __name__ == "__main__":
     SaraMuseumApp().run()
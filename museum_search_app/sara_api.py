@@ -6,11 +6,12 @@ Håndterer kommunikation med SARA database API
 import requests
 import json
 import xml.etree.ElementTree as ET
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from requests.auth import HTTPBasicAuth
 import urllib.request
 import base64
 from utils.android_logger import android_logger
+from utils.network_monitor import NetworkMonitor
 
 
 class SaraAPI:
@@ -62,6 +63,31 @@ class SaraAPI:
             'reproduction.identifier_URL',
             'reproduction.publish_on_website'
         ]
+        
+        # Måling af båndbredde og datasparetilstand
+        self.network_monitor = NetworkMonitor()
+        # Kantlængde (px) for thumbnail-varianten af reproduktioner
+        self.thumbnail_size = 300
+    
+    def _get(self, params: Dict, timeout: int = 30):
+        """
+        GET mod SARA API med måling af overført datamængde
+        
+        Args:
+            params: Query parametre
+            timeout: Timeout i sekunder
+        
+        Returns:
+            requests.Response
+        """
+        started_at = self.network_monitor.start_timer()
+        response = self.session.get(
+            self.base_url,
+            params=params,
+            timeout=timeout
+        )
+        self.network_monitor.record_transfer(len(response.content), started_at)
+        return response
     
     def search_objects_by_number(self, object_number: str, limit: int = 20) -> List[Dict]:
         """
@@ -74,6 +100,29 @@ class SaraAPI:
         Returns:
             Liste af objekt ordbøger med detaljer
         """
+        objects = []
+        for record in self.fetch_records_by_number(object_number, limit):
+            try:
+                obj_data = self._parse_object_record(record)
+                if obj_data:
+                    objects.append(obj_data)
+            except Exception as e:
+                print(f"Uventet fejl i søgning: {e}")
+        return objects
+    
+    def fetch_records_by_number(self, object_number: str, limit: int = 20) -> list:
+        """
+        Hent rå XML records for en objektnummer-søgning (uden parsing og billeder)
+        
+        Bruges af den streamende søgning, som parser og viser et record ad gangen.
+        
+        Args:
+            object_number: Objektnummer
+            limit: Maksimum antal resultater
+        
+        Returns:
+            Liste af XML record elementer (tom ved fejl eller ingen hits)
+        """
         try:
             # Søg i SARA databasen efter objektnummer (samme som sara_uploader.py)
             params = {
@@ -85,11 +134,7 @@ class SaraAPI:
                 'fields': ','.join(self.search_fields)
             }
             
-            response = self.session.get(
-                self.base_url,
-                params=params,
-                timeout=30
-            )
+            response = self._get(params, timeout=30)
             response.raise_for_status()
             
             # Parse XML response
@@ -106,16 +151,7 @@ class SaraAPI:
             if hits == 0:
                 return []
             
-            # Parse objekter fra XML
-            objects = []
-            records = root.findall('.//record')
-            
-            for record in records:
-                obj_data = self._parse_object_record(record)
-                if obj_data:
-                    objects.append(obj_data)
-            
-            return objects
+            return root.findall('.//record')
             
         except requests.RequestException as e:
             print(f"SARA API fejl: {e}")
@@ -127,6 +163,29 @@ class SaraAPI:
             print(f"Uventet fejl i søgning: {e}")
             return []
     
+    def parse_search_record(self, record) -> Dict:
+        """Parse et søge-record uden at hente billeder (hentes bagefter med attach_images)"""
+        return self._parse_object_record(record, download_images=False)
+    
+    def attach_images(self, obj_data: Dict, cancel_token=None) -> Dict:
+        """
+        Hent reproduktioner for et objekt parset uden billeder og opdater dets billedfelter
+        
+        Args:
+            obj_data: Objekt fra parse_search_record (opdateres på stedet)
+            cancel_token: Valgfri CancelToken - resterende downloads springes over,
+                og objektet efterlades uændret, hvis søgningen annulleres
+        
+        Returns:
+            Samme objekt ordbog
+        """
+        image_refs = obj_data.get('imageRefs', [])
+        images, deferred_refs = self._extract_images(image_refs, cancel_token)
+        if cancel_token is not None and cancel_token.cancelled:
+            return obj_data
+        obj_data.update(self._image_fields(images, image_refs, deferred_refs))
+        return obj_data
+    
     def search_objects(self, query: str, limit: int = 20) -> List[Dict]:
         """
         Søg efter objekter i SARA databasen (generel søgning)
@@ -156,11 +215,7 @@ class SaraAPI:
                     'fields': ','.join(self.search_fields)
                 }
                 
-                response = self.session.get(
-                    self.base_url,
-                    params=params,
-                    timeout=30
-                )
+                response = self._get(params, timeout=30)
                 response.raise_for_status()
                 
                 # Parse XML response
@@ -194,12 +249,13 @@ class SaraAPI:
         
         return []
     
-    def get_object_detail(self, priref: str) -> Optional[Dict]:
+    def get_object_detail(self, priref: str, download_images: bool = True) -> Optional[Dict]:
         """
         Hent detaljerede oplysninger om et specifikt objekt
         
         Args:
             priref: SARA objekt ID
+            download_images: Download reproduktioner under parsing (ellers kun referencer)
         
         Returns:
             Ordbog med objekt detaljer eller None hvis ikke fundet
@@ -214,18 +270,14 @@ class SaraAPI:
                 'fields': ','.join(self.search_fields)
             }
             
-            response = self.session.get(
-                self.base_url,
-                params=params,
-                timeout=30
-            )
+            response = self._get(params, timeout=30)
             response.raise_for_status()
             
             root = ET.fromstring(response.text)
             record = root.find('.//record')
             
             if record is not None:
-                return self._parse_object_record(record, detailed=True)
+                return self._parse_object_record(record, detailed=True, download_images=download_images)
             
             return None
             
@@ -233,13 +285,54 @@ class SaraAPI:
             print(f"Fejl ved hentning af objekt {priref}: {e}")
             return None
     
-    def _parse_object_record(self, record, detailed: bool = False) -> Dict:
+    def get_object_details(self, prirefs: List[str], download_images: bool = False) -> Dict[str, Dict]:
+        """
+        Hent detaljerede oplysninger om flere objekter i én forespørgsel (priref=1 or priref=2 ...)
+        
+        Args:
+            prirefs: SARA objekt ID'er (holdes under ca. 50 pr. kald, så URL'en ikke bliver for lang)
+            download_images: Download reproduktioner under parsing (ellers kun referencer)
+        
+        Returns:
+            Ordbog priref -> objekt detaljer; objekter som ikke blev fundet mangler
+        
+        Raises:
+            requests.RequestException / ET.ParseError ved fejl, så kalderen kan prøve igen senere
+        """
+        if not prirefs:
+            return {}
+        params = {
+            'command': 'search',
+            'database': 'collection',
+            'search': ' or '.join(f'priref={priref}' for priref in prirefs),
+            'output': 'xml',
+            'limit': len(prirefs),
+            'fields': ','.join(self.search_fields)
+        }
+        
+        response = self._get(params, timeout=60)
+        response.raise_for_status()
+        
+        root = ET.fromstring(response.text)
+        objects = {}
+        for record in root.findall('.//record'):
+            try:
+                obj_data = self._parse_object_record(record, detailed=True, download_images=download_images)
+            except Exception as e:
+                print(f"Fejl ved parsing af objekt {record.get('priref', '')}: {e}")
+                continue
+            if obj_data.get('priref'):
+                objects[obj_data['priref']] = obj_data
+        return objects
+    
+    def _parse_object_record(self, record, detailed: bool = False, download_images: bool = True) -> Dict:
         """
         Parse et objekt record fra SARA XML
         
         Args:
             record: XML element med objekt data
             detailed: Om der skal hentes detaljerede oplysninger
+            download_images: Download reproduktioner (ellers udskydes alle til deferredImageRefs)
         
         Returns:
             Ordbog med objekt oplysninger
@@ -331,14 +424,12 @@ class SaraAPI:
         })
         
         # Billeder fra reproductions
-        images = self._extract_images(record)
-        obj_data.update({
-            'images': images,  # Tilføj images listen også
-            'primaryImage': images[0] if images else '',
-            'primaryImageSmall': images[0] if images else '',  # SARA har ikke separate small images
-            'additionalImages': images[1:] if len(images) > 1 else [],
-            'hasImage': len(images) > 0,
-        })
+        image_refs = self._extract_image_references(record)
+        if download_images:
+            images, deferred_refs = self._extract_images(image_refs)
+        else:
+            images, deferred_refs = [], list(image_refs)
+        obj_data.update(self._image_fields(images, image_refs, deferred_refs))
         
         # SARA specifikke felter
         obj_data.update({
@@ -361,6 +452,18 @@ class SaraAPI:
         
         return obj_data
     
+    def _image_fields(self, images: List[str], image_refs: List[str], deferred_refs: List[str]) -> Dict:
+        """Billedfelter for et objekt ud fra hentede billeder og referencer"""
+        return {
+            'images': images,  # Tilføj images listen også
+            'imageRefs': image_refs,  # Stabile reproduktionsreferencer
+            'deferredImageRefs': deferred_refs,  # Ikke hentet endnu (datasparetilstand)
+            'primaryImage': images[0] if images else '',
+            'primaryImageSmall': images[0] if images else '',  # SARA har ikke separate small images
+            'additionalImages': images[1:] if len(images) > 1 else [],
+            'hasImage': len(images) > 0,
+        }
+    
     def _extract_dating(self, record) -> str:
         """
         Udtræk datering fra SARA record
@@ -601,18 +704,17 @@ class SaraAPI:
         full_description = "\n\n".join(descriptions) if descriptions else "Ingen beskrivelse tilgængelig"
         return full_description
 
-    def _extract_images(self, record) -> List[str]:
+    def _extract_image_references(self, record) -> List[str]:
         """
-        Udtræk billede URLs fra SARA record med SARA API getcontent format
-        Download billeder da AsyncImage ikke kan håndtere Basic Auth
+        Udtræk publicerede reproduktionsreferencer (filnavne) fra SARA record
         
         Args:
             record: XML record element
         
         Returns:
-            Liste af lokale billedstier (downloadede med auth)
+            Liste af reproduction.reference filnavne (jpg/jpeg/png)
         """
-        images = []
+        image_refs = []
         
         # Find Reproduction elementer
         reproductions = record.findall('.//Reproduction')
@@ -636,18 +738,9 @@ class SaraAPI:
                     print(f"DEBUG _extract_images: No publish_on_website element, defaulting to published")
                 
                 if is_published:
-                    # SARA getcontent API URL format - download med auth
                     filename_lower = filename.lower()
                     if filename_lower.endswith('.jpg') or filename_lower.endswith('.jpeg') or filename_lower.endswith('.png'):
-                        image_url = f"https://sara-api.adlibhosting.com/SARA-011-DGB/wwwopac.ashx?command=getcontent&server=images&value={filename}"
-                        print(f"DEBUG _extract_images: Downloading from {image_url}")
-                        # Download med authentication og returner lokal filsti
-                        local_path = self.download_image_with_auth(image_url)
-                        if local_path:
-                            print(f"DEBUG _extract_images: SUCCESS - local path: {local_path}")
-                            images.append(local_path)
-                        else:
-                            print(f"DEBUG _extract_images: FAILED to download")
+                        image_refs.append(filename)
                     else:
                         print(f"DEBUG _extract_images: Skipping (not jpg/jpeg/png): {filename}")
                 else:
@@ -655,16 +748,87 @@ class SaraAPI:
             else:
                 print(f"DEBUG _extract_images: Reproduction #{idx}: No filename found")
         
-        print(f"DEBUG _extract_images: Total images downloaded: {len(images)}")
-        return images
+        return image_refs
     
-    def download_image_with_auth(self, image_url: str) -> Optional[str]:
+    def _extract_images(self, image_refs: List[str], cancel_token=None) -> Tuple[List[str], List[str]]:
+        """
+        Download reproduktioner med SARA API getcontent format
+        Download billeder da AsyncImage ikke kan håndtere Basic Auth
+        
+        I datasparetilstand hentes kun thumbnail-varianten af det primære billede,
+        de øvrige reproduktioner udskydes til brugeren trykker på dem.
+        
+        Args:
+            image_refs: Reproduktionsreferencer fra _extract_image_references
+            cancel_token: Valgfri CancelToken - stop før næste download når annulleret
+        
+        Returns:
+            (lokale billedstier, referencer der ikke er hentet endnu)
+        """
+        images = []
+        deferred_refs = []
+        saver_mode = self.network_monitor.is_saver_mode()
+        
+        for idx, filename in enumerate(image_refs):
+            if cancel_token is not None and cancel_token.cancelled:
+                print("DEBUG _extract_images: Cancelled")
+                break
+            
+            if saver_mode and idx > 0:
+                deferred_refs.append(filename)
+                continue
+            
+            # Download med authentication og returner lokal filsti
+            local_path = self.download_image_by_reference(filename, thumbnail=saver_mode)
+            if local_path:
+                print(f"DEBUG _extract_images: SUCCESS - local path: {local_path}")
+                images.append(local_path)
+            else:
+                print(f"DEBUG _extract_images: FAILED to download")
+        
+        print(f"DEBUG _extract_images: Total images downloaded: {len(images)} (deferred: {len(deferred_refs)})")
+        return images, deferred_refs
+    
+    def build_image_url(self, reference: str, thumbnail: bool = False) -> str:
+        """
+        Byg getcontent URL for en reproduktion
+        
+        Args:
+            reference: reproduction.reference filnavn
+            thumbnail: Hent nedskaleret variant i stedet for masterfilen
+        
+        Returns:
+            URL til billedet
+        """
+        image_url = f"https://sara-api.adlibhosting.com/SARA-011-DGB/wwwopac.ashx?command=getcontent&server=images&value={reference}"
+        if thumbnail:
+            image_url += f"&width={self.thumbnail_size}&height={self.thumbnail_size}&imageformat=jpg"
+        return image_url
+    
+    def download_image_by_reference(self, reference: str, thumbnail: bool = False, cache_dir=None) -> Optional[str]:
+        """
+        Download en reproduktion ud fra dens reference
+        
+        Args:
+            reference: reproduction.reference filnavn
+            thumbnail: Hent nedskaleret variant i stedet for masterfilen
+            cache_dir: Mappe filen gemmes i (default: temp_images cachen)
+        
+        Returns:
+            Lokal filsti til downloaded billede, eller None ved fejl
+        """
+        image_url = self.build_image_url(reference, thumbnail=thumbnail)
+        print(f"DEBUG _extract_images: Downloading from {image_url}")
+        return self.download_image_with_auth(image_url, cache_dir=cache_dir)
+    
+    def download_image_with_auth(self, image_url: str, cache_dir=None) -> Optional[str]:
         """
         Download billede med authentication og returner lokal filsti
         Android-sikker version med app data directory
         
         Args:
             image_url: URL til billede der skal downloades
+            cache_dir: Mappe filen gemmes i (default: temp_images cachen)
         
         Returns:
             Lokal filsti til downloaded billede, eller None ved fejl
@@ -672,7 +836,7 @@ class SaraAPI:
         import os
         import hashlib
         from pathlib import Path
-        from kivy.app import App
+        from utils.image_cache import get_cache_dir
         
         try:
             # Log Android miljø info (kun første gang)
@@ -683,23 +847,19 @@ class SaraAPI:
             android_logger.log_image_download_start(image_url)
             
             # Brug appens sikre data directory (virker på Android)
-            app_instance = App.get_running_app()
-            if app_instance:
-                base_dir = Path(app_instance.user_data_dir)
+            if cache_dir is None:
+                cache_dir = get_cache_dir()
             else:
-                # Fallback for test uden app
-                base_dir = Path.cwd()
-            
-            cache_dir = base_dir / "temp_images"
-            cache_dir.mkdir(parents=True, exist_ok=True)
+                cache_dir = Path(cache_dir)
+                cache_dir.mkdir(parents=True, exist_ok=True)
             
             # Lav sikkert filnavn baseret på URL hash
             url_hash = hashlib.md5(image_url.encode()).hexdigest()[:12]
-            filename_from_url = os.path.basename(image_url.split('value=')[1]) if 'value=' in image_url else 'image.jpg'
+            filename_from_url = os.path.basename(image_url.split('value=')[1].split('&')[0]) if 'value=' in image_url else 'image.jpg'
             
             # Sikker extension
             ext = Path(filename_from_url).suffix.lower()
-            if ext not in ['.jpg', '.jpeg', '.png', '.webp']:
+            if ext not in ['.jpg', '.jpeg', '.png', '.webp'] or 'imageformat=jpg' in image_url:
                 ext = '.jpg'
             
             safe_filename = f"{url_hash}{ext}"
@@ -740,8 +900,10 @@ class SaraAPI:
             
             # Download billedet med SSL context
             android_logger.log("DEBUG", f"Starter download med SSL context...")
+            started_at = self.network_monitor.start_timer()
             response = urllib.request.urlopen(request, timeout=15, context=ssl_context)
             image_data = response.read()
+            self.network_monitor.record_transfer(len(image_data), started_at)
             
             # Gem til lokal fil med atomisk skrivning
             temp_path = local_path.with_suffix(local_path.suffix + '.part')
@@ -842,11 +1004,7 @@ class SaraAPI:
                 'fields': ','.join(self.search_fields)
             }
             
-            response = self.session.get(
-                self.base_url,
-                params=params,
-                timeout=30
-            )
+            response = self._get(params, timeout=30)
             response.raise_for_status()
             
             root = ET.fromstring(response.text)
@@ -882,11 +1040,7 @@ class SaraAPI:
                 'fields': ','.join(self.search_fields)
             }
             
-            response = self.session.get(
-                self.base_url,
-                params=params,
-                timeout=30
-            )
+            response = self._get(params, timeout=30)
             response.raise_for_status()
             
             root = ET.fromstring(response.text)
@@ -961,11 +1115,7 @@ class SaraAPI:
                 'fields': ','.join(self.search_fields)
             }
             
-            response = self.session.get(
-                self.base_url,
-                params=params,
-                timeout=10
-            )
+            response = self._get(params, timeout=10)
             
             return response.status_code == 200
             
@@ -12,8 +12,15 @@ from kivy.uix.screenmanager import Screen
 from kivy.uix.widget import Widget
 from kivy.uix.image import AsyncImage
 from kivy.graphics import Color, Rectangle, RoundedRectangle
-from kivy.metrics import dp
+from kivy.metrics import dp, sp
 from kivy.clock import Clock
+from kivy.loader import Loader
+from kivy.animation import Animation
+
+from utils.data_manager import DataManager
+from utils.detail_view_model import prepare_detail_view_model, estimate_info_card_heights
+from utils.nav_history import DetailSnapshot
+from utils.object_refresh import refresh_object
 
 
 class DetailScreen(Screen):
@@ -27,6 +34,17 @@ class DetailScreen(Screen):
         self.all_images = []  # Store all available images
         self.main_image_widget = None  # Reference to the main image widget
         self.image_counter_widget = None  # Reference to the image counter
+        self.deferred_refs = {}  # Image index -> reproduction reference not downloaded yet
+        self.result_list = []  # Results the current object was opened from (for previous/next)
+        self.result_index = None
+        self._prefetched_images = {}  # Source path -> pre-decoded ProxyImage kept alive
+        self._swipe_touch = None
+        self.main_layout = None  # Layout template, built on first show_object
+        self.view_model = None  # DetailViewModel of the shown object
+        
+        # Save state follows DataManager change events (saves/removals made on any screen)
+        self.data_manager = DataManager()
+        self.data_manager.add_listener(self._on_data_changed)
         
     def safe_set_image_source(self, image_widget, local_path):
         """Sæt billede source sikkert på UI-tråden (Android-compatible)"""
@@ -36,17 +54,278 @@ class DetailScreen(Screen):
                 image_widget.reload()
         Clock.schedule_once(_apply_source, 0)
         
-    def show_object(self, obj):
-        """Display full details for an object"""
+    def show_object(self, obj, result_list=None, result_index=None):
+        """Display full details for an object
+        
+        result_list/result_index give the results the object was opened from,
+        which enables previous/next navigation between them.
+        """
         self.current_object = obj
-        self.clear_widgets()
-        self.build_detail_screen()
+        self.result_list = result_list or []
+        self.result_index = result_index if self.result_list else None
+        if self.main_layout is None:
+            self.build_detail_screen()
+        Animation.cancel_all(self.updated_label)
+        self.updated_label.opacity = 0
+        
+        # Formatting happens on a worker thread; until the model is applied the
+        # previous object's content is hidden
+        self._bind_header()
+        self.all_images = []
+        self.content_layout.opacity = 0
+        prepare_detail_view_model(obj, self._on_view_model_ready)
+    
+    def show_stored_object(self, obj, result_list=None, result_index=None):
+        """Show a stored copy right away and refresh it from SARA in the background"""
+        self.show_object(obj, result_list, result_index)
+        from kivy.app import App
+        refresh_object(App.get_running_app().sara_api, obj, self._on_object_refreshed)
+    
+    def _on_object_refreshed(self, obj, changes):
+        """Fresh record compared (UI thread) - apply and store the changed fields"""
+        if not changes:
+            return
+        print(f"DetailScreen: {obj.get('priref', '')} changed in SARA: {', '.join(sorted(changes))}")
+        obj.update(changes)
+        self.data_manager.store_refreshed_object(obj)
+        if obj is self.current_object:
+            prepare_detail_view_model(obj, self._on_refreshed_view_model_ready)
+    
+    def _on_refreshed_view_model_ready(self, obj, model):
+        """Rebind the refreshed object where the user is - same scroll position and image"""
+        if obj is not self.current_object or model is None:
+            return
+        scroll_y = self.scroll.scroll_y
+        image_index = self.current_image_index
+        self.view_model = model
+        self.bind_object()
+        if 0 < image_index < len(self.all_images):
+            self.switch_to_image(image_index)
+        self.scroll.scroll_y = scroll_y
+        
+        # Subtle hint that the shown data was updated
+        Animation.cancel_all(self.updated_label)
+        self.updated_label.opacity = 0
+        (Animation(opacity=1, duration=0.3) + Animation(duration=2) +
+         Animation(opacity=0, duration=0.8)).start(self.updated_label)
+    
+    def update_images(self, obj):
+        """The shown object's images were downloaded - rebind only the image section"""
+        if obj is self.current_object:
+            prepare_detail_view_model(obj, self._on_images_view_model_ready)
+    
+    def _on_images_view_model_ready(self, obj, model):
+        """Rebind the image section where the user is - same scroll position and image"""
+        if obj is not self.current_object or model is None:
+            return
+        if not self._view_model_shown():
+            self._apply_view_model(model)  # Still formatting the first model - show this one instead
+            return
+        scroll_y = self.scroll.scroll_y
+        image_index = self.current_image_index
+        self.view_model = model
+        image_sections = (self.image_container, self.thumb_scroll, self.no_image_container)
+        other_sections = [section for section in self.content_layout.children[::-1]
+                          if section not in image_sections]
+        self._set_sections(self._bind_images_section() + other_sections)
+        if 0 < image_index < len(self.all_images):
+            self.switch_to_image(image_index)
+        self.scroll.scroll_y = scroll_y
+    
+    def _on_view_model_ready(self, obj, model):
+        """Apply a prepared display model (UI thread)"""
+        if obj is not self.current_object or model is None:
+            return  # User moved on to another object
+        if self._view_model_shown():
+            return  # A newer model (e.g. with the downloaded images) is already shown
+        self._apply_view_model(model)
+    
+    def _apply_view_model(self, model):
+        self.view_model = model
+        self.bind_object()
+        self.content_layout.opacity = 1
+        self._prefetch_adjacent_objects()
+    
+    def get_snapshot(self):
+        """Lightweight state for the navigation history (references, no copies)"""
+        return DetailSnapshot(
+            obj=self.current_object,
+            result_list=self.result_list,
+            result_index=self.result_index,
+            view_model=self.view_model if self._view_model_shown() else None,
+            image_index=self.current_image_index,
+            scroll_y=self.scroll.scroll_y if self.main_layout is not None else 1
+        )
+    
+    def _view_model_shown(self):
+        """True when the shown view model belongs to the current object"""
+        return (self.main_layout is not None and self.view_model is not None
+                and self.view_model.priref == self.current_object.get('priref', '')
+                and self.content_layout.opacity == 1)
+    
+    def restore_snapshot(self, snapshot):
+        """Show a history entry again from memory, reusing its prepared view model"""
+        if snapshot.obj is None:
+            return
+        if snapshot.obj is not self.current_object or snapshot.view_model is not self.view_model:
+            if snapshot.view_model is None:
+                # Was left before formatting finished - prepare it again
+                self.show_object(snapshot.obj, snapshot.result_list, snapshot.result_index)
+                return
+            self.current_object = snapshot.obj
+            self.result_list = snapshot.result_list or []
+            self.result_index = snapshot.result_index if self.result_list else None
+            self._bind_header()
+            self._apply_view_model(snapshot.view_model)
+        
+        if snapshot.image_index != self.current_image_index:
+            self.switch_to_image(snapshot.image_index)
+        self.scroll.scroll_y = snapshot.scroll_y
+        
+    def show_adjacent_object(self, offset):
+        """Move to the previous (-1) or next (+1) object in the result list"""
+        if self.result_index is None:
+            return
+        new_index = self.result_index + offset
+        if 0 <= new_index < len(self.result_list):
+            self.show_object(self.result_list[new_index], self.result_list, new_index)
+    
+    def on_touch_down(self, touch):
+        """Remember touches that start on the main image (swipe and tap-to-zoom)"""
+        self._swipe_touch = None
+        if self.all_images and self.main_image_widget and self.main_image_widget.parent:
+            if self.main_image_widget.collide_point(*self.main_image_widget.to_widget(*touch.pos)):
+                self._swipe_touch = touch.uid
+        return super().on_touch_down(touch)
+    
+    def on_touch_up(self, touch):
+        """Horizontal swipe over the main image moves to previous/next object, a tap opens zoom"""
+        if self._swipe_touch == touch.uid:
+            self._swipe_touch = None
+            dx = touch.x - touch.ox
+            dy = touch.y - touch.oy
+            if self.result_index is not None and abs(dx) > dp(80) and abs(dx) > 2 * abs(dy):
+                self.show_adjacent_object(-1 if dx > 0 else 1)
+                return True
+            if abs(dx) < dp(10) and abs(dy) < dp(10):
+                self.open_zoom_viewer()
+                return True
+        return super().on_touch_up(touch)
+    
+    def open_zoom_viewer(self):
+        """Open the current image in a full-screen tiled deep-zoom viewer"""
+        if not self.all_images or self.all_images[self.current_image_index] is None:
+            return
         
-    def build_detail_screen(self):
-        """Build the detailed object view"""
-        if not self.current_object:
+        from kivy.uix.modalview import ModalView
+        from components.zoom_viewer import DeepZoomViewer
+        from utils.tile_pyramid import build_pyramid_async
+        
+        local_path = self.all_images[self.current_image_index]
+        # Zoom from the master file - in data-saver mode the displayed image may be a thumbnail
+        image_refs = self.current_object.get('imageRefs', [])
+        reference = None
+        if len(image_refs) == len(self.all_images):
+            reference = image_refs[self.current_image_index]
+        
+        zoom_popup = ModalView(
+            size_hint=(1, 1),
+            auto_dismiss=True,
+            background_color=(0, 0, 0, 0.95)
+        )
+        zoom_layout = BoxLayout(orientation='vertical')
+        
+        close_button = Button(
+            text='Luk',
+            size_hint_y=None,
+            height=dp(48),
+            font_size='16sp',
+            background_color=(0.15, 0.25, 0.4, 1),
+            color=(1, 1, 1, 1)
+        )
+        close_button.bind(on_press=lambda x: zoom_popup.dismiss())
+        
+        status_label = Label(
+            text='Forbereder zoom...',
+            font_size='14sp',
+            color=(0.8, 0.8, 0.8, 1)
+        )
+        
+        zoom_layout.add_widget(close_button)
+        zoom_layout.add_widget(status_label)
+        zoom_popup.add_widget(zoom_layout)
+        
+        viewer_holder = {}
+        
+        def resolve_source():
+            if reference:
+                from kivy.app import App
+                app = App.get_running_app()
+                if app:
+                    master_path = app.sara_api.download_image_by_reference(reference)
+                    if master_path:
+                        return master_path
+            return local_path
+        
+        def on_pyramid_ready(manifest):
+            if status_label.parent is None:
+                return  # Viewer was closed while the pyramid was being built
+            if not manifest:
+                status_label.text = 'Zoom er ikke tilgængelig for dette billede'
+                return
+            zoom_layout.remove_widget(status_label)
+            viewer = DeepZoomViewer(manifest=manifest)
+            viewer_holder['viewer'] = viewer
+            zoom_layout.add_widget(viewer)
+        
+        def on_dismiss(instance):
+            viewer = viewer_holder.pop('viewer', None)
+            if viewer:
+                viewer.release()
+            zoom_layout.clear_widgets()
+        
+        zoom_popup.bind(on_dismiss=on_dismiss)
+        zoom_popup.open()
+        build_pyramid_async(resolve_source, on_pyramid_ready)
+    
+    def _prefetch_image(self, source):
+        """Start background download/decode of an image so showing it later is instant"""
+        if not source or source in self._prefetched_images:
             return
-            
+        # Loader decodes on its worker threads and caches the result under the
+        # same key AsyncImage uses, so the later widget hits the cache.
+        self._prefetched_images[source] = Loader.image(source)
+    
+    def _prefetch_neighbor_images(self, index):
+        """Pre-decode gallery images at index ±1 and ±2"""
+        for offset in (1, -1, 2, -2):
+            neighbor = index + offset
+            if 0 <= neighbor < len(self.all_images):
+                # Deferred (data-saver) images are not prefetched - that would defeat saver mode
+                self._prefetch_image(self.all_images[neighbor])
+    
+    def _prefetch_adjacent_objects(self):
+        """Preload primary images of the previous/next object in the result list"""
+        # Drop prefetches that no longer belong to this object or its neighbors
+        keep = set(self.all_images)
+        if self.result_index is not None:
+            for offset in (1, -1):
+                neighbor = self.result_index + offset
+                if 0 <= neighbor < len(self.result_list):
+                    keep.add(self.result_list[neighbor].get('primaryImage', ''))
+        self._prefetched_images = {
+            source: image for source, image in self._prefetched_images.items() if source in keep
+        }
+        
+        if self.result_index is None:
+            return
+        for offset in (1, -1):
+            neighbor = self.result_index + offset
+            if 0 <= neighbor < len(self.result_list):
+                self._prefetch_image(self.result_list[neighbor].get('primaryImage', ''))
+        
+    def build_detail_screen(self):
+        """Build the detail layout template once - objects are bound into it by bind_object()"""
         # Main container
         main_layout = BoxLayout(
             orientation="vertical",
@@ -61,7 +340,7 @@ class DetailScreen(Screen):
         main_layout.bind(size=self._update_bg, pos=self._update_bg)
         
         # Header with back button
-        header_layout = BoxLayout(
+        self.header_layout = BoxLayout(
             orientation="horizontal",
             size_hint_y=None,
             height=dp(60),
@@ -91,123 +370,206 @@ class DetailScreen(Screen):
         back_button.bind(on_press=self.go_back)
         back_button.color = [1, 1, 1, 1]  # White text
         
-        header_layout.add_widget(back_button)
+        self.header_layout.add_widget(back_button)
         
         # Add spacer to push back button to left
         header_spacer = Widget()
-        header_layout.add_widget(header_spacer)
+        self.header_layout.add_widget(header_spacer)
         
-        main_layout.add_widget(header_layout)
+        # Shown briefly when a stored object was refreshed from SARA
+        self.updated_label = Label(
+            text='Opdateret',
+            size_hint=(None, 1),
+            width=dp(80),
+            font_size='13sp',
+            color=(0.2, 0.6, 0.2, 1),
+            opacity=0
+        )
+        self.header_layout.add_widget(self.updated_label)
+        
+        # Previous/next object buttons - only shown when opened from a result list
+        self.nav_buttons = []
+        for text, offset in (('<', -1), ('>', 1)):
+            nav_button = Button(
+                text=text,
+                size_hint=(None, 1),
+                width=dp(44),
+                font_size='18sp',
+                background_color=(0, 0, 0, 0),
+                color=(0.15, 0.25, 0.4, 1)
+            )
+            nav_button.bind(on_press=lambda x, o=offset: self.show_adjacent_object(o))
+            self.nav_buttons.append((nav_button, offset))
+        
+        main_layout.add_widget(self.header_layout)
         
         # Scrollable content area
-        scroll = ScrollView()
-        content_layout = BoxLayout(
+        self.scroll = ScrollView()
+        self.content_layout = BoxLayout(
             orientation='vertical',
             spacing=dp(12),
             size_hint_y=None,
             padding=[dp(20), dp(20), dp(20), dp(20)]
         )
-        content_layout.bind(minimum_height=content_layout.setter('height'))
+        self.content_layout.bind(minimum_height=self.content_layout.setter('height'))
+        
+        # Below-the-fold cards are built/bound when scrolling brings them near the viewport.
+        # ScrollView scrolls with a transformation and leaves the content position alone,
+        # so scroll_y and the heights are what change
+        self._trigger_lazy_cards = Clock.create_trigger(self._materialize_lazy_cards, 0)
+        self.scroll.bind(scroll_y=self._trigger_lazy_cards, height=self._trigger_lazy_cards)
+        self.content_layout.bind(height=self._trigger_lazy_cards)
         
         # 1. Images section first - full width display
-        self.add_images_section(content_layout)
+        self.add_images_section()
         
         # 2. Main info card with title, number, and description together
-        self.add_main_info_card(content_layout)
+        self.add_main_info_card()
         
-        # 3. Basic info cards at the bottom (classification, dating, location, context)
-        self.add_basic_info_cards(content_layout)
+        # 3. NEW FIELDS CARDS - dedicated cards for the new API fields
+        self.add_new_fields_cards()
         
-        # 4. NEW FIELDS CARDS - dedicated cards for the new API fields
-        self.add_new_fields_cards(content_layout)
+        # 4. Save button 
+        self.add_save_button()
         
-        # 5. Save button 
-        self.add_save_button(content_layout)
-        
-        scroll.add_widget(content_layout)
-        main_layout.add_widget(scroll)
+        self.scroll.add_widget(self.content_layout)
+        main_layout.add_widget(self.scroll)
         
         self.add_widget(main_layout)
+        self.main_layout = main_layout
+    
+    def bind_object(self):
+        """Apply the current view model to the template - only property updates, no new widgets"""
+        if not self.current_object or self.view_model is None:
+            return
+        
+        # Sections in display order; optional ones are left out when empty
+        sections = self._bind_images_section()
+        self._bind_main_info_card()
+        sections.append(self.main_info_card)
+        sections.extend(self._bind_new_fields_cards())
+        self._refresh_save_button()
+        sections.append(self.save_button_container)
         
-    def add_images_section(self, parent_layout):
+        self._set_sections(sections)
+        self.scroll.scroll_y = 1
+    
+    def _set_sections(self, sections):
+        """Show exactly these section widgets, re-adding only if the set/order changed"""
+        shown = self.content_layout.children[::-1]  # Kivy keeps children in reverse order
+        if len(shown) == len(sections) and all(a is b for a, b in zip(shown, sections)):
+            return
+        self.content_layout.clear_widgets()
+        for section in sections:
+            self.content_layout.add_widget(section)
+    
+    def _bind_header(self):
+        """Show previous/next buttons when the object was opened from a result list"""
+        show_nav = self.result_index is not None and len(self.result_list) > 1
+        for nav_button, offset in self.nav_buttons:
+            if show_nav:
+                if nav_button.parent is None:
+                    self.header_layout.add_widget(nav_button)
+                new_index = self.result_index + offset
+                nav_button.disabled = not (0 <= new_index < len(self.result_list))
+            elif nav_button.parent is not None:
+                self.header_layout.remove_widget(nav_button)
+        
+    def add_images_section(self):
         """Add images section with large primary image and clickable thumbnails"""
-        obj = self.current_object
-        primary_image_url = obj.get('primaryImage', '')
-        additional_images = obj.get('additionalImages', [])
-        has_image = obj.get('hasImage', False)
-        
-        if has_image and primary_image_url:
-            # Build complete images list (primary + additional)
-            self.all_images = [primary_image_url] + additional_images
-            self.current_image_index = 0
-            
-            # Primary image container - large display
-            image_container = BoxLayout(
-                orientation='vertical',
-                size_hint_y=None,
-                height=dp(300),  # Large image display
-                spacing=dp(10)
-            )
-            
-            # Main image - now stored as instance variable for updating
-            self.main_image_widget = AsyncImage(
-                source=self.all_images[self.current_image_index],
-                size_hint_y=None,
-                height=dp(280),
-                fit_mode="contain"
+        # Primary image container - large display
+        self.image_container = BoxLayout(
+            orientation='vertical',
+            size_hint_y=None,
+            height=dp(300),  # Large image display
+            spacing=dp(10)
+        )
+        
+        # Main image - stored as instance variable for updating
+        self.main_image_widget = AsyncImage(
+            source='',
+            size_hint_y=None,
+            height=dp(280),
+            fit_mode="contain"
+        )
+        self.image_container.add_widget(self.main_image_widget)
+        
+        # Image counter - only shown for multiple images
+        self.image_counter_widget = Label(
+            text='',
+            size_hint_y=None,
+            height=dp(20),
+            font_size='12sp',
+            color=(0.5, 0.5, 0.5, 1),
+            halign='center'
+        )
+        
+        self.add_thumbnail_section()
+        
+        # No image placeholder
+        self.no_image_container = BoxLayout(
+            orientation='vertical',
+            size_hint_y=None,
+            height=dp(150)
+        )
+        
+        # Placeholder background
+        with self.no_image_container.canvas.before:
+            Color(0.95, 0.95, 0.95, 1)  # Light gray
+            self.no_image_container.bg_rect = RoundedRectangle(
+                pos=self.no_image_container.pos,
+                size=self.no_image_container.size,
+                radius=[10, 10, 10, 10]
             )
-            image_container.add_widget(self.main_image_widget)
-            
-            # Image counter if multiple images - also stored for updating
-            total_images = len(self.all_images)
-            if total_images > 1:
-                self.image_counter_widget = Label(
-                    text=f"Billede {self.current_image_index + 1} af {total_images}",
-                    size_hint_y=None,
-                    height=dp(20),
-                    font_size='12sp',
-                    color=(0.5, 0.5, 0.5, 1),
-                    halign='center'
-                )
-                image_container.add_widget(self.image_counter_widget)
-            
-            parent_layout.add_widget(image_container)
+        self.no_image_container.bind(pos=self._update_placeholder_bg, size=self._update_placeholder_bg)
+        
+        no_image_label = Label(
+            text="Intet billede tilgængeligt",
+            font_size='16sp',
+            color=(0.6, 0.6, 0.6, 1),
+            halign='center',
+            valign='middle'
+        )
+        self.no_image_container.add_widget(no_image_label)
+    
+    def _bind_images_section(self):
+        """Bind the current object's images; returns the image section widgets to show"""
+        model = self.view_model
+        self.all_images = list(model.images)
+        self.deferred_refs = dict(model.deferred_refs)
+        
+        if not self.all_images:
+            self.main_image_widget.source = ''
+            self._bind_thumbnails([])
+            return [self.no_image_container]
+        
+        self.current_image_index = 0
+        self.main_image_widget.source = self.all_images[self.current_image_index]
+        
+        sections = [self.image_container]
+        total_images = len(self.all_images)
+        if total_images > 1:
+            self.image_counter_widget.text = f"Billede {self.current_image_index + 1} af {total_images}"
+            if self.image_counter_widget.parent is None:
+                self.image_container.add_widget(self.image_counter_widget)
             
             # Add thumbnails for all images if there are multiple images
-            if total_images > 1:
-                self.add_thumbnail_section(parent_layout, self.all_images)
+            self._bind_thumbnails(self.all_images)
+            sections.append(self.thumb_scroll)
+            # Pre-decode neighbors once the current image has been shown
+            Clock.schedule_once(lambda dt: self._prefetch_neighbor_images(self.current_image_index), 0.3)
         else:
-            # No image placeholder
-            no_image_container = BoxLayout(
-                orientation='vertical',
-                size_hint_y=None,
-                height=dp(150)
-            )
-            
-            # Placeholder background
-            with no_image_container.canvas.before:
-                Color(0.95, 0.95, 0.95, 1)  # Light gray
-                no_image_container.bg_rect = RoundedRectangle(
-                    pos=no_image_container.pos,
-                    size=no_image_container.size,
-                    radius=[10, 10, 10, 10]
-                )
-            no_image_container.bind(pos=self._update_placeholder_bg, size=self._update_placeholder_bg)
-            
-            no_image_label = Label(
-                text="Intet billede tilgængeligt",
-                font_size='16sp',
-                color=(0.6, 0.6, 0.6, 1),
-                halign='center',
-                valign='middle'
-            )
-            no_image_container.add_widget(no_image_label)
-            parent_layout.add_widget(no_image_container)
+            if self.image_counter_widget.parent is not None:
+                self.image_container.remove_widget(self.image_counter_widget)
+            self._bind_thumbnails([])
+        
+        self._heal_missing_images()
+        return sections
     
-    def add_thumbnail_section(self, parent_layout, all_images):
-        """Add thumbnails for all images"""
+    def add_thumbnail_section(self):
+        """Add the scrollable thumbnail strip (thumbnails are pooled and rebound)"""
         # Scrollable container for thumbnails
-        thumb_scroll = ScrollView(
+        self.thumb_scroll = ScrollView(
             size_hint_y=None,
             height=dp(80),
             do_scroll_y=False,
@@ -215,48 +577,200 @@ class DetailScreen(Screen):
             bar_width=dp(0)  # Hide scrollbars
         )
         
-        thumb_container = BoxLayout(
+        self.thumb_container = BoxLayout(
             orientation='horizontal',
             size_hint_x=None,
             spacing=dp(10),
             padding=[dp(5), 0, dp(5), 0]
         )
-        thumb_container.bind(minimum_width=thumb_container.setter('width'))
+        self.thumb_container.bind(minimum_width=self.thumb_container.setter('width'))
+        
+        self.thumb_scroll.add_widget(self.thumb_container)
+        self._thumb_images = []  # Pooled image thumbnails
+        self._thumb_placeholders = []  # Pooled deferred placeholders
+    
+    def _bind_thumbnails(self, all_images):
+        """Fill the thumbnail strip from the pools, creating thumbnails only when a pool runs out"""
+        self.thumb_container.clear_widgets()
+        used = {False: 0, True: 0}
         
-        # Add thumbnails for ALL images - now clickable and scrollable
         for i, img_url in enumerate(all_images):
-            try:
-                thumbnail = AsyncImage(
-                    source=img_url,
-                    size_hint_x=None,
-                    width=dp(70),
-                    fit_mode="cover"
-                )
-                
-                # Store the correct image index (0-based, matching self.all_images)
-                thumbnail.image_index = i
-                
-                # Make thumbnail clickable with proper closure
-                def make_click_handler(index):
-                    def thumbnail_touch_handler(instance, touch):
-                        if instance.collide_point(*touch.pos):
-                            self.switch_to_image(index)
-                            return True
-                        return False
-                    return thumbnail_touch_handler
-                
-                thumbnail.bind(on_touch_down=make_click_handler(i))
-                thumb_container.add_widget(thumbnail)
-            except Exception as e:
-                print(f"Failed to load thumbnail {i}: {e}")
-                pass  # Skip failed thumbnails
+            deferred = img_url is None
+            pool = self._thumb_placeholders if deferred else self._thumb_images
+            if used[deferred] == len(pool):
+                pool.append(self._create_deferred_thumbnail() if deferred else self._create_thumbnail())
+            thumbnail = pool[used[deferred]]
+            used[deferred] += 1
+            
+            # Store the correct image index (0-based, matching self.all_images)
+            thumbnail.image_index = i
+            if deferred:
+                # Deferred reproduction - only fetched when tapped
+                thumbnail.placeholder_label.text = 'Tryk for\nat hente'
+            else:
+                thumbnail.source = img_url
+            self.thumb_container.add_widget(thumbnail)
+        
+        # Unused pooled thumbnails should not keep textures alive
+        for thumbnail in self._thumb_images[used[False]:]:
+            thumbnail.source = ''
+        self.thumb_scroll.scroll_x = 0
+    
+    def _create_thumbnail(self):
+        """Create a clickable image thumbnail"""
+        thumbnail = AsyncImage(
+            source='',
+            size_hint_x=None,
+            width=dp(70),
+            fit_mode="cover"
+        )
+        thumbnail.bind(on_touch_down=self._on_thumbnail_touch)
+        return thumbnail
+    
+    def _on_thumbnail_touch(self, instance, touch):
+        """Switch to the tapped thumbnail's image"""
+        if instance.parent is not None and instance.collide_point(*touch.pos):
+            self.switch_to_image(instance.image_index)
+            return True
+        return False
+    
+    def _create_deferred_thumbnail(self):
+        """Create placeholder thumbnail for a reproduction that is not downloaded yet"""
+        placeholder = BoxLayout(
+            orientation='vertical',
+            size_hint_x=None,
+            width=dp(70)
+        )
+        
+        with placeholder.canvas.before:
+            Color(0.95, 0.95, 0.95, 1)  # Light gray
+            placeholder.bg_rect = RoundedRectangle(
+                pos=placeholder.pos,
+                size=placeholder.size,
+                radius=[6, 6, 6, 6]
+            )
+        placeholder.bind(pos=self._update_placeholder_bg, size=self._update_placeholder_bg)
+        
+        placeholder_label = Label(
+            text='Tryk for\nat hente',
+            font_size='10sp',
+            color=(0.5, 0.5, 0.5, 1),
+            halign='center',
+            valign='middle'
+        )
+        placeholder.add_widget(placeholder_label)
+        placeholder.placeholder_label = placeholder_label
+        placeholder.bind(on_touch_down=self._on_thumbnail_touch)
+        return placeholder
+    
+    def _fetch_deferred_image(self, index):
+        """Download a deferred reproduction in the background and show it when done"""
+        reference = self.deferred_refs.get(index)
+        if not reference:
+            return
         
-        thumb_scroll.add_widget(thumb_container)
-        parent_layout.add_widget(thumb_scroll)
+        thumbnail = self._find_thumbnail(index)
+        if thumbnail is not None and hasattr(thumbnail, 'placeholder_label'):
+            thumbnail.placeholder_label.text = 'Henter...'
+        
+        current_object = self.current_object
+        
+        def fetch():
+            from kivy.app import App
+            app = App.get_running_app()
+            local_path = app.sara_api.download_image_by_reference(reference) if app else None
+            Clock.schedule_once(lambda dt: self._on_deferred_image_fetched(current_object, index, local_path), 0)
+        
+        import threading
+        threading.Thread(target=fetch, daemon=True).start()
+    
+    def _on_deferred_image_fetched(self, fetched_object, index, local_path):
+        """Replace the deferred placeholder with the downloaded image (UI thread)"""
+        if fetched_object is not self.current_object:
+            return  # User moved on to another object
+        
+        thumbnail = self._find_thumbnail(index)
+        if not local_path:
+            if thumbnail is not None and hasattr(thumbnail, 'placeholder_label'):
+                thumbnail.placeholder_label.text = 'Fejl -\nprøv igen'
+            return
+        
+        self.deferred_refs.pop(index, None)
+        self.all_images[index] = local_path
+        
+        if thumbnail is not None:
+            self._replace_deferred_thumbnail(thumbnail, index, local_path)
+        
+        self.switch_to_image(index)
+    
+    def _replace_deferred_thumbnail(self, placeholder, index, local_path):
+        """Swap a deferred placeholder for an image thumbnail at the same strip position"""
+        thumbnail = next((t for t in self._thumb_images if t.parent is None), None)
+        if thumbnail is None:
+            thumbnail = self._create_thumbnail()
+            self._thumb_images.append(thumbnail)
+        thumbnail.image_index = index
+        thumbnail.source = local_path
+        
+        position = self.thumb_container.children.index(placeholder)
+        self.thumb_container.remove_widget(placeholder)
+        self.thumb_container.add_widget(thumbnail, index=position)
+    
+    def _heal_missing_images(self):
+        """Re-fetch gallery images whose cache files were evicted (stored items)"""
+        import os
+        from utils.image_fetcher import ImageFetcher, PRIORITY_HIGH, PRIORITY_LOW
+        
+        image_refs = self.current_object.get('imageRefs') or []
+        if len(image_refs) != len(self.all_images):
+            return  # Cannot map images to references reliably
+        
+        for index, path in enumerate(self.all_images):
+            if path is None or os.path.exists(path):
+                continue
+            # The displayed image first, the rest of the gallery in the background
+            priority = PRIORITY_HIGH if index == self.current_image_index else PRIORITY_LOW
+            ImageFetcher().request(
+                image_refs[index],
+                lambda local_path, reference, i=index, obj=self.current_object: self._on_image_healed(obj, i, local_path),
+                priority=priority
+            )
+    
+    def _on_image_healed(self, healed_object, index, local_path):
+        """Show a re-fetched gallery image (UI thread)"""
+        if not local_path or healed_object is not self.current_object:
+            return
+        self.all_images[index] = local_path
+        if index == 0:
+            from utils.data_manager import DataManager
+            DataManager().update_image_path(
+                self.current_object.get('imageRefs', [''])[0], 'primaryImage', local_path,
+                priref=self.current_object.get('priref', '')
+            )
+        if index == self.current_image_index and self.main_image_widget:
+            self.main_image_widget.source = local_path
+        thumbnail = self._find_thumbnail(index)
+        if isinstance(thumbnail, AsyncImage):
+            thumbnail.source = local_path
+    
+    def _find_thumbnail(self, index):
+        """Find the thumbnail widget for an image index"""
+        container = getattr(self, 'thumb_container', None)
+        if container is None:
+            return None
+        for child in container.children:
+            if getattr(child, 'image_index', None) == index:
+                return child
+        return None
     
     def switch_to_image(self, new_index):
         """Switch the main image to a different one"""
         if 0 <= new_index < len(self.all_images):
+            if self.all_images[new_index] is None:
+                # Deferred reproduction - download it first
+                self._fetch_deferred_image(new_index)
+                return
+            
             old_index = self.current_image_index
             self.current_image_index = new_index
             
@@ -269,26 +783,20 @@ class DetailScreen(Screen):
                 total_images = len(self.all_images)
                 self.image_counter_widget.text = f"Billede {new_index + 1} af {total_images}"
             
+            self._prefetch_neighbor_images(new_index)
+            
             print(f"Switched from image {old_index + 1} to image {new_index + 1}")
     
-    def add_main_info_card(self, parent_layout):
+    def add_main_info_card(self):
         """Add main info card with title, object number, and description together"""
-        obj = self.current_object
-        
-        # Calculate height based on content
-        description = obj.get('description', 'Ingen beskrivelse tilgængelig')
-        estimated_lines = max(3, len(description) // 50 + 1)
-        desc_height = min(dp(150), dp(20 * estimated_lines))
-        total_height = dp(30) + dp(30) + desc_height + dp(60)  # Title section + number section + description + padding
-        
-        # Create card container
+        # Create card container (heights are set per object in _bind_main_info_card)
         card_container = BoxLayout(
             orientation='vertical',
             size_hint_y=None,
-            height=total_height,
             spacing=dp(8),
             padding=[dp(15), dp(15), dp(15), dp(15)]
         )
+        card_container.bind(minimum_height=card_container.setter('height'))
         
         # Card background - no shadow
         with card_container.canvas.before:
@@ -320,8 +828,8 @@ class DetailScreen(Screen):
         )
         title_label_small.bind(size=title_label_small.setter('text_size'))
         
-        title_value = Label(
-            text=obj.get('title', 'Ingen titel'),
+        self.title_value = Label(
+            text='',
             size_hint_y=None,
             height=dp(16),
             font_size='13sp',
@@ -329,10 +837,10 @@ class DetailScreen(Screen):
             halign='left',
             color=(0.2, 0.2, 0.2, 1)
         )
-        title_value.bind(size=title_value.setter('text_size'))
+        self.title_value.bind(size=self.title_value.setter('text_size'))
         
         title_section.add_widget(title_label_small)
-        title_section.add_widget(title_value)
+        title_section.add_widget(self.title_value)
         card_container.add_widget(title_section)
         
         # Object number with improved styling
@@ -354,28 +862,27 @@ class DetailScreen(Screen):
         )
         number_label_small.bind(size=number_label_small.setter('text_size'))
         
-        obj_num = obj.get('objectNumber', 'Ukendt')
-        number_value = Label(
-            text=obj_num,
+        self.number_value = Label(
+            text='',
             size_hint_y=None,
             height=dp(16),
             font_size='13sp',
             halign='left',
             color=(0.2, 0.2, 0.2, 1)
         )
-        number_value.bind(size=number_value.setter('text_size'))
+        self.number_value.bind(size=self.number_value.setter('text_size'))
         
         number_section.add_widget(number_label_small)
-        number_section.add_widget(number_value)
+        number_section.add_widget(self.number_value)
         card_container.add_widget(number_section)
         
-        # Description with improved styling
-        desc_section = BoxLayout(
+        # Description with improved styling - one label per text chunk
+        self.desc_section = BoxLayout(
             orientation='vertical',
             size_hint_y=None,
-            height=desc_height + dp(12),
             spacing=dp(3)
         )
+        self.desc_section.bind(minimum_height=self.desc_section.setter('height'))
         
         desc_label_small = Label(
             text='Beskrivelse:',
@@ -388,23 +895,77 @@ class DetailScreen(Screen):
         )
         desc_label_small.bind(size=desc_label_small.setter('text_size'))
         
-        desc_value = Label(
-            text=description,
+        self.desc_section.add_widget(desc_label_small)
+        self.desc_labels = []  # Pooled chunk labels
+        card_container.add_widget(self.desc_section)
+        
+        self.main_info_card = card_container
+    
+    def _bind_main_info_card(self):
+        """Bind title, object number and description of the current object"""
+        model = self.view_model
+        self.title_value.text = model.title
+        self.number_value.text = model.object_number
+        self._bind_description_chunks(model.description_chunks)
+    
+    def _create_desc_label(self):
+        """Label for one description chunk - its height follows the rendered text"""
+        desc_label = Label(
+            text='',
             size_hint_y=None,
-            height=desc_height,
             font_size='13sp',
             halign='left',
             valign='top',
-            color=(0.25, 0.25, 0.25, 1),
-            text_size=(None, None)
+            color=(0.25, 0.25, 0.25, 1)
         )
-        desc_value.bind(size=desc_value.setter('text_size'))
-        
-        desc_section.add_widget(desc_label_small)
-        desc_section.add_widget(desc_value)
-        card_container.add_widget(desc_section)
-        
-        parent_layout.add_widget(card_container)
+        desc_label.chunk = ''
+        desc_label.bind(width=lambda instance, width: setattr(instance, 'text_size', (width, None)))
+        desc_label.bind(texture_size=self._on_desc_label_rendered)
+        return desc_label
+    
+    def _on_desc_label_rendered(self, instance, texture_size):
+        """Replace the estimated height with the real one (released labels keep theirs)"""
+        if instance.text:
+            instance.height = texture_size[1]
+    
+    def _estimate_chunk_height(self, chunk):
+        """Approximate rendered height of a chunk before it has been rendered"""
+        width = max(self.desc_section.width, dp(200))
+        chars_per_line = max(20, int(width / (sp(13) * 0.5)))
+        lines = sum(max(1, -(-len(line) // chars_per_line)) for line in chunk.split('\n'))
+        return lines * sp(13) * 1.25
+    
+    def _bind_description_chunks(self, chunks):
+        """Attach one pooled label per chunk; text is only set near the viewport"""
+        while len(self.desc_labels) < len(chunks):
+            self.desc_labels.append(self._create_desc_label())
+        
+        for index, desc_label in enumerate(self.desc_labels):
+            if index < len(chunks):
+                desc_label.chunk = chunks[index]
+                desc_label.text = ''
+                desc_label.height = self._estimate_chunk_height(chunks[index])
+                if desc_label.parent is None:
+                    self.desc_section.add_widget(desc_label)
+            else:
+                desc_label.chunk = ''
+                desc_label.text = ''
+                if desc_label.parent is not None:
+                    self.desc_section.remove_widget(desc_label)
+        self._trigger_lazy_cards()
+    
+    def _update_description_chunks(self, margin):
+        """Render chunks within margin of the viewport, release the texture of the others"""
+        # Labels sit in plain BoxLayouts, so their positions are content layout coordinates
+        window_bottom, window_top = self._visible_window(margin)
+        for desc_label in self.desc_labels:
+            if desc_label.parent is None:
+                continue
+            near = not (desc_label.top < window_bottom or desc_label.y > window_top)
+            if near and desc_label.text != desc_label.chunk:
+                desc_label.text = desc_label.chunk
+            elif not near and desc_label.text:
+                desc_label.text = ''
     
     def _update_card_bg(self, instance, value):
         """Update card background"""
@@ -546,15 +1107,9 @@ class DetailScreen(Screen):
     
     def create_info_card(self, title, content):
         """Create a clean information card with consistent styling"""
-        # Calculate dynamic height based on content length with tighter sizing
-        estimated_lines = max(1, len(content) // 70 + content.count('\n'))
-        content_height = min(dp(120), dp(16 * estimated_lines + 20))  # Tighter line height
-        total_height = dp(24) + content_height + dp(20)  # Title + content + minimal padding
-        
         card_container = BoxLayout(
             orientation='vertical',
             size_hint_y=None,
-            height=total_height,
             spacing=dp(6),
             padding=[dp(16), dp(12), dp(16), dp(12)]  # Less vertical padding
         )
@@ -584,9 +1139,8 @@ class DetailScreen(Screen):
         
         # Content with improved readability
         content_label = Label(
-            text=content,
+            text='',
             size_hint_y=None,
-            height=content_height,
             font_size='13sp',
             color=(0.25, 0.25, 0.25, 1),  # Darker for better readability
             halign='left',
@@ -598,13 +1152,22 @@ class DetailScreen(Screen):
         
         card_container.add_widget(title_label)
         card_container.add_widget(content_label)
+        card_container.content_label = content_label
         
+        self.set_info_card_content(card_container, content)
         return card_container
     
+    def set_info_card_content(self, card_container, content):
+        """Rebind the content of a card made by create_info_card"""
+        content_height, total_height = estimate_info_card_heights(content)
+        card_container.content_label.text = content
+        card_container.content_label.height = content_height
+        card_container.height = total_height
+    
     def go_back(self, *args):
-        """Navigate back to search screen"""
-        if self.manager:
-            self.manager.current = 'search'
+        """Go back to the previous screen in the navigation history"""
+        from kivy.app import App
+        App.get_running_app()._go_back()
     
     def _update_bg(self, instance, value):
         """Update background"""
@@ -630,8 +1193,8 @@ class DetailScreen(Screen):
             instance.bg_rect.pos = instance.pos
             instance.bg_rect.size = instance.size
     
-    def add_save_button(self, parent_layout):
-        """Add save/unsave button to detail screen"""
+    def add_save_button(self):
+        """Add save/unsave and offline buttons to detail screen"""
         # Import here to avoid circular imports
         from utils.data_manager import DataManager
         
@@ -648,36 +1211,86 @@ class DetailScreen(Screen):
             padding=[dp(20), dp(15), dp(20), dp(15)]
         )
         
-        # Check if item is already saved (by priref for unique identification)
-        priref = self.current_object.get('priref', '')
-        is_saved = self.data_manager.is_item_saved_by_priref(priref) if priref else False
-        
-        # Create save/unsave button
-        if is_saved:
-            save_btn = Button(
-                text='Fjern fra gemte',
-                size_hint_x=1.0,
-                font_size='16sp',
-                background_color=(0.8, 0.3, 0.3, 1),
-                color=(1, 1, 1, 1)
-            )
-            save_btn.bind(on_press=lambda x: self._handle_unsave())
-        else:
-            save_btn = Button(
-                text='Gem objekt',
-                size_hint_x=1.0,
-                font_size='16sp',
-                background_color=(0.2, 0.6, 0.2, 1),
-                color=(1, 1, 1, 1)
-            )
-            save_btn.bind(on_press=lambda x: self._handle_save())
+        # Save/unsave button - text and color follow the saved state
+        self.save_btn = Button(
+            size_hint_x=1.0,
+            font_size='16sp',
+            color=(1, 1, 1, 1)
+        )
+        self.save_btn.bind(on_press=lambda x: self._handle_save_toggle())
+        
+        # Button that pins the object as an offline pack (saves it too)
+        self.offline_btn = Button(
+            text='Gem offline',
+            size_hint_x=0.6,
+            font_size='14sp',
+            background_color=(0.15, 0.25, 0.4, 1),
+            color=(1, 1, 1, 1)
+        )
+        self.offline_btn.bind(on_press=lambda x: self._handle_pin_offline())
         
-        button_container.add_widget(save_btn)
-        parent_layout.add_widget(button_container)
+        button_container.add_widget(self.save_btn)
+        button_container.add_widget(self.offline_btn)
         
         # Store reference for refreshing
         self.save_button_container = button_container
     
+    def _handle_save_toggle(self):
+        """Save or unsave depending on the current state"""
+        priref = self.current_object.get('priref', '')
+        if priref and self.data_manager.is_item_saved_by_priref(priref):
+            self._handle_unsave()
+        else:
+            self._handle_save()
+    
+    def _update_offline_button(self, priref):
+        """Show the offline pack state of the object"""
+        from utils.offline_packs import OfflinePackManager
+        pack_manager = OfflinePackManager()
+        
+        if priref and pack_manager.is_pinned(priref):
+            self.offline_btn.text = 'Offline ✓'
+            self.offline_btn.disabled = True
+        elif priref and pack_manager.is_pinning(priref):
+            self.offline_btn.text = 'Henter...'
+            self.offline_btn.disabled = True
+        else:
+            self.offline_btn.text = 'Gem offline'
+            self.offline_btn.disabled = not priref
+    
+    def _handle_pin_offline(self):
+        """Save the object and download its offline pack in the background"""
+        from kivy.app import App
+        from utils.offline_packs import OfflinePackManager
+        
+        if not hasattr(self, 'data_manager'):
+            from utils.data_manager import DataManager
+            self.data_manager = DataManager()
+        
+        priref = self.current_object.get('priref', '')
+        if not self.data_manager.is_item_saved_by_priref(priref):
+            self.data_manager.add_to_saved_items(self.current_object)
+        
+        app = App.get_running_app()
+        OfflinePackManager().pin(self.current_object, app.sara_api, self._on_pack_pinned)
+        self._refresh_save_button()
+    
+    def _on_pack_pinned(self, priref, record, error):
+        """Offline pack finished (UI thread) - store the offline record with the saved item"""
+        if record:
+            if self.data_manager.is_item_saved_by_priref(priref):
+                self.data_manager.update_saved_item(record)
+            else:
+                # Item was unsaved while downloading
+                from utils.offline_packs import OfflinePackManager
+                OfflinePackManager().unpin(priref)
+            print(f"Offline pack ready for {priref}")
+        else:
+            print(f"Offline pack for {priref} failed: {error}")
+        
+        if self.current_object and self.current_object.get('priref', '') == priref:
+            self._refresh_save_button()
+    
     def _handle_save(self):
         """Handle save button press"""
         if not hasattr(self, 'data_manager'):
@@ -688,9 +1301,7 @@ class DetailScreen(Screen):
         print(f"DEBUG: Object number: {self.current_object.get('objectNumber', 'MISSING')}")
         self.data_manager.add_to_saved_items(self.current_object)
         print(f"Saved item: {self.current_object.get('title', 'Unknown')}")
-        
-        # Refresh the button to show unsave option
-        self._refresh_save_button()
+        # The button switches to the unsave option through the 'saved_added' event
     
     def _handle_unsave(self):
         """Handle unsave button press"""
@@ -700,81 +1311,77 @@ class DetailScreen(Screen):
         
         self.data_manager.remove_from_saved_items(self.current_object)
         print(f"Removed item from saved: {self.current_object.get('title', 'Unknown')}")
-        
-        # Refresh the button to show save option
-        self._refresh_save_button()
+        # The button switches to the save option through the 'saved_removed' event
+    
+    def _on_data_changed(self, event, index, item):
+        """DataManager change event (UI thread) - refresh the save row if it concerns this object"""
+        if self.main_layout is None or not self.current_object or not event.startswith('saved_'):
+            return
+        priref = self.current_object.get('priref', '')
+        if event in ('saved_cleared', 'saved_reloaded') or (item is not None and item.get('priref', '') == priref):
+            self._refresh_save_button()
     
     def _refresh_save_button(self):
         """Refresh save button state"""
-        if hasattr(self, 'save_button_container') and self.save_button_container.parent:
-            parent = self.save_button_container.parent
-            parent.remove_widget(self.save_button_container)
-            self.add_save_button(parent)
-    
-    def add_new_fields_cards(self, parent_layout):
-        """Add dedicated cards for the new API fields with improved formatting"""
-        obj = self.current_object
+        # Check if item is already saved (by priref for unique identification)
+        priref = self.current_object.get('priref', '')
+        is_saved = self.data_manager.is_item_saved_by_priref(priref) if priref else False
+        
+        if is_saved:
+            self.save_btn.text = 'Fjern fra gemte'
+            self.save_btn.background_color = (0.8, 0.3, 0.3, 1)
+        else:
+            self.save_btn.text = 'Gem objekt'
+            self.save_btn.background_color = (0.2, 0.6, 0.2, 1)
         
-        # Placering Information Card
-        location_info = []
-        location_name = obj.get('location_name', '')
-        if location_name:
-            location_info.append(f"[b]Navn:[/b] {location_name}")
-        
-        location_context = obj.get('location_context', '')
-        if location_context:
-            location_info.append(f"[b]Kontekst:[/b] {location_context}")
-        
-        if location_info:
-            location_text = "\n".join(location_info)
-            location_card = self.create_info_card("Placering", location_text)
-            parent_layout.add_widget(location_card)
-        
-        # Erhvervelse (Acquisition) Information Card  
-        acquisition_info = []
-        acquisition_number = obj.get('acquisition_number', '')
-        if acquisition_number:
-            acquisition_info.append(f"[b]Accession nr.:[/b] {acquisition_number}")
-        
-        acquisition_source = obj.get('acquisition_source', '')
-        if acquisition_source:
-            acquisition_info.append(f"[b]Giver:[/b] {acquisition_source}")
-        
-        acquisition_reason = obj.get('acquisition_reason', '')
-        if acquisition_reason:
-            acquisition_info.append(f"[b]Begrundelse:[/b] {acquisition_reason}")
-        
-        acquisition_date = obj.get('acquisition_date', '')
-        if acquisition_date:
-            acquisition_info.append(f"[b]Dato:[/b] {acquisition_date}")
-        
-        if acquisition_info:
-            acquisition_text = "\n".join(acquisition_info)
-            acquisition_card = self.create_info_card("Accession", acquisition_text)
-            parent_layout.add_widget(acquisition_card)
-        
-        # Proveniens Information Card
-        provenance_info = []
-        event_type = obj.get('event_type', '')
-        if event_type:
-            provenance_info.append(f"[b]Type:[/b] {event_type}")
-        
-        event_name = obj.get('event_name', '')
-        if event_name:
-            provenance_info.append(f"[b]Betegnelse:[/b] {event_name}")
-        
-        event_description = obj.get('event_description', '')
-        if event_description:
-            provenance_info.append(f"[b]Beskrivelse:[/b] {event_description}")
-        
-        if provenance_info:
-            provenance_text = "\n".join(provenance_info)
-            provenance_card = self.create_info_card("Proveniens", provenance_text)
-            parent_layout.add_widget(provenance_card)
-        
-        # Ophavsmand Card
-        craftsman = obj.get('craftsman', '')
-        if craftsman:
-            craftsman_text = f"[b]Ophavsmand:[/b] {craftsman}"
-            craftsman_card = self.create_info_card("Ophavsmand", craftsman_text)
-            parent_layout.add_widget(craftsman_card)
+        self._update_offline_button(priref)
+    
+    def add_new_fields_cards(self):
+        """Add placeholders for the new API field cards - the cards themselves are built lazily"""
+        self.lazy_cards = {}
+        for key, title in (('location', "Placering"), ('acquisition', "Accession"),
+                           ('provenance', "Proveniens"), ('craftsman', "Ophavsmand")):
+            # Holder keeps the card's final height, so scrolling stays stable before it is built
+            holder = BoxLayout(orientation='vertical', size_hint_y=None, height=0)
+            holder.card_title = title
+            holder.card = None
+            holder.card_model = None  # Model to show
+            holder.bound_model = None  # Model the card currently shows
+            self.lazy_cards[key] = holder
+    
+    def _bind_new_fields_cards(self):
+        """Size the new API field card placeholders; returns those that have content"""
+        visible_cards = []
+        for card_model in self.view_model.info_cards:
+            holder = self.lazy_cards[card_model.key]
+            holder.card_model = card_model
+            holder.height = card_model.total_height
+            visible_cards.append(holder)
+        self._trigger_lazy_cards()
+        return visible_cards
+    
+    def _visible_window(self, margin=0):
+        """Bottom and top of the viewport (plus margin) in content layout coordinates"""
+        scrollable = max(0, self.content_layout.height - self.scroll.height)
+        bottom = self.content_layout.y + self.scroll.scroll_y * scrollable
+        return bottom - margin, bottom + self.scroll.height + margin
+    
+    def _materialize_lazy_cards(self, *args):
+        """Build and bind placeholder cards that are within one screen of the viewport"""
+        margin = self.scroll.height
+        self._update_description_chunks(margin)
+        window_bottom, window_top = self._visible_window(margin)
+        for holder in self.lazy_cards.values():
+            if holder.parent is None or holder.bound_model is holder.card_model:
+                continue
+            if holder.top < window_bottom or holder.y > window_top:
+                continue
+            
+            if holder.card is None:
+                holder.card = self.create_info_card(holder.card_title, '')
+                holder.add_widget(holder.card)
+            card_model = holder.card_model
+            holder.card.content_label.text = card_model.text
+            holder.card.content_label.height = card_model.content_height
+            holder.card.height = card_model.total_height
+            holder.bound_model = card_model
@@ -17,6 +17,7 @@ from components.search_bar import SearchBar
 from components.carousel import RecentSearchesCarousel
 from components.result_card import ResultCard
 from utils.data_manager import DataManager
+from utils.network_monitor import NetworkMonitor
 from sara_api import SaraAPI
 
 
@@ -90,6 +91,9 @@ class HomeScreen(BoxLayout):
         print(f"HomeScreen: Carousel created, callback set to: {self.carousel.item_click_callback}")
         main_layout.add_widget(self.carousel)
         
+        # Data usage counter and data-saver toggle
+        main_layout.add_widget(self._create_data_usage_row())
+        
         # Container to hold main_layout at top and spacer at bottom
         full_layout = BoxLayout(
             orientation='vertical',
@@ -108,6 +112,70 @@ class HomeScreen(BoxLayout):
         
         self.add_widget(full_layout)
     
+    def _create_data_usage_row(self):
+        """Create row with per-session bytes counter and data-saver toggle"""
+        self.network_monitor = NetworkMonitor()
+        
+        data_row = BoxLayout(
+            orientation='horizontal',
+            size_hint_y=None,
+            height=dp(28),
+            spacing=dp(10),
+            padding=[dp(20), 0, dp(20), 0]
+        )
+        
+        self.data_usage_label = Label(
+            text='',
+            font_size='11sp',
+            color=(0.5, 0.5, 0.5, 1),
+            halign='left',
+            valign='middle'
+        )
+        self.data_usage_label.bind(size=self.data_usage_label.setter('text_size'))
+        
+        self.saver_toggle_btn = Button(
+            text='',
+            size_hint_x=None,
+            width=dp(120),
+            font_size='11sp',
+            background_normal='',
+            background_color=(0.95, 0.95, 0.95, 1),
+            color=(0.3, 0.3, 0.3, 1)
+        )
+        self.saver_toggle_btn.bind(on_press=self._cycle_saver_mode)
+        
+        data_row.add_widget(self.data_usage_label)
+        data_row.add_widget(self.saver_toggle_btn)
+        
+        self.network_monitor.add_listener(self._update_data_usage)
+        self._update_data_usage(self.network_monitor)
+        return data_row
+    
+    def _update_data_usage(self, monitor):
+        """Refresh data usage counter and saver mode state"""
+        text = f'Data denne session: {monitor.format_session_bytes()}'
+        if monitor.is_saver_mode():
+            text += ' · datasparer aktiv'
+        self.data_usage_label.text = text
+        
+        if monitor.forced_saver_mode is None:
+            self.saver_toggle_btn.text = 'Datasparer: Auto'
+        elif monitor.forced_saver_mode:
+            self.saver_toggle_btn.text = 'Datasparer: Til'
+        else:
+            self.saver_toggle_btn.text = 'Datasparer: Fra'
+    
+    def _cycle_saver_mode(self, instance):
+        """Cycle data-saver mode: automatic -> on -> off -> automatic"""
+        current = self.network_monitor.forced_saver_mode
+        if current is None:
+            self.network_monitor.set_saver_mode(True)
+        elif current:
+            self.network_monitor.set_saver_mode(False)
+        else:
+            self.network_monitor.set_saver_mode(None)
+        self._update_data_usage(self.network_monitor)
+    
     def search_objects(self, query):
         """Search for objects using the API"""
         print(f"HomeScreen.search_objects called with: '{query}'")
@@ -177,8 +245,6 @@ class HomeScreen(BoxLayout):
             if results:
                 print("HomeScreen: Adding to recent searches")
                 self.data_manager.add_to_recent_searches(results[0])
-                self.update_recent_carousel()
-                print("HomeScreen: Updated recent carousel")
             
             # Get the screen manager through parent hierarchy
             # Looking for 'manager' attribute which is the ScreenManager
@@ -228,9 +294,21 @@ class HomeScreen(BoxLayout):
         print(f"HomeScreen: Search error: {error_msg}")
         # Could add a popup or other error display here
     
+    def open_stored_item(self, search_item):
+        """Show the stored object of a recent search at once (refreshed in the background); False if none"""
+        obj = self.data_manager.get_stored_object(search_item)
+        if obj is None:
+            return False
+        self.data_manager.add_to_recent_searches(obj)
+        from kivy.app import App
+        App.get_running_app().show_stored_object(obj)
+        return True
+    
     def search_recent_item(self, search_item):
         """Search for an item from recent searches"""
         print(f"HomeScreen.search_recent_item called with: {search_item}")
+        if self.open_stored_item(search_item):
+            return
         obj_number = search_item.get('objectNumber', '')
         if obj_number:
             print(f"HomeScreen: Setting search text to '{obj_number}' and calling search")
@@ -5,9 +5,9 @@ Displays search results in grid format with back navigation to home
 """
 
 from kivy.uix.boxlayout import BoxLayout
-from kivy.uix.gridlayout import GridLayout
 from kivy.uix.screenmanager import Screen
-from kivy.uix.scrollview import ScrollView
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recyclegridlayout import RecycleGridLayout
 from kivy.uix.label import Label
 from kivy.uix.button import Button
 from kivy.graphics import Color, RoundedRectangle
@@ -15,6 +15,7 @@ from kivy.metrics import dp
 
 from components.result_card import ResultCard
 from utils.data_manager import DataManager
+from utils.nav_history import ResultsSnapshot
 
 
 class ResultsScreen(Screen):
@@ -91,22 +92,42 @@ class ResultsScreen(Screen):
         header_layout.add_widget(self.title_label)
         header_layout.add_widget(spacer)
         
-        # Results scroll area
-        self.results_scroll = ScrollView()
-        
+        # Results area - holds either the results grid or the no results message
+        self.results_area = BoxLayout(orientation='vertical')
+
+        # Virtualized grid: only the visible cards exist and are rebound while scrolling
+        self.results_scroll = RecycleView(viewclass=ResultCard)
+
         # Grid layout for results (3 columns like saved items)
-        self.results_layout = GridLayout(
+        self.results_layout = RecycleGridLayout(
             cols=3,
             size_hint_y=None,
+            default_size=(dp(100), dp(140)),
+            default_size_hint=(None, None),
             spacing=dp(10),  # Reduced spacing
             padding=[dp(15), dp(15), dp(15), dp(15)]
         )
         self.results_layout.bind(minimum_height=self.results_layout.setter('height'))
-        
+
         self.results_scroll.add_widget(self.results_layout)
-        
+        self.results_area.add_widget(self.results_scroll)
+
+        # No results message (shown instead of the grid)
+        self.no_results_label = Label(
+            text='No objects found.\\n\\n' +
+                 'Check object number format:\\n' +
+                 '• 0054x0007\\n• 12345;15\\n• AAB 1234\\n• 1234',
+            size_hint_y=None,
+            height=dp(150),
+            font_size='16sp',
+            halign='center',
+            valign='top',
+            color=(0.6, 0.4, 0.4, 1)
+        )
+        self.no_results_label.bind(size=self.no_results_label.setter('text_size'))
+
         main_layout.add_widget(header_layout)
-        main_layout.add_widget(self.results_scroll)
+        main_layout.add_widget(self.results_area)
         
         self.add_widget(main_layout)
     
@@ -130,54 +151,76 @@ class ResultsScreen(Screen):
         # Update title
         self.title_label.text = f'Resultater for "{query}"'
         
-        # Clear previous results
-        self.results_layout.clear_widgets()
-        
+        # Swap between grid and no results message
+        self.results_area.clear_widgets()
+
         if not results:
             # Show no results message
-            no_results = Label(
-                text='No objects found.\\n\\n' +
-                     'Check object number format:\\n' +
-                     '• 0054x0007\\n• 12345;15\\n• AAB 1234\\n• 1234',
-                size_hint_y=None,
-                height=dp(150),
-                font_size='16sp',
-                halign='center',
-                color=(0.6, 0.4, 0.4, 1)
-            )
-            no_results.bind(size=no_results.setter('text_size'))
-            self.results_layout.add_widget(no_results)
+            self.results_scroll.data = []
+            self.results_area.add_widget(self.no_results_label)
+            self.results_area.add_widget(BoxLayout())  # Keep message at the top
             return
-        
-        # Display results (removed count label)
-        print(f"DEBUG ResultsScreen: About to create {len(results)} result cards")
-        for i, obj in enumerate(results, 1):
-            print(f"DEBUG ResultsScreen: Creating ResultCard #{i} for {obj.get('title', 'Unknown')}")
-            result_card = ResultCard(
-                obj_data=obj,
-                index=i,
-                click_callback=self.view_detail
-            )
-            print(f"DEBUG ResultsScreen: ResultCard #{i} created, adding to layout")
-            self.results_layout.add_widget(result_card)
-            print(f"DEBUG ResultsScreen: ResultCard #{i} added to layout")
+
+        self.results_area.add_widget(self.results_scroll)
+
+        # Display results - cards are created by the RecycleView for visible rows only
+        print(f"DEBUG ResultsScreen: Binding {len(results)} results to the grid")
+        self.results_scroll.data = [
+            {'obj_data': obj, 'click_callback': self.view_detail}
+            for obj in results
+        ]
+        self.results_scroll.scroll_y = 1
+
+    def start_results(self, query):
+        """Show an empty grid for a streaming search - cards are added with append_result"""
+        self.show_results([], query)
+        self.results_area.clear_widgets()
+        self.results_area.add_widget(self.results_scroll)
+    
+    def append_result(self, obj):
+        """Add one streamed result card"""
+        if self.results_scroll.parent is None:
+            self.results_area.clear_widgets()
+            self.results_area.add_widget(self.results_scroll)
+        self.results_data.append(obj)
+        self.results_scroll.data.append({'obj_data': obj, 'click_callback': self.view_detail})
+    
+    def refresh_result(self, obj):
+        """Rebind the card of a result whose images were filled in"""
+        index = next((i for i, result in enumerate(self.results_data) if result is obj), None)
+        if index is not None and index < len(self.results_scroll.data):
+            self.results_scroll.data[index] = {'obj_data': obj, 'click_callback': self.view_detail}
+    
+    def get_snapshot(self):
+        """Lightweight state for the navigation history (references, no copies)"""
+        return ResultsSnapshot(
+            query=getattr(self, 'search_query', ''),
+            results=self.results_data,
+            rv_data=self.results_scroll.data,
+            scroll_y=self.results_scroll.scroll_y
+        )
+    
+    def restore_snapshot(self, snapshot):
+        """Show a history entry again from memory - no new search, no card rebuild"""
+        if snapshot.results is not self.results_data:
+            self.results_data = snapshot.results
+            self.search_query = snapshot.query
+            self.title_label.text = f'Resultater for "{snapshot.query}"'
+            self.results_area.clear_widgets()
+            if snapshot.results:
+                self.results_area.add_widget(self.results_scroll)
+                self.results_scroll.data = snapshot.rv_data
+            else:
+                self.results_scroll.data = []
+                self.results_area.add_widget(self.no_results_label)
+                self.results_area.add_widget(BoxLayout())  # Keep message at the top
+        self.results_scroll.scroll_y = snapshot.scroll_y
     
     def go_back(self, *args):
-        """Go back to the home screen"""
+        """Go back to the previous screen in the navigation history"""
         print("ResultsScreen: go_back called")
-        
-        # Navigate through the nested screen structure
-        # We need to go: ResultsScreen -> Screen('results') -> ScreenManager -> MainScreen
-        parent = self.parent
-        while parent and not hasattr(parent, 'current'):
-            print(f"ResultsScreen: Checking parent: {type(parent)}")
-            parent = parent.parent
-        
-        if parent and hasattr(parent, 'current'):
-            print("ResultsScreen: Found screen manager, navigating to search")
-            parent.current = 'search'  # Changed from 'home' to 'search'
-        else:
-            print("ResultsScreen: Could not find screen manager")
+        from kivy.app import App
+        App.get_running_app()._go_back()
     
     def view_detail(self, obj_data):
         """Navigate to detail screen for selected object"""
@@ -198,7 +241,10 @@ class ResultsScreen(Screen):
             
             if detail_screen:
                 print(f"ResultsScreen: Found detail screen, showing object")
-                detail_screen.show_object(obj_data)
+                result_index = next(
+                    (i for i, result in enumerate(self.results_data) if result is obj_data), None
+                )
+                detail_screen.show_object(obj_data, self.results_data, result_index)
                 
                 # Use app navigation to track history
                 from kivy.app import App
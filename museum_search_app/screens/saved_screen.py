@@ -4,15 +4,21 @@ Saved Items Screen for SARA Museum App
 Displays saved museum objects and items in a grid format
 """
 
+import os
+import threading
+
 from kivy.uix.boxlayout import BoxLayout
-from kivy.uix.scrollview import ScrollView
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recyclegridlayout import RecycleGridLayout
 from kivy.uix.label import Label
 from kivy.uix.button import Button
+from kivy.uix.textinput import TextInput
+from kivy.uix.modalview import ModalView
+from kivy.clock import Clock
 from kivy.graphics import Color, RoundedRectangle
 from kivy.metrics import dp
 
-from components.saved_item_grid import SavedItemGrid
-from components.result_card import ResultCard
+from components.saved_item_grid import SavedGridItem
 from utils.data_manager import DataManager
 
 
@@ -36,9 +42,15 @@ class SavedScreen(BoxLayout):
         
         # Initialize data manager
         self.data_manager = DataManager()
+        self.filter_query = ''  # Text of the filter box; empty shows all saved items
+        self._filter_event = None
+        self._transfer_running = False  # Export/import in progress (worker thread)
         
         self._create_layout()
         self.refresh_saved_items()
+        
+        # Apply single changes instead of rebuilding the grid
+        self.data_manager.add_listener(self._on_saved_items_changed)
     
     def _update_bg(self, instance, value):
         """Update background"""
@@ -51,7 +63,7 @@ class SavedScreen(BoxLayout):
         self.header_layout = BoxLayout(
             orientation='vertical',
             size_hint_y=None,
-            height=dp(100),
+            height=dp(150),
             padding=[dp(20), dp(20), dp(20), dp(10)],
             spacing=dp(10)
         )
@@ -67,89 +79,190 @@ class SavedScreen(BoxLayout):
             halign='center'
         )
         
-        # Clear all button
-        self.clear_all_btn = Button(
-            text='Ryd alle gemte objekter',
+        # Action row - move the saved list to another device, clear all
+        self.actions_layout = BoxLayout(
+            orientation='horizontal',
             size_hint_y=None,
             height=dp(40),
+            spacing=dp(10)
+        )
+        
+        self.export_btn = Button(
+            text='Eksporter',
+            size_hint_x=0.3,
             font_size='14sp',
-            background_color=(0.8, 0.3, 0.3, 1),
+            background_color=(0.3, 0.5, 0.7, 1),
             color=(1, 1, 1, 1),
-            on_press=self.clear_all_saved_items
+            on_press=self.export_saved_items
         )
         
-        self.header_layout.add_widget(self.title)
-        self.header_layout.add_widget(self.clear_all_btn)
+        self.import_btn = Button(
+            text='Importer',
+            size_hint_x=0.3,
+            font_size='14sp',
+            background_color=(0.3, 0.5, 0.7, 1),
+            color=(1, 1, 1, 1),
+            on_press=self.import_saved_items
+        )
         
-        # Content container for switching between grid and detail view
-        self.content_container = BoxLayout(orientation='vertical')
+        # Clear all button
+        self.clear_all_btn = Button(
+            text='Ryd alle',
+            size_hint_x=0.4,
+            font_size='14sp',
+            background_color=(0.8, 0.3, 0.3, 1),
+            color=(1, 1, 1, 1),
+            on_press=self.clear_all_saved_items
+        )
         
-        # Saved items scroll container
-        self.saved_scroll = ScrollView()
+        self.actions_layout.add_widget(self.export_btn)
+        self.actions_layout.add_widget(self.import_btn)
+        self.actions_layout.add_widget(self.clear_all_btn)
         
-        self.saved_layout = BoxLayout(
-            orientation='vertical',
+        # Filter box - full-text search over the saved items
+        self.filter_input = TextInput(
+            hint_text='Filtrer gemte objekter...',
+            hint_text_color=(0.6, 0.6, 0.6, 1),
+            font_size='14sp',
+            multiline=False,
             size_hint_y=None,
-            spacing=dp(15),
-            padding=[0, dp(15), 0, dp(15)]
+            height=dp(40),
+            padding=[dp(10), dp(10), dp(10), dp(5)],
+            foreground_color=(0.2, 0.2, 0.2, 1),
+            cursor_color=(0.2, 0.2, 0.2, 1)
         )
-        self.saved_layout.bind(minimum_height=self.saved_layout.setter('height'))
-        
-        self.saved_scroll.add_widget(self.saved_layout)
-        self.content_container.add_widget(self.saved_scroll)
-        
-        self.add_widget(self.header_layout)
-        self.add_widget(self.content_container)
-    
-    def refresh_saved_items(self):
-        """Refresh the display of saved items"""
-        # Clear current display
-        self.saved_layout.clear_widgets()
-        
-        # Get saved items
-        saved_items = self.data_manager.get_saved_items()
+        self.filter_input.bind(text=self._on_filter_text)
         
-        if not saved_items:
-            # Show empty state
-            self._show_empty_state()
-            self.clear_all_btn.disabled = True
-            return
+        self.header_layout.add_widget(self.title)
+        self.header_layout.add_widget(self.filter_input)
+        self.header_layout.add_widget(self.actions_layout)
         
-        self.clear_all_btn.disabled = False
+        # Content container for switching between grid and detail view
+        self.content_container = BoxLayout(orientation='vertical')
         
-        # Show items count
-        count_label = Label(
-            text=f'{len(saved_items)} gemte objekt(er):',
+        # Items count
+        self.count_label = Label(
+            text='',
             size_hint_y=None,
             height=dp(40),
             font_size='16sp',
             halign='center',
             color=(0.2, 0.6, 0.2, 1)
         )
-        count_label.bind(size=count_label.setter('text_size'))
-        self.saved_layout.add_widget(count_label)
+        self.count_label.bind(size=self.count_label.setter('text_size'))
         
-        # Create grid container - full width with padding
-        grid_container = BoxLayout(
-            orientation='vertical',
+        # Virtualized grid - a small pool of items is rebound while scrolling
+        self.saved_rv = RecycleView(viewclass=SavedGridItem)
+        self.saved_grid = RecycleGridLayout(
+            cols=3,  # Three columns
             size_hint_y=None,
+            default_size=(dp(100), dp(140)),
+            default_size_hint=(None, None),
+            spacing=dp(10),
             padding=[dp(15), dp(10), dp(15), dp(10)]
         )
-        grid_container.bind(minimum_height=grid_container.setter('height'))
+        self.saved_grid.bind(minimum_height=self.saved_grid.setter('height'))
+        self.saved_rv.add_widget(self.saved_grid)
         
-        # Create and add grid directly
-        saved_grid = SavedItemGrid(
-            saved_items=saved_items,
-            remove_callback=self.remove_saved_item,
-            view_callback=self.show_item_detail
+        # Empty state (shown instead of count and grid)
+        self.empty_view = BoxLayout(
+            orientation='vertical',
+            padding=[0, dp(15), 0, dp(15)]
         )
+        self.empty_view.add_widget(self._create_empty_state())
+        self.empty_view.add_widget(BoxLayout())  # Keep message at the top
         
-        grid_container.add_widget(saved_grid)
+        self.add_widget(self.header_layout)
+        self.add_widget(self.content_container)
+    
+    def refresh_saved_items(self):
+        """Rebind the whole grid to the saved items (the matches, while filtering)"""
+        if self.filter_query:
+            saved_items = self.data_manager.search_saved_items(self.filter_query)
+        else:
+            saved_items = self.data_manager.get_saved_items()
+        self.saved_rv.data = [self._make_entry(item) for item in saved_items]
+        self._update_state()
+    
+    def _on_filter_text(self, instance, text):
+        """Filter box changed - search once typing pauses"""
+        if self._filter_event is not None:
+            self._filter_event.cancel()
+        self._filter_event = Clock.schedule_once(lambda dt: self._apply_filter(text), 0.15)
+    
+    def _apply_filter(self, text):
+        self._filter_event = None
+        query = text.strip()
+        if query != self.filter_query:
+            self.filter_query = query
+            self.refresh_saved_items()
+            self.saved_rv.scroll_y = 1  # Best matches first
+    
+    def _make_entry(self, item):
+        """RecycleView data entry for a saved item"""
+        return {
+            'obj_data': item,
+            'remove_callback': self.remove_saved_item,
+            'view_callback': self.show_item_detail
+        }
+    
+    def _on_saved_items_changed(self, event, index, item):
+        """Apply a single DataManager change to the grid data"""
+        if not event.startswith('saved_'):
+            return
+        if self.filter_query:
+            # Matches and their ranking may change - run the (fast) search again
+            self.refresh_saved_items()
+            return
+        data = self.saved_rv.data
+        try:
+            if event == 'saved_added':
+                data.insert(index, self._make_entry(item))
+            elif event == 'saved_removed':
+                data.pop(index)
+            elif event == 'saved_updated':
+                data[index] = self._make_entry(item)
+            elif event == 'saved_moved':
+                data.pop(index)
+                data.insert(0, self._make_entry(item))
+            elif event == 'saved_cleared':
+                self.saved_rv.data = []
+            elif event == 'saved_reloaded':
+                self.refresh_saved_items()
+                return
+        except IndexError:
+            pass  # Handled by the check below
+        
+        # Out of sync (e.g. changes made on another thread) - fall back to a full rebind
+        if len(self.saved_rv.data) != self.data_manager.get_saved_count():
+            self.refresh_saved_items()
+            return
+        self._update_state()
+    
+    def _update_state(self):
+        """Update count, clear button and empty state for the current item count"""
+        count = len(self.saved_rv.data)
+        total = self.data_manager.get_saved_count()
+        self.clear_all_btn.disabled = total == 0
+        self.export_btn.disabled = total == 0 or self._transfer_running
+        self.import_btn.disabled = self._transfer_running
+        if self.filter_query:
+            self.count_label.text = f'{count} af {total} gemte objekt(er) matcher:'
+            count = total  # No empty state while filtering - the count tells there are no matches
+        else:
+            self.count_label.text = f'{count} gemte objekt(er):'
         
-        self.saved_layout.add_widget(grid_container)
+        showing_empty = self.empty_view.parent is self.content_container
+        if count == 0 and not showing_empty:
+            self.content_container.clear_widgets()
+            self.content_container.add_widget(self.empty_view)
+        elif count > 0 and (showing_empty or not self.content_container.children):
+            self.content_container.clear_widgets()
+            self.content_container.add_widget(self.count_label)
+            self.content_container.add_widget(self.saved_rv)
     
-    def _show_empty_state(self):
-        """Show message when no saved items"""
+    def _create_empty_state(self):
+        """Create message shown when there are no saved items"""
         empty_container = BoxLayout(
             orientation='vertical',
             size_hint_y=None,
@@ -189,7 +302,7 @@ class SavedScreen(BoxLayout):
         empty_container.add_widget(empty_icon)
         empty_container.add_widget(empty_message)
         
-        self.saved_layout.add_widget(empty_container)
+        return empty_container
     
     def _update_empty_bg(self, instance, value):
         """Update empty state background"""
@@ -200,7 +313,6 @@ class SavedScreen(BoxLayout):
     def remove_saved_item(self, obj_data):
         """Remove an item from saved items"""
         self.data_manager.remove_from_saved_items(obj_data)
-        self.refresh_saved_items()
         print(f"Removed saved item: {obj_data.get('title', 'Unknown')}")
     
     def show_item_detail(self, obj_data):
@@ -222,7 +334,10 @@ class SavedScreen(BoxLayout):
             
             if detail_screen:
                 print(f"SavedScreen: Found detail screen, showing object")
-                detail_screen.show_object(obj_data)
+                # The grid only holds a summary - rehydrate the full object for the detail view,
+                # shown at once and refreshed from SARA in the background
+                obj = self.data_manager.get_saved_object(obj_data.get('priref', '')) or obj_data
+                detail_screen.show_stored_object(obj)
                 
                 # Use app navigation to track history
                 from kivy.app import App
@@ -236,5 +351,68 @@ class SavedScreen(BoxLayout):
     def clear_all_saved_items(self, instance):
         """Clear all saved items"""
         self.data_manager.clear_saved_items()
-        self.refresh_saved_items()
         print("Cleared all saved items")
+    
+    def export_saved_items(self, instance):
+        """Export all saved items (with their cached images) to a zip in the transfer folder"""
+        from utils.saved_transfer import new_export_path
+        
+        def export():
+            path = new_export_path('.zip')
+            count = self.data_manager.export_saved_items(path)
+            return f'{count} gemte objekt(er) eksporteret til\n{path}'
+        
+        self._run_transfer(export, 'Eksport fejlede')
+    
+    def import_saved_items(self, instance):
+        """Import the newest export in the transfer folder (already saved objects are skipped)"""
+        from utils.saved_transfer import find_latest_export, get_transfer_dir
+        
+        def import_latest():
+            path = find_latest_export()
+            if path is None:
+                return f'Ingen eksport fundet i\n{get_transfer_dir()}'
+            count = self.data_manager.import_saved_items(path)
+            return f'{count} nye objekt(er) importeret fra\n{os.path.basename(path)}'
+        
+        self._run_transfer(import_latest, 'Import fejlede')
+    
+    def _run_transfer(self, work, error_text):
+        """Run an export/import off the UI thread and show its result"""
+        if self._transfer_running:
+            return
+        self._transfer_running = True
+        self._update_state()
+        
+        def worker():
+            try:
+                message = work()
+            except Exception as e:
+                print(f"SavedScreen: {error_text}: {e}")
+                message = f'{error_text}:\n{e}'
+            Clock.schedule_once(lambda dt: self._on_transfer_done(message), 0)
+        
+        threading.Thread(target=worker, daemon=True).start()
+    
+    def _on_transfer_done(self, message):
+        """UI thread - re-enable the buttons and report the result"""
+        self._transfer_running = False
+        self._update_state()
+        
+        result_popup = ModalView(
+            size_hint=(0.85, None),
+            height=dp(160),
+            background_color=(0, 0, 0, 0.5)
+        )
+        result_label = Label(
+            text=message,
+            font_size='15sp',
+            halign='center',
+            valign='middle',
+            color=(1, 1, 1, 1),
+            padding=[dp(15), dp(15)]
+        )
+        result_label.bind(size=result_label.setter('text_size'))
+        result_popup.add_widget(result_label)
+        result_popup.bind(on_touch_down=lambda popup, touch: popup.dismiss())
+        result_popup.open()
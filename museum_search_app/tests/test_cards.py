@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Smoke tests for the canvas-drawn cards (result grid, saved grid, carousel)
+Builds each card headless and renders its content with and without an image
+"""
+
+import os
+import struct
+import sys
+import zlib
+
+import pytest
+
+os.environ.setdefault('KIVY_NO_ARGS', '1')
+os.environ.setdefault('KIVY_NO_CONSOLELOG', '1')
+os.environ.setdefault('KIVY_GL_BACKEND', 'mock')
+
+pytest.importorskip('kivy')
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def image_path(tmp_path, monkeypatch):
+    """A 1x1 PNG; the working directory is moved to tmp_path (DataManager writes its database there)"""
+    monkeypatch.chdir(tmp_path)
+
+    def chunk(kind, data):
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+    path = tmp_path / 'image.png'
+    path.write_bytes(
+        b'\x89PNG\r\n\x1a\n'
+        + chunk(b'IHDR', struct.pack('>IIBBBBB', 1, 1, 8, 2, 0, 0, 0))
+        + chunk(b'IDAT', zlib.compress(b'\x00\xff\xff\xff'))
+        + chunk(b'IEND', b'')
+    )
+    return str(path)
+
+
+def _assert_rendered(card):
+    assert card._title_label is not None and card._title_label.texture is not None
+    assert card._subtitle_label is not None and card._subtitle_label.texture is not None
+
+
+def _objects(image_path):
+    no_image = {'priref': '1', 'objectNumber': 'DGB-1', 'title': 'Uden billede', 'hasImage': False}
+    with_image = {'priref': '2', 'objectNumber': 'DGB-2', 'title': 'Med billede', 'hasImage': True,
+                  'primaryImage': image_path, 'primaryImageSmall': image_path}
+    return no_image, with_image
+
+
+def test_result_card(image_path):
+    from components.result_card import ResultCard
+
+    for obj in _objects(image_path):
+        card = ResultCard(obj_data=obj)
+        _assert_rendered(card)
+        assert card.image_path == (image_path if obj['hasImage'] else '')
+    assert ResultCard(obj_data=_objects(image_path)[0])._placeholder_label is not None
+
+
+def test_saved_grid_item(image_path):
+    from components.saved_item_grid import SavedGridItem
+
+    for obj in _objects(image_path):
+        card = SavedGridItem(obj_data=obj)  # Renders the remove button in __init__
+        _assert_rendered(card)
+        assert card.remove_text_rect.texture is not None
+
+
+def test_carousel_card(image_path):
+    from components.carousel import CarouselCard
+
+    card = CarouselCard()
+    for obj in _objects(image_path):
+        card.set_item(obj)
+        _assert_rendered(card)
+    assert card.image_path == image_path
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Compact Record for SARA Museum App
+Schema-versioned, compressed storage form of saved objects plus the light summary kept in memory
+"""
+
+import json
+import zlib
+from typing import Dict, Any
+
+
+# Version of the packed format - stored in every record as 'v'
+RECORD_VERSION = 1
+
+# Interned short names for the fields _parse_object_record produces.
+# Fields not listed here are kept under their full name in 'x'.
+FIELD_NAMES = {
+    'priref': 'p',
+    'title': 't',
+    'objectName': 'on',
+    'objectNumber': 'n',
+    'department': 'dp',
+    'classification': 'cl',
+    'description': 'd',
+    'dating': 'da',
+    'currentLocation': 'cl2',
+    'context': 'cx',
+    'location_name': 'ln',
+    'location_context': 'lc',
+    'acquisition_number': 'an',
+    'acquisition_source': 'as',
+    'acquisition_reason': 'ar',
+    'acquisition_date': 'ad',
+    'event_type': 'et',
+    'event_name': 'en',
+    'event_description': 'ed',
+    'craftsman': 'cr',
+    'artistDisplayName': 'ai',
+    'artistDisplayBio': 'ab',
+    'artistNationality': 'na',
+    'objectDate': 'od',
+    'objectBeginDate': 'ob',
+    'objectEndDate': 'oe',
+    'medium': 'me',
+    'technique': 'te',
+    'dimensions': 'di',
+    'culture': 'cu',
+    'imageRefs': 'ir',
+    'deferredImageRefs': 'dr',
+    'primaryImage': 'pi',
+    'primaryImageSmall': 'ps',
+    'primaryImageRef': 'pr',
+    'additionalImages': 'ai2',
+    'images': 'im',
+    'hasImage': 'hi',
+    'isPublicDomain': 'pd',
+    'isHighlight': 'hl',
+    'creditLine': 'cd',
+    'acquisitionYear': 'ay',
+    'repository': 'rp',
+    'objectURL': 'u',
+    'objectID': 'id',
+    'provenance': 'pv',
+    'exhibition_history': 'eh',
+    'bibliography': 'bi',
+    'notes': 'no',
+    'offlinePinned': 'op',
+    'timestamp': 'ts',
+}
+SHORT_NAMES = {short: name for name, short in FIELD_NAMES.items()}
+
+# Values that can be derived from other fields. They are dropped when they match,
+# and the one-letter flag in '~' restores them on unpack.
+DERIVED_FIELDS = (
+    ('objectID', 'i', lambda r: r.get('priref', '')),
+    ('primaryImageSmall', 's', lambda r: r.get('primaryImage', '')),
+    ('images', 'm', lambda r: ([r['primaryImage']] if r.get('primaryImage') else []) + list(r.get('additionalImages', []))),
+    ('hasImage', 'h', lambda r: bool(r.get('primaryImage'))),
+    ('objectEndDate', 'e', lambda r: r.get('objectBeginDate')),
+    ('acquisitionYear', 'y', lambda r: r.get('acquisition_date', '').split('-')[0] if r.get('acquisition_date') else ''),
+    ('objectURL', 'u', lambda r: f"https://sara.dk/object/{r['priref']}" if r.get('priref') else ''),
+    ('provenance', 'p', lambda r: r.get('acquisition_source', '')),
+    ('repository', 'r', lambda r: 'SARA Museum Database'),
+    ('isPublicDomain', 'd', lambda r: True),
+    ('isHighlight', 'l', lambda r: False),
+    ('artistDisplayBio', 'b', lambda r: ''),
+)
+
+# Fields kept in memory for grids and saved-state checks; everything else stays packed
+SUMMARY_FIELDS = ('priref', 'objectNumber', 'title', 'primaryImage', 'primaryImageSmall',
+                  'hasImage', 'offlinePinned', 'timestamp')
+
+
+def pack_record(item: Dict[str, Any]) -> bytes:
+    """Full object dict -> compressed, schema-versioned bytes"""
+    record = {'v': RECORD_VERSION}
+    flags = ''
+    for name, flag, derive in DERIVED_FIELDS:
+        if name in item:
+            try:
+                derived = derive(item)
+                # Same type too - 0 == False and 1 == True, but they must come back as stored
+                if type(item[name]) is type(derived) and item[name] == derived:
+                    flags += flag
+            except Exception:
+                pass
+    dropped = {name for name, flag, _ in DERIVED_FIELDS if flag in flags}
+    if flags:
+        record['~'] = flags
+
+    extra = {}
+    for name, value in item.items():
+        if name in dropped:
+            continue
+        short = FIELD_NAMES.get(name)
+        if short is None:
+            extra[name] = value
+        else:
+            record[short] = value
+    if extra:
+        record['x'] = extra
+
+    data = json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return zlib.compress(data, 6)
+
+
+def unpack_record(blob) -> Dict[str, Any]:
+    """Compressed bytes (or a legacy JSON string) -> full object dict"""
+    if isinstance(blob, str):
+        return json.loads(blob)  # Stored before the compact format
+    record = json.loads(zlib.decompress(blob).decode('utf-8'))
+    version = record.pop('v', 0)
+    if version > RECORD_VERSION:
+        print(f"CompactRecord: record version {version} is newer than {RECORD_VERSION}")
+
+    flags = record.pop('~', '')
+    item = record.pop('x', {})
+    for short, value in record.items():
+        item[SHORT_NAMES.get(short, short)] = value
+    for name, flag, derive in DERIVED_FIELDS:
+        if flag in flags:
+            item[name] = derive(item)
+    return item
+
+
+def make_summary(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Light in-memory form of a saved object (grid, saved-state checks, image healing)"""
+    summary = {name: item[name] for name in SUMMARY_FIELDS if name in item}
+    image_refs = item.get('imageRefs') or []
+    primary_ref = item.get('primaryImageRef') or (image_refs[0] if image_refs else '')
+    if primary_ref:
+        summary['primaryImageRef'] = primary_ref
+    summary['hasImage'] = bool(item.get('hasImage', False))
+    return summary
@@ -4,18 +4,31 @@ Data Manager for SARA Museum App
 Handles data persistence, recent searches, and saved items
 """
 
-import json
-import os
+import threading
 from kivy.clock import Clock
 from typing import List, Dict, Any
 
+from utils.saved_store import SavedItemStore
+from utils.compact_record import make_summary
+
 
 class DataManager:
-    """Manages data persistence for the SARA Museum App (Singleton)"""
+    """
+    Manages data persistence for the SARA Museum App (Singleton)
+    
+    Safe to use from any thread: all state is guarded by one re-entrant lock, and
+    change events are always delivered on the UI thread, after the lock is released.
+    
+    Saved items are kept in memory as light summaries (see utils.compact_record);
+    the full object is loaded from the store with get_saved_object() when opened.
+    """
     
     _instance = None
     _initialized = False
     
+    # Seconds flush() waits for a write in progress (app pause/stop must not hang)
+    FLUSH_TIMEOUT = 5.0
+    
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(DataManager, cls).__new__(cls)
@@ -28,10 +41,22 @@ class DataManager:
             
         DataManager._initialized = True
         
+        self._lock = threading.RLock()
         self.recent_searches = []
         self.saved_items = []
         self.recent_searches_file = 'recent_searches.json'
         self.saved_items_file = 'saved_items.json'
+        self._listeners = []
+        
+        # Lookup tables for saved-state checks (priref -> item, object number -> count)
+        self._saved_by_priref = {}
+        self._saved_number_counts = {}
+        
+        # SQLite store; the JSON files above are migrated into it on first start
+        self.store = SavedItemStore(
+            saved_items_json=self.saved_items_file,
+            recent_searches_json=self.recent_searches_file
+        )
         
         # Load existing data
         self.load_recent_searches()
@@ -39,118 +64,402 @@ class DataManager:
     
     # Recent Searches Management
     def load_recent_searches(self):
-        """Load recent searches from file"""
-        try:
-            if os.path.exists(self.recent_searches_file):
-                with open(self.recent_searches_file, 'r', encoding='utf-8') as f:
-                    self.recent_searches = json.load(f)
-        except Exception as e:
-            print(f"Error loading recent searches: {e}")
-            self.recent_searches = []
+        """Load recent searches from the store"""
+        with self._lock:
+            try:
+                self.recent_searches = self.store.load_recent_searches()
+            except Exception as e:
+                print(f"Error loading recent searches: {e}")
+                self.recent_searches = []
     
     def save_recent_searches(self):
-        """Save recent searches to file"""
-        try:
-            with open(self.recent_searches_file, 'w', encoding='utf-8') as f:
-                json.dump(self.recent_searches, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            print(f"Error saving recent searches: {e}")
+        """Save the whole recent searches list to the store"""
+        with self._lock:
+            try:
+                self.store.replace_recent_searches(self.recent_searches)
+            except Exception as e:
+                print(f"Error saving recent searches: {e}")
     
     def add_to_recent_searches(self, obj: Dict[str, Any]):
         """Add object to recent searches"""
-        # Remove duplicates based on object number
-        obj_number = obj.get('objectNumber', obj.get('NB', ''))
-        self.recent_searches = [item for item in self.recent_searches 
-                              if item.get('objectNumber', item.get('NB', '')) != obj_number]
+        with self._lock:
+            # Remove duplicates based on object number
+            obj_number = obj.get('objectNumber', obj.get('NB', ''))
+            self.recent_searches = [item for item in self.recent_searches
+                                  if item.get('objectNumber', item.get('NB', '')) != obj_number]
         
-        # Add to top with proper image mapping
-        search_item = {
-            'title': obj.get('title', obj.get('TI', 'No title')),
-            'objectNumber': obj_number,
-            'primaryImage': obj.get('primaryImage', ''),
-            'hasImage': obj.get('hasImage', False),
-            'timestamp': Clock.get_time()
-        }
+            # Add to top with proper image mapping
+            image_refs = obj.get('imageRefs') or []
+            search_item = {
+                'title': obj.get('title', obj.get('TI', 'No title')),
+                'objectNumber': obj_number,
+                'priref': obj.get('priref', ''),
+                'primaryImage': obj.get('primaryImage', ''),
+                # Stable reproduction reference - the cached file may be evicted
+                'primaryImageRef': image_refs[0] if image_refs else '',
+                'hasImage': obj.get('hasImage', False) or bool(image_refs),
+                'timestamp': Clock.get_time()
+            }
         
-        self.recent_searches.insert(0, search_item)
+            self.recent_searches.insert(0, search_item)
         
-        # Keep only the latest 10
-        self.recent_searches = self.recent_searches[:10]
+            # Keep only the latest 10
+            self.recent_searches = self.recent_searches[:10]
         
-        # Save to file
-        self.save_recent_searches()
+            # Only the new entry is queued (with the full object, shown again on a tap)
+            try:
+                self.store.put_recent_search(search_item, keep=10, obj=obj)
+            except Exception as e:
+                print(f"Error saving recent searches: {e}")
+        
+        self._notify('recent_changed', 0, search_item)
     
     def get_recent_searches(self) -> List[Dict[str, Any]]:
-        """Get list of recent searches"""
-        return self.recent_searches
+        """Get list of recent searches (a snapshot - later changes arrive as events)"""
+        with self._lock:
+            return list(self.recent_searches)
+    
+    def update_recent_object(self, obj: Dict[str, Any]):
+        """Replace the stored full object of a recent search (e.g. once its images are downloaded)"""
+        priref = obj.get('priref', '')
+        with self._lock:
+            entry = next((item for item in self.recent_searches
+                          if priref and item.get('priref', '') == priref), None)
+            if entry is None:
+                return
+            try:
+                self.store.put_recent_object(entry.get('objectNumber', ''), obj)
+            except Exception as e:
+                print(f"Error saving recent searches: {e}")
+    
+    def get_stored_object(self, item: Dict[str, Any]):
+        """Full stored copy of a recent search or saved item (saved copy first), or None"""
+        priref = item.get('priref', '')
+        if not priref:
+            return None
+        obj = self.get_saved_object(priref)
+        if obj is None:
+            try:
+                obj = self.store.get_recent_object(item.get('objectNumber', ''))
+            except Exception as e:
+                print(f"Error loading recent search object: {e}")
+        if obj is None or obj.get('priref', '') != priref:
+            return None
+        return obj
+    
+    def store_refreshed_object(self, obj: Dict[str, Any]):
+        """Persist a re-fetched object wherever it is stored (saved items, recent searches)"""
+        priref = obj.get('priref', '')
+        if self.is_item_saved_by_priref(priref):
+            self.update_saved_item(obj)
+        
+        recent_changed = False
+        with self._lock:
+            for index, item in enumerate(self.recent_searches):
+                if priref and item.get('priref', '') == priref:
+                    title = obj.get('title', item.get('title', ''))
+                    if item.get('title') != title:
+                        # A new dict, so views comparing by identity rebind it
+                        self.recent_searches[index] = dict(item, title=title)
+                        recent_changed = True
+            if recent_changed:
+                self.save_recent_searches()
+        self.update_recent_object(obj)
+        if recent_changed:
+            self._notify('recent_changed')
     
     def clear_recent_searches(self):
         """Clear all recent searches"""
-        self.recent_searches = []
-        self.save_recent_searches()
+        with self._lock:
+            self.recent_searches = []
+            self.save_recent_searches()
+        self._notify('recent_changed')
+    
+    # Change notifications
+    def add_listener(self, callback):
+        """
+        Add a callback(event, index, item) that is called on the UI thread after data changes
+
+        Saved item events: 'saved_added' (inserted at index), 'saved_removed' (removed
+        from index), 'saved_updated' (replaced at index), 'saved_moved' (moved from
+        index to the front), 'saved_cleared' and 'saved_reloaded' (the whole list was
+        replaced, e.g. after an import; index and item are None).
+        Recent searches: 'recent_changed' (item is the new front entry, or None when
+        entries were changed or cleared).
+        """
+        with self._lock:
+            if callback not in self._listeners:
+                self._listeners.append(callback)
+    
+    def remove_listener(self, callback):
+        """Remove a previously added listener"""
+        with self._lock:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
+    
+    def _notify(self, event, index=None, item=None):
+        """Call listeners with a single change - on the UI thread"""
+        if threading.current_thread() is not threading.main_thread():
+            Clock.schedule_once(lambda dt: self._notify(event, index, item), 0)
+            return
+        with self._lock:
+            listeners = list(self._listeners)
+        for callback in listeners:
+            try:
+                callback(event, index, item)
+            except Exception as e:
+                print(f"DataManager: listener error: {e}")
     
     # Saved Items Management
     def load_saved_items(self):
-        """Load saved items from file"""
-        try:
-            if os.path.exists(self.saved_items_file):
-                with open(self.saved_items_file, 'r', encoding='utf-8') as f:
-                    self.saved_items = json.load(f)
-            else:
+        """Load saved item summaries from the store"""
+        with self._lock:
+            try:
+                self.saved_items = self.store.load_saved_items()
+            except Exception as e:
+                print(f"Error loading saved items: {e}")
                 self.saved_items = []
-        except Exception as e:
-            print(f"Error loading saved items: {e}")
-            self.saved_items = []
+            self._rebuild_saved_lookup()
     
-    def save_saved_items(self):
-        """Save saved items to file"""
-        try:
-            with open(self.saved_items_file, 'w', encoding='utf-8') as f:
-                json.dump(self.saved_items, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            print(f"Error saving saved items: {e}")
+    def _rebuild_saved_lookup(self):
+        self._saved_by_priref = {}
+        self._saved_number_counts = {}
+        for item in self.saved_items:
+            self._track_saved(item)
+    
+    def _track_saved(self, item):
+        self._saved_by_priref[item.get('priref', '')] = item
+        obj_number = item.get('objectNumber', '')
+        self._saved_number_counts[obj_number] = self._saved_number_counts.get(obj_number, 0) + 1
+    
+    def _untrack_saved(self, item):
+        self._saved_by_priref.pop(item.get('priref', ''), None)
+        obj_number = item.get('objectNumber', '')
+        count = self._saved_number_counts.get(obj_number, 0) - 1
+        if count > 0:
+            self._saved_number_counts[obj_number] = count
+        else:
+            self._saved_number_counts.pop(obj_number, None)
     
     def add_to_saved_items(self, obj: Dict[str, Any]):
         """Add object to saved items"""
-        # Remove duplicates based on priref (unique ID) instead of object number
+        # Items are keyed by priref (unique ID) instead of object number
         obj_priref = obj.get('priref', '')
-        if obj_priref:
-            self.saved_items = [item for item in self.saved_items 
-                               if item.get('priref', '') != obj_priref]
+        if not obj_priref:
+            print("DataManager: cannot save an object without priref")
+            return
         
-        # Add complete object data to saved items
-        saved_item = dict(obj)  # Copy all data from the original object
-        saved_item['timestamp'] = Clock.get_time()
+        with self._lock:
+            old_index = self._find_saved_index(obj_priref)
+            if old_index is not None:
+                self._untrack_saved(self.saved_items.pop(old_index))
         
-        self.saved_items.insert(0, saved_item)
+            # Complete object data goes to the store, the summary stays in memory
+            full_item = dict(obj)  # Copy all data from the original object
+            full_item['timestamp'] = Clock.get_time()
+            saved_item = make_summary(full_item)
         
-        # Save to file
-        self.save_saved_items()
+            self.saved_items.insert(0, saved_item)
+            self._track_saved(saved_item)
+            
+            # Queue only this row; the background writer stores it
+            try:
+                self.store.put_saved_item(full_item, to_front=True)
+            except Exception as e:
+                print(f"Error saving saved items: {e}")
+        
+        if old_index is None:
+            self._notify('saved_added', 0, saved_item)
+        else:
+            self._notify('saved_moved', old_index, saved_item)
+    
+    def update_saved_item(self, obj: Dict[str, Any]):
+        """Replace the stored data of an already saved item (keeps its position)"""
+        with self._lock:
+            index = self._find_saved_index(obj.get('priref', ''))
+            if index is None:
+                return False
+            full_item = dict(obj)
+            full_item['timestamp'] = self.saved_items[index].get('timestamp', Clock.get_time())
+            updated_item = make_summary(full_item)
+            self._untrack_saved(self.saved_items[index])
+            self.saved_items[index] = updated_item
+            self._track_saved(updated_item)
+            self._store_saved_row(full_item)
+        self._notify('saved_updated', index, updated_item)
+        return True
     
     def remove_from_saved_items(self, obj: Dict[str, Any]):
         """Remove object from saved items"""
         # Remove based on priref (unique ID) instead of object number
         obj_priref = obj.get('priref', '')
-        if obj_priref:
-            self.saved_items = [item for item in self.saved_items 
-                               if item.get('priref', '') != obj_priref]
-        self.save_saved_items()
+        if not obj_priref:
+            return
+        # Remove the offline pack together with the saved item
+        from utils.offline_packs import OfflinePackManager
+        OfflinePackManager().unpin(obj_priref)
+        
+        with self._lock:
+            index = self._find_saved_index(obj_priref)
+            if index is None:
+                return
+            removed_item = self.saved_items.pop(index)
+            self._untrack_saved(removed_item)
+            try:
+                self.store.delete_saved_item(obj_priref)
+            except Exception as e:
+                print(f"Error saving saved items: {e}")
+        self._notify('saved_removed', index, removed_item)
+    
+    def _store_saved_row(self, item):
+        """Write one changed saved item, keeping its position"""
+        try:
+            self.store.put_saved_item(item, to_front=False)
+        except Exception as e:
+            print(f"Error saving saved items: {e}")
+    
+    def _find_saved_index(self, priref: str):
+        """Position of a saved item by priref, or None (O(1) when it is not saved)"""
+        item = self._saved_by_priref.get(priref) if priref else None
+        if item is None:
+            return None
+        for index, saved_item in enumerate(self.saved_items):
+            if saved_item is item:
+                return index
+        return None
     
     def get_saved_items(self) -> List[Dict[str, Any]]:
-        """Get list of saved items"""
-        return self.saved_items
+        """Get list of saved items (a snapshot - later changes arrive as events)"""
+        with self._lock:
+            return list(self.saved_items)
+    
+    def get_saved_count(self) -> int:
+        """Number of saved items"""
+        with self._lock:
+            return len(self.saved_items)
+    
+    def get_saved_item(self, priref: str):
+        """Saved item summary by priref, or None"""
+        with self._lock:
+            return self._saved_by_priref.get(priref) if priref else None
+    
+    def get_saved_object(self, priref: str):
+        """Full saved object by priref (unpacked from the store), or None"""
+        if not self.is_item_saved_by_priref(priref):
+            return None
+        try:
+            return self.store.get_saved_item(priref)
+        except Exception as e:
+            print(f"Error loading saved item {priref}: {e}")
+            return None
+    
+    def search_saved_items(self, query: str) -> List[Dict[str, Any]]:
+        """Saved items matching a free-text query, best match first (all items for an empty query)"""
+        if not query.strip():
+            return self.get_saved_items()
+        try:
+            prirefs = self.store.search_saved(query)
+        except Exception as e:
+            print(f"Error searching saved items: {e}")
+            return []
+        with self._lock:
+            return [self._saved_by_priref[priref] for priref in prirefs if priref in self._saved_by_priref]
     
     def is_item_saved(self, obj_number: str) -> bool:
         """Check if an item is saved by object number (may return True for multiple items with same number)"""
-        return any(item.get('objectNumber', '') == obj_number 
-                  for item in self.saved_items)
+        with self._lock:
+            return obj_number in self._saved_number_counts
     
     def is_item_saved_by_priref(self, priref: str) -> bool:
         """Check if a specific item is saved by priref (unique check)"""
-        return any(item.get('priref', '') == priref 
-                  for item in self.saved_items)
+        with self._lock:
+            return bool(priref) and priref in self._saved_by_priref
+    
+    def update_image_path(self, reference: str, field: str, local_path: str, priref: str = ''):
+        """Store a re-fetched image path on recent searches and saved items showing it"""
+        from utils.image_fetcher import get_primary_image_ref
+        
+        def matches(item):
+            if reference and get_primary_image_ref(item) == reference:
+                return True
+            return bool(priref) and item.get('priref', '') == priref
+        
+        def updated(item):
+            # Items are replaced, not changed in place - views compare them by identity
+            new_item = dict(item)
+            new_item[field] = local_path
+            if reference and not new_item.get('primaryImageRef'):
+                new_item['primaryImageRef'] = reference
+            return new_item
+        
+        with self._lock:
+            recent_changed = False
+            for index, item in enumerate(self.recent_searches):
+                if matches(item):
+                    self.recent_searches[index] = updated(item)
+                    recent_changed = True
+        
+            saved_changed = []
+            for index, item in enumerate(self.saved_items):
+                if matches(item):
+                    new_item = updated(item)
+                    self._untrack_saved(item)
+                    self.saved_items[index] = new_item
+                    self._track_saved(new_item)
+                    saved_changed.append((index, new_item))
+            
+            if recent_changed:
+                self.save_recent_searches()
+            for index, item in saved_changed:
+                # Only the changed fields - the packed record is updated by the writer
+                changes = {field: local_path}
+                if item.get('primaryImageRef'):
+                    changes['primaryImageRef'] = item['primaryImageRef']
+                try:
+                    self.store.update_saved_fields(item['priref'], changes)
+                except Exception as e:
+                    print(f"Error saving saved items: {e}")
+        
+        if recent_changed:
+            self._notify('recent_changed')
+        for index, item in saved_changed:
+            self._notify('saved_updated', index, item)
+    
+    def export_saved_items(self, path: str) -> int:
+        """Write all saved items to a .jsonl, .csv or .zip (with cached images) file - slow, call off the UI thread"""
+        from utils.saved_transfer import export_saved
+        return export_saved(self.store, path)
+    
+    def import_saved_items(self, path: str) -> int:
+        """Add the items of an exported .jsonl or .zip file (known prirefs are skipped) - slow, call off the UI thread"""
+        from utils.saved_transfer import import_saved
+        try:
+            imported = import_saved(self.store, path)
+        finally:
+            # Also after an interruption - the committed batches are saved
+            self.load_saved_items()
+            self._notify('saved_reloaded')
+        return imported
+    
+    def flush(self):
+        """Write all pending changes to storage now (app pause/stop)"""
+        try:
+            self.store.flush(timeout=self.FLUSH_TIMEOUT)
+        except Exception as e:
+            print(f"Error flushing data: {e}")
     
     def clear_saved_items(self):
         """Clear all saved items"""
-        self.saved_items = []
-        self.save_saved_items()
\ No newline at end of file
+        from utils.offline_packs import OfflinePackManager
+        pack_manager = OfflinePackManager()
+        with self._lock:
+            cleared_items = self.saved_items
+            self.saved_items = []
+            self._rebuild_saved_lookup()
+            try:
+                self.store.clear_saved_items()
+            except Exception as e:
+                print(f"Error saving saved items: {e}")
+        for item in cleared_items:
+            pack_manager.unpin(item.get('priref', ''))
+        self._notify('saved_cleared')
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Detail View Model for SARA Museum App
+Turns a parsed object into an immutable, ready-to-render display model for DetailScreen
+"""
+
+import threading
+from typing import Dict, Any, NamedTuple, Optional, Tuple
+from kivy.clock import Clock
+from kivy.metrics import dp
+
+
+# Upper limit for one description label - keeps each text texture small
+DESCRIPTION_CHUNK_CHARS = 600
+
+
+class InfoCardModel(NamedTuple):
+    """Text and size of one optional info card"""
+    key: str  # 'location', 'acquisition', 'provenance' or 'craftsman'
+    title: str
+    text: str
+    content_height: float
+    total_height: float
+
+
+class DetailViewModel(NamedTuple):
+    """Everything DetailScreen shows for an object - all strings and visibility decided"""
+    priref: str
+    title: str
+    object_number: str
+    description: str
+    description_chunks: Tuple[str, ...]  # Paragraph-sized pieces, one label each
+    images: Tuple[Optional[str], ...]  # None for deferred (data-saver) reproductions
+    deferred_refs: Tuple[Tuple[int, str], ...]  # (image index, reproduction reference)
+    info_cards: Tuple[InfoCardModel, ...]  # Only cards with content, in display order
+
+
+def estimate_info_card_heights(content: str) -> Tuple[float, float]:
+    """Content and total height of an info card"""
+    # Calculate dynamic height based on content length with tighter sizing
+    estimated_lines = max(1, len(content) // 70 + content.count('\n'))
+    content_height = min(dp(120), dp(16 * estimated_lines + 20))  # Tighter line height
+    total_height = dp(24) + content_height + dp(20)  # Title + content + minimal padding
+    return content_height, total_height
+
+
+def split_text_chunks(text: str, max_chars: int = DESCRIPTION_CHUNK_CHARS) -> Tuple[str, ...]:
+    """
+    Split text into paragraph-sized chunks of at most max_chars
+
+    Long paragraphs are cut at a sentence end (or a space), short neighbouring
+    paragraphs are merged so there are not many tiny labels.
+    """
+    pieces = []
+    for paragraph in text.split('\n'):
+        paragraph = paragraph.strip()
+        while len(paragraph) > max_chars:
+            cut = paragraph.rfind('. ', 0, max_chars) + 1  # Keep the period
+            if cut < max_chars // 2:
+                cut = paragraph.rfind(' ', 0, max_chars)
+            if cut <= 0:
+                cut = max_chars
+            pieces.append(paragraph[:cut].strip())
+            paragraph = paragraph[cut:].strip()
+        if paragraph:
+            pieces.append(paragraph)
+
+    chunks = []
+    for piece in pieces:
+        if chunks and len(chunks[-1]) + len(piece) + 2 <= max_chars:
+            chunks[-1] = chunks[-1] + '\n\n' + piece
+        else:
+            chunks.append(piece)
+    return tuple(chunks) or (text,)
+
+
+def _info_card(key: str, title: str, lines) -> Optional[InfoCardModel]:
+    """Info card model for labelled lines, or None if all values are empty"""
+    text = "\n".join(f"[b]{label}:[/b] {value}" for label, value in lines if value)
+    if not text:
+        return None
+    content_height, total_height = estimate_info_card_heights(text)
+    return InfoCardModel(key, title, text, content_height, total_height)
+
+
+def build_detail_view_model(obj: Dict[str, Any]) -> DetailViewModel:
+    """Build the display model for an object (safe to call from a worker thread)"""
+    # Images: primary + additional, deferred reproductions kept as None until tapped
+    images = ()
+    deferred_refs = ()
+    primary_image_url = obj.get('primaryImage', '')
+    if obj.get('hasImage', False) and primary_image_url:
+        additional_images = obj.get('additionalImages', [])
+        deferred_image_refs = obj.get('deferredImageRefs', [])
+        images = tuple([primary_image_url] + list(additional_images) + [None] * len(deferred_image_refs))
+        first_deferred = 1 + len(additional_images)
+        deferred_refs = tuple((first_deferred + i, ref) for i, ref in enumerate(deferred_image_refs))
+
+    # Main info card - the description is rendered in chunks
+    description = obj.get('description', 'Ingen beskrivelse tilgængelig')
+
+    # Dedicated cards for the new API fields
+    cards = (
+        _info_card('location', "Placering", (
+            ("Navn", obj.get('location_name', '')),
+            ("Kontekst", obj.get('location_context', '')),
+        )),
+        _info_card('acquisition', "Accession", (
+            ("Accession nr.", obj.get('acquisition_number', '')),
+            ("Giver", obj.get('acquisition_source', '')),
+            ("Begrundelse", obj.get('acquisition_reason', '')),
+            ("Dato", obj.get('acquisition_date', '')),
+        )),
+        _info_card('provenance', "Proveniens", (
+            ("Type", obj.get('event_type', '')),
+            ("Betegnelse", obj.get('event_name', '')),
+            ("Beskrivelse", obj.get('event_description', '')),
+        )),
+        _info_card('craftsman', "Ophavsmand", (
+            ("Ophavsmand", obj.get('craftsman', '')),
+        )),
+    )
+
+    return DetailViewModel(
+        priref=obj.get('priref', ''),
+        title=obj.get('title', 'Ingen titel'),
+        object_number=obj.get('objectNumber', 'Ukendt'),
+        description=description,
+        description_chunks=split_text_chunks(description),
+        images=images,
+        deferred_refs=deferred_refs,
+        info_cards=tuple(card for card in cards if card is not None),
+    )
+
+
+def prepare_detail_view_model(obj: Dict[str, Any], callback):
+    """
+    Build the display model on a worker thread
+
+    Args:
+        obj: Parsed object dict
+        callback: Called on the UI thread with (obj, model); model is None on failure
+    """
+    def worker():
+        model = None
+        try:
+            model = build_detail_view_model(obj)
+        except Exception as e:
+            print(f"DetailViewModel: could not prepare {obj.get('priref', '')}: {e}")
+        Clock.schedule_once(lambda dt: callback(obj, model), 0)
+
+    threading.Thread(target=worker, daemon=True).start()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Image Cache for SARA Museum App
+Location and size management of the downloaded reproduction cache (temp_images)
+"""
+
+import os
+from pathlib import Path
+from kivy.app import App
+
+
+# Total on-device budget for images: offline packs + cache
+STORAGE_QUOTA_BYTES = 500 * 1024 * 1024
+# The cache is never trimmed below this, even if packs use most of the quota
+MIN_CACHE_BYTES = 50 * 1024 * 1024
+
+
+def get_data_dir() -> Path:
+    """App data directory (works on Android), cwd when running without an app"""
+    app_instance = App.get_running_app()
+    if app_instance:
+        return Path(app_instance.user_data_dir)
+    # Fallback for test uden app
+    return Path.cwd()
+
+
+def get_cache_dir() -> Path:
+    """Directory for downloaded reproductions that may be evicted"""
+    cache_dir = get_data_dir() / "temp_images"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def get_directory_size(directory: Path) -> int:
+    """Total size in bytes of all files below a directory"""
+    total = 0
+    for root, dirs, files in os.walk(directory):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+def trim_cache(max_bytes: int) -> int:
+    """
+    Evict least recently used cached images until the cache fits in max_bytes.
+    Offline packs live outside temp_images and are never touched.
+
+    Returns:
+        Number of bytes freed
+    """
+    cache_dir = get_cache_dir()
+    entries = []
+    total = 0
+    for entry in os.scandir(cache_dir):
+        if not entry.is_file():
+            continue
+        stat = entry.stat()
+        entries.append((max(stat.st_atime, stat.st_mtime), stat.st_size, entry.path))
+        total += stat.st_size
+
+    freed = 0
+    for _, size, path in sorted(entries):
+        if total - freed <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            freed += size
+        except OSError as e:
+            print(f"ImageCache: could not evict {path}: {e}")
+
+    if freed:
+        print(f"ImageCache: evicted {freed // 1024} kB from temp_images")
+    return freed
+
+
+def enforce_storage_quota(pinned_bytes: int) -> int:
+    """Trim tiles and cache so cache + tile pyramids + offline packs stay within the storage quota"""
+    from utils.tile_pyramid import trim_tiles, get_tiles_bytes, TILE_CACHE_BYTES
+    
+    budget = max(MIN_CACHE_BYTES, STORAGE_QUOTA_BYTES - pinned_bytes)
+    # Tiles can be rebuilt from the cached reproduction - they get at most half
+    freed = trim_tiles(min(TILE_CACHE_BYTES, budget // 2))
+    return freed + trim_cache(max(MIN_CACHE_BYTES, budget - get_tiles_bytes()))
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Image Fetcher for SARA Museum App
+Background, prioritized re-fetching of reproductions whose cache files are missing
+"""
+
+import itertools
+import os
+import queue
+import threading
+from typing import Dict, Any, Optional
+from kivy.app import App
+from kivy.clock import Clock
+
+
+PRIORITY_HIGH = 0
+PRIORITY_LOW = 10
+
+# Prirefs whose images a search is about to download -> number of searches.
+# Their missing images are not healed meanwhile; update_image_path fills them in.
+_pending_downloads = {}
+_pending_lock = threading.Lock()
+
+
+def mark_download_pending(priref: str):
+    """A search will download this object's images (call unmark_download_pending when done)"""
+    if not priref:
+        return
+    with _pending_lock:
+        _pending_downloads[priref] = _pending_downloads.get(priref, 0) + 1
+
+
+def unmark_download_pending(priref: str):
+    """The search download of this object's images finished, failed or was cancelled"""
+    with _pending_lock:
+        count = _pending_downloads.get(priref, 0) - 1
+        if count > 0:
+            _pending_downloads[priref] = count
+        else:
+            _pending_downloads.pop(priref, None)
+
+
+def is_download_pending(priref: str) -> bool:
+    with _pending_lock:
+        return priref in _pending_downloads
+
+
+def get_primary_image_ref(item: Dict[str, Any]) -> str:
+    """Stable reproduction reference of an item's primary image"""
+    if item.get('primaryImageRef'):
+        return item['primaryImageRef']
+    image_refs = item.get('imageRefs') or []
+    return image_refs[0] if image_refs else ''
+
+
+def get_display_image(item: Dict[str, Any]) -> str:
+    """Best existing local file for grid/carousel display, or '' if none is cached"""
+    for field in ('primaryImageSmall', 'primaryImage'):
+        path = item.get(field, '')
+        if path and os.path.exists(path):
+            return path
+    return ''
+
+
+def resolve_display_image(item: Dict[str, Any], on_ready) -> str:
+    """
+    Local path for an item's grid image. If the cache file is gone, a low-priority
+    background re-fetch is started and on_ready(path) is called on the UI thread
+    when it is done. Nothing blocks the caller. While a search is downloading the
+    item's images nothing is fetched - the search result arrives via update_image_path.
+    """
+    path = get_display_image(item)
+    if path:
+        return path
+
+    reference = get_primary_image_ref(item)
+    priref = item.get('priref', '')
+    if not reference and not priref:
+        return ''
+    if is_download_pending(priref):
+        return ''
+
+    def healed(local_path, healed_reference):
+        if not local_path:
+            return
+        from utils.data_manager import DataManager
+        item['primaryImageSmall'] = local_path
+        DataManager().update_image_path(healed_reference, 'primaryImageSmall', local_path, priref=priref)
+        on_ready(local_path)
+
+    ImageFetcher().request(reference, healed, thumbnail=True, priority=PRIORITY_LOW, priref=priref)
+    return ''
+
+
+class ImageFetcher:
+    """Single background worker that downloads reproductions by reference (Singleton)"""
+
+    _instance = None
+    _initialized = False
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(ImageFetcher, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        # Only initialize once
+        if ImageFetcher._initialized:
+            return
+
+        ImageFetcher._initialized = True
+
+        self._queue = queue.PriorityQueue()
+        self._order = itertools.count()  # FIFO within the same priority
+        self._callbacks = {}  # (reference or priref key, thumbnail) -> callbacks
+        self._lock = threading.Lock()
+        self._worker = None
+
+    def request(self, reference: str, callback, thumbnail: bool = False,
+                priority: int = PRIORITY_LOW, priref: str = ''):
+        """
+        Queue a download. callback(local_path, reference) runs on the UI thread;
+        local_path is None on failure. Without a reference, the object's references
+        are looked up by priref first (items stored before references were kept).
+        """
+        key = (reference or f'priref:{priref}', thumbnail)
+        with self._lock:
+            if key in self._callbacks:
+                self._callbacks[key].append(callback)
+                return
+            self._callbacks[key] = [callback]
+            self._queue.put((priority, next(self._order), key, reference, priref, thumbnail))
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, daemon=True)
+                self._worker.start()
+
+    def _run(self):
+        """Worker loop"""
+        while True:
+            priority, _, key, reference, priref, thumbnail = self._queue.get()
+            local_path = None
+            try:
+                reference = reference or self._lookup_reference(priref)
+                if reference:
+                    local_path = self._download(reference, thumbnail)
+            except Exception as e:
+                print(f"ImageFetcher: fetching {key[0]} failed: {e}")
+
+            with self._lock:
+                callbacks = self._callbacks.pop(key, [])
+            Clock.schedule_once(
+                lambda dt, cbs=callbacks, path=local_path, ref=reference: self._dispatch(cbs, path, ref), 0
+            )
+
+    def _dispatch(self, callbacks, local_path, reference):
+        for callback in callbacks:
+            try:
+                callback(local_path, reference)
+            except Exception as e:
+                print(f"ImageFetcher: callback error: {e}")
+
+    def _get_api(self):
+        app = App.get_running_app()
+        return getattr(app, 'sara_api', None)
+
+    def _lookup_reference(self, priref: str) -> Optional[str]:
+        """Find the primary reproduction reference of an object by priref"""
+        sara_api = self._get_api()
+        if not sara_api or not priref:
+            return None
+        record = sara_api.get_object_detail(priref, download_images=False)
+        image_refs = record.get('imageRefs', []) if record else []
+        return image_refs[0] if image_refs else None
+
+    def _download(self, reference: str, thumbnail: bool) -> Optional[str]:
+        sara_api = self._get_api()
+        if not sara_api:
+            return None
+        return sara_api.download_image_by_reference(reference, thumbnail=thumbnail)
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Navigation History for SARA Museum App
+History entries with lightweight screen snapshots, so back navigation restores from memory
+"""
+
+from typing import Any, Dict, List, NamedTuple, Optional
+
+
+class HistoryEntry(NamedTuple):
+    """One entry in the app's navigation stack"""
+    screen_name: str
+    snapshot: Any = None  # Screen specific snapshot, captured when the screen is left
+
+
+class ResultsSnapshot(NamedTuple):
+    """State of ResultsScreen - references only, nothing is copied"""
+    query: str
+    results: List[Dict[str, Any]]  # The result list itself (streaming searches keep appending to it)
+    rv_data: List[Dict[str, Any]]  # RecycleView data bound to those results
+    scroll_y: float
+
+
+class DetailSnapshot(NamedTuple):
+    """State of DetailScreen - the prepared view model is reused, not rebuilt"""
+    obj: Dict[str, Any]
+    result_list: List[Dict[str, Any]]
+    result_index: Optional[int]
+    view_model: Any  # DetailViewModel (None if it was not ready yet)
+    image_index: int
+    scroll_y: float
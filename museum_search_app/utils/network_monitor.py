@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Network Monitor for SARA Museum App
+Measures connection throughput, counts transferred bytes and controls data-saver mode
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Optional
+from kivy.clock import Clock
+
+
+class NetworkMonitor:
+    """Tracks transfer throughput and per-session data usage (Singleton)"""
+
+    _instance = None
+    _initialized = False
+
+    # Saver mode turns on automatically below this throughput (kB/s)
+    SAVER_THRESHOLD_KBPS = 150
+    # Number of recent transfers used for the throughput estimate
+    SAMPLE_WINDOW = 8
+    # Smaller transfers are dominated by latency and say little about bandwidth
+    MIN_SAMPLE_BYTES = 16 * 1024
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(NetworkMonitor, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        # Only initialize once
+        if NetworkMonitor._initialized:
+            return
+
+        NetworkMonitor._initialized = True
+
+        self._lock = threading.Lock()
+        self._samples = deque(maxlen=self.SAMPLE_WINDOW)  # (bytes, seconds)
+        self.session_bytes = 0
+        self.forced_saver_mode = None  # None = automatic, True/False = manual override
+        self._listeners = []
+        self._notify_scheduled = False
+
+    def start_timer(self) -> float:
+        """Return a start timestamp for a transfer"""
+        return time.monotonic()
+
+    def record_transfer(self, num_bytes: int, started_at: float):
+        """Record a finished transfer (callable from any thread)"""
+        seconds = max(time.monotonic() - started_at, 0.001)
+        with self._lock:
+            self.session_bytes += num_bytes
+            if num_bytes >= self.MIN_SAMPLE_BYTES:
+                self._samples.append((num_bytes, seconds))
+        self._schedule_notify()
+
+    def get_throughput_kbps(self) -> Optional[float]:
+        """Estimated throughput in kB/s from recent transfers, or None if unknown"""
+        with self._lock:
+            if not self._samples:
+                return None
+            total_bytes = sum(sample[0] for sample in self._samples)
+            total_seconds = sum(sample[1] for sample in self._samples)
+        return (total_bytes / 1024.0) / total_seconds
+
+    def is_saver_mode(self) -> bool:
+        """Check if data-saver mode is active (manual override or slow connection)"""
+        if self.forced_saver_mode is not None:
+            return self.forced_saver_mode
+        throughput = self.get_throughput_kbps()
+        return throughput is not None and throughput < self.SAVER_THRESHOLD_KBPS
+
+    def set_saver_mode(self, enabled: Optional[bool]):
+        """Force saver mode on/off, or None to return to automatic mode"""
+        self.forced_saver_mode = enabled
+        self._schedule_notify()
+
+    def is_on_wifi(self) -> bool:
+        """True on Wi-Fi or ethernet (Android ConnectivityManager); always True off Android"""
+        try:
+            from jnius import autoclass
+        except ImportError:
+            return True  # Desktop - no metered connections to protect
+        try:
+            PythonActivity = autoclass('org.kivy.android.PythonActivity')
+            Context = autoclass('android.content.Context')
+            manager = PythonActivity.mActivity.getSystemService(Context.CONNECTIVITY_SERVICE)
+
+            if autoclass('android.os.Build$VERSION').SDK_INT < 23:
+                # getActiveNetwork() needs API 23 - older devices (minapi 21) use NetworkInfo
+                ConnectivityManager = autoclass('android.net.ConnectivityManager')
+                info = manager.getActiveNetworkInfo()
+                return info is not None and info.isConnected() and info.getType() in (
+                    ConnectivityManager.TYPE_WIFI, ConnectivityManager.TYPE_ETHERNET
+                )
+
+            NetworkCapabilities = autoclass('android.net.NetworkCapabilities')
+            network = manager.getActiveNetwork()
+            if network is None:
+                return False
+            capabilities = manager.getNetworkCapabilities(network)
+            return capabilities is not None and (
+                capabilities.hasTransport(NetworkCapabilities.TRANSPORT_WIFI) or
+                capabilities.hasTransport(NetworkCapabilities.TRANSPORT_ETHERNET)
+            )
+        except Exception as e:
+            print(f"NetworkMonitor: could not read connection type: {e}")
+            return False
+
+    def get_session_bytes(self) -> int:
+        """Get number of bytes transferred in this session"""
+        with self._lock:
+            return self.session_bytes
+
+    def format_session_bytes(self) -> str:
+        """Human readable bytes-transferred counter"""
+        num_bytes = self.get_session_bytes()
+        if num_bytes < 1024 * 1024:
+            return f"{num_bytes / 1024:.0f} kB"
+        return f"{num_bytes / (1024 * 1024):.1f} MB".replace('.', ',')
+
+    def add_listener(self, callback):
+        """Add a callback(monitor) that is called on the UI thread when stats change"""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        """Remove a previously added listener"""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _schedule_notify(self):
+        """Coalesce notifications so bursts of transfers only update the UI once"""
+        with self._lock:
+            if self._notify_scheduled:
+                return
+            self._notify_scheduled = True
+        Clock.schedule_once(self._notify_listeners, 0.5)
+
+    def _notify_listeners(self, dt):
+        """Call listeners on the UI thread"""
+        with self._lock:
+            self._notify_scheduled = False
+        for callback in list(self._listeners):
+            try:
+                callback(self)
+            except Exception as e:
+                print(f"NetworkMonitor: listener error: {e}")
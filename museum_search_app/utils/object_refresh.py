@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Object Refresh for SARA Museum App
+Stale-while-revalidate: stored objects are shown right away and compared with a fresh SARA record.
+Saved items are re-checked in batches in the background, when the app is idle and on Wi-Fi.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List
+from kivy.clock import Clock
+
+
+# Background refreshes - small, they are single-record requests
+_refresh_executor = ThreadPoolExecutor(max_workers=2)
+
+# Local bookkeeping, never taken from SARA
+LOCAL_FIELDS = ('timestamp', 'offlinePinned', 'primaryImageRef')
+
+# Downloaded images - only replaced when the object's reproductions changed
+IMAGE_FIELDS = ('images', 'imageRefs', 'deferredImageRefs', 'primaryImage',
+                'primaryImageSmall', 'additionalImages', 'hasImage')
+
+
+def images_changed(stored: Dict[str, Any], fresh: Dict[str, Any]) -> bool:
+    """True when the fresh record has other reproductions than the stored copy"""
+    return list(fresh.get('imageRefs') or []) != list(stored.get('imageRefs') or [])
+
+
+def _is_empty(value) -> bool:
+    return value is None or value == '' or value == [] or value == {}
+
+
+def diff_object(stored: Dict[str, Any], fresh: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Fields of fresh that differ from stored
+
+    Only fields present in both records are compared - a copy stored from a
+    search result lacks the detail-only fields (provenance, notes, ...), which is
+    not a change. Missing and empty values count as equal. Image fields are only
+    compared (and then all taken) when the reproductions changed.
+    """
+    changes = {}
+    check_images = images_changed(stored, fresh)
+    for field, value in fresh.items():
+        if field in LOCAL_FIELDS:
+            continue
+        if field in IMAGE_FIELDS:
+            if check_images and stored.get(field) != value:
+                changes[field] = value
+            continue
+        if field not in stored:
+            continue
+        old_value = stored[field]
+        if _is_empty(old_value) and _is_empty(value):
+            continue
+        if old_value != value:
+            changes[field] = value
+    return changes
+
+
+def refresh_object(sara_api, obj: Dict[str, Any], callback):
+    """
+    Fetch a fresh copy of a stored object in the background
+
+    callback(obj, changes) runs on the UI thread with the changed fields (empty
+    when nothing changed), or None when the object could not be fetched. obj is
+    not modified - applying the changes is up to the caller.
+    """
+    priref = obj.get('priref', '')
+    if not priref:
+        return
+
+    def worker():
+        changes = None  # type: Optional[Dict[str, Any]]
+        try:
+            fresh = sara_api.get_object_detail(priref, download_images=False)
+            if fresh:
+                if images_changed(obj, fresh):
+                    sara_api.attach_images(fresh)
+                changes = diff_object(obj, fresh)
+        except Exception as e:
+            print(f"ObjectRefresh: could not refresh {priref}: {e}")
+        Clock.schedule_once(lambda dt: callback(obj, changes), 0)
+
+    _refresh_executor.submit(worker)
+
+
+class SavedItemRefresher:
+    """
+    Re-checks saved items against SARA (Singleton)
+
+    Runs at most once per REFRESH_INTERVAL, only while the user has not touched
+    the app for IDLE_SECONDS and the device is on Wi-Fi. Saved items are fetched
+    BATCH_SIZE at a time with OR'ed priref queries, at most MAX_CONCURRENT_REQUESTS
+    in parallel. Only items that changed are written back. A run stops between
+    batches when the user becomes active or Wi-Fi is lost, and is retried later.
+    """
+
+    _instance = None
+    _initialized = False
+
+    BATCH_SIZE = 50
+    MAX_CONCURRENT_REQUESTS = 2
+    IDLE_SECONDS = 30
+    CHECK_INTERVAL = 60  # Seconds between "should we run?" checks
+    REFRESH_INTERVAL = 24 * 3600
+    META_KEY = 'saved_refreshed_at'
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(SavedItemRefresher, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        # Only initialize once
+        if SavedItemRefresher._initialized:
+            return
+
+        SavedItemRefresher._initialized = True
+
+        self.sara_api = None
+        self._running = False
+        self._interrupted = threading.Event()
+        self._last_activity = time.monotonic()
+
+    def start(self, sara_api):
+        """Begin watching for idle periods (call once, from the UI thread)"""
+        from kivy.core.window import Window
+        self.sara_api = sara_api
+        Window.bind(on_touch_down=self._on_user_activity, on_key_down=self._on_user_activity)
+        Clock.schedule_interval(self._maybe_run, self.CHECK_INTERVAL)
+
+    def interrupt(self):
+        """Stop a running refresh after its current batches (app pause)"""
+        self._interrupted.set()
+
+    def _on_user_activity(self, *args):
+        self._last_activity = time.monotonic()
+        return False  # Observe only - the touch/key still goes to the widgets
+
+    def _is_idle(self) -> bool:
+        return time.monotonic() - self._last_activity >= self.IDLE_SECONDS
+
+    def _can_continue(self) -> bool:
+        from utils.network_monitor import NetworkMonitor
+        return not self._interrupted.is_set() and self._is_idle() and NetworkMonitor().is_on_wifi()
+
+    def _is_due(self, data_manager) -> bool:
+        try:
+            last_run = float(data_manager.store.get_meta(self.META_KEY) or 0)
+        except (TypeError, ValueError):
+            last_run = 0
+        return time.time() - last_run >= self.REFRESH_INTERVAL
+
+    def _maybe_run(self, dt):
+        """Clock check (UI thread) - start a refresh when due, idle and on Wi-Fi"""
+        from utils.data_manager import DataManager
+        data_manager = DataManager()
+        if self._running or self.sara_api is None or not self._is_idle():
+            return
+        if not data_manager.get_saved_count() or not self._is_due(data_manager):
+            return
+        self._interrupted.clear()
+        if not self._can_continue():
+            return
+        self._running = True
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def _run(self):
+        """Worker thread: check all saved items, batch by batch"""
+        from utils.data_manager import DataManager
+        data_manager = DataManager()
+        started_at = time.monotonic()
+        prirefs = [item.get('priref', '') for item in data_manager.get_saved_items() if item.get('priref')]
+        batches = [prirefs[i:i + self.BATCH_SIZE] for i in range(0, len(prirefs), self.BATCH_SIZE)]
+        try:
+            with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_REQUESTS) as pool:
+                results = list(pool.map(self._refresh_batch, batches))
+            done = [result for result in results if result is not None]
+            print(f"SavedItemRefresher: {len(prirefs)} saved items, {len(done)} of {len(batches)} batch requests done, "
+                  f"{sum(done)} changed ({time.monotonic() - started_at:.1f} s)")
+            if len(done) == len(batches):
+                data_manager.store.set_meta(self.META_KEY, str(time.time()))
+            else:
+                print("SavedItemRefresher: stopped early - will continue when idle on Wi-Fi again")
+        except Exception as e:
+            print(f"SavedItemRefresher: refresh failed: {e}")
+        finally:
+            self._running = False
+
+    def _refresh_batch(self, prirefs: List[str]) -> Optional[int]:
+        """Fetch and compare one batch; returns the number of changed items, None if skipped or failed"""
+        if not self._can_continue():
+            return None
+        from utils.data_manager import DataManager
+        data_manager = DataManager()
+        try:
+            fresh_objects = self.sara_api.get_object_details(prirefs)
+        except Exception as e:
+            print(f"SavedItemRefresher: batch request failed: {e}")
+            return None
+
+        changed = 0
+        for priref in prirefs:
+            fresh = fresh_objects.get(priref)
+            stored = data_manager.get_saved_object(priref)
+            if fresh is None or stored is None:
+                continue  # Not found in SARA (kept as saved) or unsaved meanwhile
+            try:
+                if images_changed(stored, fresh):
+                    self.sara_api.attach_images(fresh)
+                changes = diff_object(stored, fresh)
+            except Exception as e:
+                print(f"SavedItemRefresher: could not compare {priref}: {e}")
+                continue
+            if changes:
+                stored.update(changes)
+                if data_manager.update_saved_item(stored):
+                    changed += 1
+        return changed
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Offline Packs for SARA Museum App
+Pins saved items for offline use: full detail record plus all published reproductions
+"""
+
+import json
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, Optional
+from kivy.clock import Clock
+
+from utils.image_cache import (
+    get_data_dir, get_directory_size, enforce_storage_quota, STORAGE_QUOTA_BYTES
+)
+
+
+class OfflinePackManager:
+    """Downloads and tracks pinned offline packs (Singleton)"""
+
+    _instance = None
+    _initialized = False
+
+    MANIFEST_NAME = 'pack.json'
+    # Parallel image downloads per pack
+    MAX_CONCURRENT_DOWNLOADS = 4
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(OfflinePackManager, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        # Only initialize once
+        if OfflinePackManager._initialized:
+            return
+
+        OfflinePackManager._initialized = True
+
+        self._lock = threading.Lock()
+        self._in_progress = set()  # prirefs currently downloading
+        self._executor = ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_DOWNLOADS)
+
+    def get_packs_dir(self) -> Path:
+        """Directory holding all packs - outside temp_images, so never evicted"""
+        packs_dir = get_data_dir() / "offline_packs"
+        packs_dir.mkdir(parents=True, exist_ok=True)
+        return packs_dir
+
+    def _pack_dir(self, priref: str) -> Path:
+        return self.get_packs_dir() / str(priref)
+
+    def is_pinned(self, priref: str) -> bool:
+        """Check if a complete pack exists for an object"""
+        return bool(priref) and (self._pack_dir(priref) / self.MANIFEST_NAME).exists()
+
+    def is_pinning(self, priref: str) -> bool:
+        """Check if a pack is currently being downloaded"""
+        with self._lock:
+            return priref in self._in_progress
+
+    def get_pack_record(self, priref: str) -> Optional[Dict[str, Any]]:
+        """Load the offline record (with local image paths) for a pinned object"""
+        manifest_path = self._pack_dir(priref) / self.MANIFEST_NAME
+        try:
+            if manifest_path.exists():
+                with open(manifest_path, 'r', encoding='utf-8') as f:
+                    return json.load(f).get('record')
+        except Exception as e:
+            print(f"OfflinePacks: could not read pack {priref}: {e}")
+        return None
+
+    def get_pinned_bytes(self) -> int:
+        """Storage used by all packs (counts toward the storage quota)"""
+        return get_directory_size(self.get_packs_dir())
+
+    def pin(self, obj: Dict[str, Any], sara_api, callback=None) -> bool:
+        """
+        Download an offline pack in the background
+
+        Args:
+            obj: Object dict (needs priref)
+            sara_api: SaraAPI instance used for downloads
+            callback: Called on the UI thread with (priref, record or None, error message)
+
+        Returns:
+            False if the pack is already pinned or downloading
+        """
+        priref = obj.get('priref', '')
+        if not priref:
+            return False
+        with self._lock:
+            if priref in self._in_progress:
+                return False
+            self._in_progress.add(priref)
+
+        def worker():
+            record, error = None, ''
+            try:
+                record, error = self._build_pack(priref, sara_api)
+            except Exception as e:
+                error = str(e)
+                print(f"OfflinePacks: pinning {priref} failed: {e}")
+            finally:
+                with self._lock:
+                    self._in_progress.discard(priref)
+            if callback:
+                Clock.schedule_once(lambda dt: callback(priref, record, error), 0)
+
+        threading.Thread(target=worker, daemon=True).start()
+        return True
+
+    def _build_pack(self, priref: str, sara_api):
+        """Fetch record and reproductions into the pack directory (worker thread)"""
+        record = sara_api.get_object_detail(priref, download_images=False)
+        if not record:
+            return None, 'Objektet kunne ikke hentes fra SARA'
+
+        pack_dir = self._pack_dir(priref)
+        pack_dir.mkdir(parents=True, exist_ok=True)
+        image_refs = record.get('imageRefs', [])
+
+        # Full reproductions and thumbnails are fetched concurrently
+        full_futures = [
+            self._executor.submit(sara_api.download_image_by_reference, ref, False, pack_dir)
+            for ref in image_refs
+        ]
+        thumb_futures = [
+            self._executor.submit(sara_api.download_image_by_reference, ref, True, pack_dir)
+            for ref in image_refs
+        ]
+        images = [future.result() for future in full_futures]
+        thumbnails = [future.result() for future in thumb_futures]
+
+        if any(path is None for path in images):
+            shutil.rmtree(pack_dir, ignore_errors=True)
+            return None, 'Ikke alle billeder kunne hentes'
+
+        if self.get_pinned_bytes() > STORAGE_QUOTA_BYTES:
+            shutil.rmtree(pack_dir, ignore_errors=True)
+            return None, 'Lagerkvoten for offline objekter er opbrugt'
+
+        record.update({
+            'images': images,
+            'deferredImageRefs': [],
+            'primaryImage': images[0] if images else '',
+            'primaryImageSmall': thumbnails[0] if thumbnails and thumbnails[0] else (images[0] if images else ''),
+            'additionalImages': images[1:],
+            'thumbnails': thumbnails,
+            'hasImage': len(images) > 0,
+            'offlinePinned': True,
+        })
+
+        # Manifest is written last and atomically - its presence marks a complete pack
+        temp_path = pack_dir / (self.MANIFEST_NAME + '.part')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'priref': priref, 'record': record}, f, ensure_ascii=False)
+        temp_path.replace(pack_dir / self.MANIFEST_NAME)
+
+        # Packs count toward the quota - shrink the evictable cache accordingly
+        enforce_storage_quota(self.get_pinned_bytes())
+        return record, ''
+
+    def unpin(self, priref: str):
+        """Delete an offline pack"""
+        if priref:
+            shutil.rmtree(self._pack_dir(priref), ignore_errors=True)
@@ -0,0 +1,640 @@
+#!/usr/bin/env python3
+"""
+Saved Item Store for SARA Museum App
+SQLite storage for saved items and recent searches, migrated once from the old JSON files
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Iterator
+
+from utils.compact_record import pack_record, unpack_record, make_summary
+
+
+# Version of the database layout (meta 'schema_version')
+#   0: saved_items.data is the full object as JSON text
+#   1: saved_items.data is a packed record (compact_record), summary holds the in-memory form
+#   2: saved_search holds the full-text index of saved items
+#   3: recent_searches.object holds the packed object of each recent search
+SCHEMA_VERSION = 3
+
+# Searchable text of a saved item: index column -> object fields
+SEARCH_COLUMNS = (
+    ('title', ('title', 'objectName')),
+    ('description', ('description',)),
+    ('object_number', ('objectNumber',)),
+    ('location', ('currentLocation', 'location_name', 'location_context')),
+    ('provenance', ('provenance', 'acquisition_source', 'acquisition_reason')),
+)
+
+# bm25 weights, in column order (priref is not indexed)
+SEARCH_WEIGHTS = (0, 10.0, 1.0, 8.0, 3.0, 2.0)
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS saved_items (
+    priref TEXT PRIMARY KEY,
+    object_number TEXT NOT NULL DEFAULT '',
+    seq INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    summary TEXT NOT NULL DEFAULT '{}'
+);
+CREATE INDEX IF NOT EXISTS idx_saved_object_number ON saved_items(object_number);
+CREATE INDEX IF NOT EXISTS idx_saved_seq ON saved_items(seq);
+
+CREATE TABLE IF NOT EXISTS recent_searches (
+    object_number TEXT PRIMARY KEY,
+    seq INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    object BLOB
+);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class SavedItemStore:
+    """
+    SQLite store behind DataManager, written behind the caller's back
+
+    Saved items are keyed by priref with an index on object number; the newest
+    item has the highest seq. Each row holds the packed full record and a small
+    summary - only summaries are loaded into memory, full records are unpacked
+    on demand with get_saved_item(). A full-text index (FTS5 where the SQLite
+    build has it, a plain table searched with LIKE otherwise) is kept in the same
+    transactions as the rows, see search_saved(). Changes are only queued by the calling thread (the
+    UI thread, usually) and a background writer applies them a moment later. A
+    burst of changes is coalesced - the last change per row wins - and written as
+    one transaction, so the database is never left half-updated. flush() writes
+    everything queued right away (app pause/stop). A change that keeps failing is
+    dropped after MAX_WRITE_ATTEMPTS.
+    """
+
+    # Seconds the writer waits after the first queued change, to coalesce bursts
+    WRITE_DELAY = 0.5
+
+    # Failed writes of one change before it is dropped (and logged)
+    MAX_WRITE_ATTEMPTS = 3
+
+    def __init__(self, db_file: str = 'museum_data.db',
+                 saved_items_json: str = 'saved_items.json',
+                 recent_searches_json: str = 'recent_searches.json'):
+        self.db_file = db_file
+        self._lock = threading.Lock()  # Guards the connection
+        self._conn = sqlite3.connect(db_file, check_same_thread=False)
+        self._conn.executescript(SCHEMA)
+        self._fts = self._create_search_index()
+        self._upgrade_schema()
+        self._migrate_from_json(saved_items_json, recent_searches_json)
+
+        # Pending changes: (table, key) -> operation, in the order they were queued
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # One flush at a time
+        self._pending = OrderedDict()
+        self._failures = {}  # (table, key) -> (operation, failed attempts)
+        self._dirty = threading.Event()
+
+        # Sequence numbers are handed out when a change is queued, so coalescing keeps the order
+        self._saved_seq = self._next_seq('saved_items')
+        self._recent_seq = self._next_seq('recent_searches')
+
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer.start()
+
+    # ---- helpers -------------------------------------------------------
+
+    @staticmethod
+    def _dumps(item: Dict[str, Any]) -> str:
+        return json.dumps(item, ensure_ascii=False, separators=(',', ':'))
+
+    def _next_seq(self, table: str) -> int:
+        row = self._conn.execute(f"SELECT COALESCE(MAX(seq), 0) + 1 FROM {table}").fetchone()
+        return row[0]
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _saved_row(item: Dict[str, Any], seq: int):
+        """Values for an INSERT into saved_items"""
+        summary = json.dumps(make_summary(item), ensure_ascii=False, separators=(',', ':'))
+        return item['priref'], item.get('objectNumber', ''), seq, pack_record(item), summary
+
+    # ---- full-text index -----------------------------------------------
+
+    def _create_search_index(self) -> bool:
+        """Create saved_search; returns True for FTS5, False for the LIKE fallback"""
+        columns = ', '.join(name for name, _ in SEARCH_COLUMNS)
+        try:
+            self._conn.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS saved_search USING fts5("
+                f"priref UNINDEXED, {columns}, tokenize = 'unicode61 remove_diacritics 2')"
+            )
+            return True
+        except sqlite3.OperationalError as e:
+            print(f"SavedItemStore: FTS5 not available, using LIKE search: {e}")
+        self._conn.execute(f"CREATE TABLE IF NOT EXISTS saved_search (priref TEXT PRIMARY KEY, {columns})")
+        return False
+
+    @staticmethod
+    def _search_row(item: Dict[str, Any]):
+        """Values for an INSERT into saved_search"""
+        values = [item['priref']]
+        for _, fields in SEARCH_COLUMNS:
+            values.append(' '.join(str(item[field]) for field in fields if item.get(field)))
+        return tuple(values)
+
+    def _index_saved(self, search_row):
+        """(Re)index one saved item - call inside a transaction"""
+        self._conn.execute("DELETE FROM saved_search WHERE priref = ?", (search_row[0],))
+        placeholders = ', '.join('?' * len(search_row))
+        self._conn.execute(f"INSERT INTO saved_search VALUES ({placeholders})", search_row)
+
+    def _rebuild_search_index(self):
+        """Index all saved items again - call inside a transaction"""
+        self._conn.execute("DELETE FROM saved_search")
+        for priref, data in self._conn.execute("SELECT priref, data FROM saved_items").fetchall():
+            self._index_saved(self._search_row(dict(unpack_record(data), priref=priref)))
+
+    # ---- migration -----------------------------------------------------
+
+    def _upgrade_schema(self):
+        """Bring an older database up to SCHEMA_VERSION, in one transaction"""
+        version = int(self._get_meta('schema_version') or 0)
+        if version >= SCHEMA_VERSION:
+            return
+        try:
+            with self._lock, self._conn:
+                columns = [row[1] for row in self._conn.execute("PRAGMA table_info(saved_items)")]
+                if 'summary' not in columns:
+                    self._conn.execute("ALTER TABLE saved_items ADD COLUMN summary TEXT NOT NULL DEFAULT '{}'")
+                columns = [row[1] for row in self._conn.execute("PRAGMA table_info(recent_searches)")]
+                if 'object' not in columns:
+                    self._conn.execute("ALTER TABLE recent_searches ADD COLUMN object BLOB")
+                # Repack rows stored as JSON text
+                rows = self._conn.execute(
+                    "SELECT priref, data FROM saved_items WHERE typeof(data) = 'text'"
+                ).fetchall()
+                for priref, data in rows:
+                    item = json.loads(data)
+                    _, _, _, packed, summary = self._saved_row(dict(item, priref=priref), 0)
+                    self._conn.execute(
+                        "UPDATE saved_items SET data = ?, summary = ? WHERE priref = ?", (packed, summary, priref)
+                    )
+                if version < 2:
+                    self._rebuild_search_index()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),)
+                )
+            if rows:
+                print(f"SavedItemStore: repacked {len(rows)} saved items (schema {version} -> {SCHEMA_VERSION})")
+        except Exception as e:
+            print(f"SavedItemStore: schema upgrade failed: {e}")
+
+    def _migrate_from_json(self, saved_items_json: str, recent_searches_json: str):
+        """Import the old JSON files once; they are kept with a .migrated suffix"""
+        if self._get_meta('json_migrated'):
+            return
+
+        saved_items = self._read_json(saved_items_json)
+        recent_searches = self._read_json(recent_searches_json)
+
+        try:
+            with self._lock, self._conn:
+                # Oldest first, so the first (newest) item ends up with the highest seq
+                seq = self._next_seq('saved_items')
+                for item in reversed(saved_items):
+                    if not item.get('priref'):
+                        continue
+                    inserted = self._conn.execute(
+                        "INSERT OR IGNORE INTO saved_items (priref, object_number, seq, data, summary) "
+                        "VALUES (?, ?, ?, ?, ?)", self._saved_row(item, seq)
+                    ).rowcount
+                    if inserted:
+                        self._index_saved(self._search_row(item))
+                    seq += 1
+                seq = self._next_seq('recent_searches')
+                for item in reversed(recent_searches):
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO recent_searches (object_number, seq, data) VALUES (?, ?, ?)",
+                        (item.get('objectNumber', ''), seq, self._dumps(item))
+                    )
+                    seq += 1
+                self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('json_migrated', '1')")
+        except Exception as e:
+            print(f"SavedItemStore: JSON migration failed: {e}")
+            return
+
+        for path in (saved_items_json, recent_searches_json):
+            if os.path.exists(path):
+                try:
+                    os.replace(path, path + '.migrated')
+                except OSError as e:
+                    print(f"SavedItemStore: could not rename {path}: {e}")
+        print(f"SavedItemStore: migrated {len(saved_items)} saved items and {len(recent_searches)} recent searches")
+
+    @staticmethod
+    def _read_json(path: str) -> List[Dict[str, Any]]:
+        try:
+            if os.path.exists(path):
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                    return data if isinstance(data, list) else []
+        except Exception as e:
+            print(f"SavedItemStore: could not read {path}: {e}")
+        return []
+
+    # ---- write-behind queue --------------------------------------------
+
+    def _queue(self, table: str, key: str, operation):
+        """Queue a change; a later change to the same row replaces it"""
+        with self._pending_lock:
+            self._add_pending(table, key, operation)
+        self._dirty.set()
+
+    def _add_pending(self, table: str, key: str, operation):
+        if key == '*':
+            # Whole-table change makes earlier row changes of that table moot
+            for pending_key in [k for k in self._pending if k[0] == table]:
+                del self._pending[pending_key]
+        self._pending.pop((table, key), None)
+        self._pending[(table, key)] = operation
+
+    def _writer_loop(self):
+        """Background writer: wait for changes, let the burst settle, write it"""
+        while True:
+            self._dirty.wait()
+            time.sleep(self.WRITE_DELAY)
+            self.flush()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Write all queued changes now, as one transaction
+
+        Waits for a write in progress - at most timeout seconds, if given.
+        Returns False when it gave up waiting (the changes stay queued).
+        """
+        if not self._flush_lock.acquire(timeout=-1 if timeout is None else timeout):
+            print(f"SavedItemStore: flush gave up after {timeout} s, a write is still in progress")
+            return False
+        try:
+            with self._pending_lock:
+                operations = self._pending
+                self._pending = OrderedDict()
+                self._dirty.clear()
+            if not operations:
+                return True
+
+            try:
+                with self._lock, self._conn:
+                    for operation in operations.values():
+                        operation()
+                self._failures.clear()
+            except Exception as e:
+                print(f"SavedItemStore: write failed, retrying the changes one by one: {e}")
+                self._retry_separately(operations)
+            return True
+        finally:
+            self._flush_lock.release()
+
+    def _retry_separately(self, operations):
+        """
+        Write the changes of a failed transaction one at a time
+
+        The ones that fail again are queued for a later attempt, before anything
+        queued meanwhile - or dropped once they have failed MAX_WRITE_ATTEMPTS times.
+        """
+        failed = OrderedDict()
+        for (table, key), operation in operations.items():
+            try:
+                with self._lock, self._conn:
+                    operation()
+                self._failures.pop((table, key), None)
+                continue
+            except Exception as e:
+                error = e
+            last_operation, attempts = self._failures.get((table, key), (None, 0))
+            attempts = attempts + 1 if last_operation is operation else 1
+            if attempts >= self.MAX_WRITE_ATTEMPTS:
+                print(f"SavedItemStore: dropping change to {table} '{key}' after {attempts} failed writes: {error}")
+                self._failures.pop((table, key), None)
+            else:
+                self._failures[(table, key)] = (operation, attempts)
+                failed[(table, key)] = operation
+        if not failed:
+            return
+        with self._pending_lock:
+            newer = self._pending
+            self._pending = failed
+            for (table, key), operation in newer.items():
+                self._add_pending(table, key, operation)
+        self._dirty.set()
+
+    # ---- saved items ---------------------------------------------------
+
+    def load_saved_items(self) -> List[Dict[str, Any]]:
+        """Summaries of all saved items, newest first"""
+        self.flush()
+        with self._lock:
+            rows = self._conn.execute("SELECT summary FROM saved_items ORDER BY seq DESC").fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def get_saved_item(self, priref: str) -> Optional[Dict[str, Any]]:
+        """Full (rehydrated) saved object, or None"""
+        self.flush()
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM saved_items WHERE priref = ?", (priref,)).fetchone()
+        return unpack_record(row[0]) if row else None
+
+    def put_saved_item(self, item: Dict[str, Any], to_front: bool = True):
+        """Insert or replace one saved item (the full object); to_front makes it the newest"""
+        priref = item['priref']
+        object_number = item.get('objectNumber', '')
+        _, _, _, data, summary = self._saved_row(item, 0)
+        search_row = self._search_row(item)
+        if to_front:
+            seq = self._saved_seq
+            self._saved_seq += 1
+        else:
+            # A position-keeping update must not undo a queued move to the front
+            with self._pending_lock:
+                queued = self._pending.get(('saved', priref))
+            seq = getattr(queued, 'seq', None)
+
+        def write():
+            row_seq = seq
+            if row_seq is None:
+                row = self._conn.execute("SELECT seq FROM saved_items WHERE priref = ?", (priref,)).fetchone()
+                row_seq = row[0] if row else self._next_seq('saved_items')
+            self._conn.execute(
+                "INSERT OR REPLACE INTO saved_items (priref, object_number, seq, data, summary) VALUES (?, ?, ?, ?, ?)",
+                (priref, object_number, row_seq, data, summary)
+            )
+            self._index_saved(search_row)
+
+        write.seq = seq
+        self._queue('saved', priref, write)
+
+    def update_saved_fields(self, priref: str, changes: Dict[str, Any]):
+        """Change some fields of a saved item; the record is unpacked and repacked by the writer"""
+        changes = dict(changes)
+
+        def apply_changes():
+            row = self._conn.execute("SELECT data FROM saved_items WHERE priref = ?", (priref,)).fetchone()
+            if row is None:
+                return
+            item = unpack_record(row[0])
+            item.update(changes)
+            _, _, _, data, summary = self._saved_row(item, 0)
+            self._conn.execute(
+                "UPDATE saved_items SET data = ?, summary = ? WHERE priref = ?", (data, summary, priref)
+            )
+            self._index_saved(self._search_row(dict(item, priref=priref)))
+
+        # Runs after a change already queued for the row, inside the same transaction
+        with self._pending_lock:
+            queued = self._pending.get(('saved', priref))
+        if queued is None:
+            write = apply_changes
+        else:
+            def write():
+                queued()
+                apply_changes()
+            write.seq = getattr(queued, 'seq', None)
+        self._queue('saved', priref, write)
+
+    def delete_saved_item(self, priref: str):
+        def write():
+            self._conn.execute("DELETE FROM saved_items WHERE priref = ?", (priref,))
+            self._conn.execute("DELETE FROM saved_search WHERE priref = ?", (priref,))
+
+        self._queue('saved', priref, write)
+
+    def clear_saved_items(self):
+        def write():
+            self._conn.execute("DELETE FROM saved_items")
+            self._conn.execute("DELETE FROM saved_search")
+
+        self._queue('saved', '*', write)
+
+    def search_saved(self, query: str, limit: int = 500) -> List[str]:
+        """Prirefs of saved items matching all words of query (as prefixes), best match first"""
+        words = re.findall(r'\w+', query.lower())
+        if not words:
+            return []
+        self.flush()
+        with self._lock:
+            if self._fts:
+                match = ' '.join(f'"{word}"*' for word in words)
+                weights = ', '.join(str(weight) for weight in SEARCH_WEIGHTS)
+                rows = self._conn.execute(
+                    f"SELECT priref FROM saved_search WHERE saved_search MATCH ? "
+                    f"ORDER BY bm25(saved_search, {weights}) LIMIT ?", (match, limit)
+                ).fetchall()
+            else:
+                # Every word somewhere in the text; title and object number hits first
+                columns = ' || \' \' || '.join(f's.{name}' for name, _ in SEARCH_COLUMNS)
+                conditions = ' AND '.join(f"({columns}) LIKE ?" for _ in words)
+                params = [f'%{word}%' for word in words]
+                rows = self._conn.execute(
+                    f"SELECT s.priref FROM saved_search s JOIN saved_items i ON i.priref = s.priref "
+                    f"WHERE {conditions} ORDER BY (s.title LIKE ?) + (s.object_number LIKE ?) DESC, i.seq DESC "
+                    f"LIMIT ?", params + [f'%{words[0]}%', f'{words[0]}%', limit]
+                ).fetchall()
+        return [row[0] for row in rows]
+
+    def iter_saved_items(self, batch_size: int = 500) -> Iterator[Dict[str, Any]]:
+        """Full saved objects, newest first, read in batches (the connection is free between batches)"""
+        self.flush()
+        last_seq = None
+        while True:
+            with self._lock:
+                if last_seq is None:
+                    rows = self._conn.execute(
+                        "SELECT priref, seq, data FROM saved_items ORDER BY seq DESC LIMIT ?", (batch_size,)
+                    ).fetchall()
+                else:
+                    rows = self._conn.execute(
+                        "SELECT priref, seq, data FROM saved_items WHERE seq < ? ORDER BY seq DESC LIMIT ?",
+                        (last_seq, batch_size)
+                    ).fetchall()
+            if not rows:
+                return
+            for priref, seq, data in rows:
+                yield dict(unpack_record(data), priref=priref)
+            last_seq = rows[-1][1]
+
+    def get_import_position(self, import_key: str) -> int:
+        """Number of input records an interrupted import already committed"""
+        with self._lock:
+            return int(self._get_meta(import_key) or 0)
+
+    def import_saved_batch(self, items: List[Dict[str, Any]], import_key: str, position: int) -> int:
+        """
+        Bulk insert imported items below the existing ones, skipping known prirefs
+
+        The import position is committed in the same transaction, so an interrupted
+        import resumes after the last complete batch. Returns the number inserted.
+        """
+        self.flush()
+        with self._lock, self._conn:
+            batch = OrderedDict()
+            for item in items:
+                if item.get('priref'):
+                    batch.setdefault(item['priref'], item)
+            prirefs = list(batch)
+            existing = set()
+            for start in range(0, len(prirefs), 500):
+                chunk = prirefs[start:start + 500]
+                existing.update(row[0] for row in self._conn.execute(
+                    f"SELECT priref FROM saved_items WHERE priref IN ({', '.join('?' * len(chunk))})", chunk
+                ))
+            new_items = [item for priref, item in batch.items() if priref not in existing]
+
+            # In input order, each one older than the one before
+            seq = self._conn.execute("SELECT COALESCE(MIN(seq), 1) FROM saved_items").fetchone()[0]
+            rows = []
+            for item in new_items:
+                seq -= 1
+                rows.append(self._saved_row(item, seq))
+            self._conn.executemany(
+                "INSERT INTO saved_items (priref, object_number, seq, data, summary) VALUES (?, ?, ?, ?, ?)", rows
+            )
+            if new_items:
+                placeholders = ', '.join('?' * (len(SEARCH_COLUMNS) + 1))
+                self._conn.executemany(
+                    f"INSERT INTO saved_search VALUES ({placeholders})",
+                    [self._search_row(item) for item in new_items]
+                )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (import_key, str(position))
+            )
+        return len(new_items)
+
+    def finish_import(self, import_key: str):
+        """Forget the position of a completed import"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM meta WHERE key = ?", (import_key,))
+
+    def get_meta(self, key: str) -> Optional[str]:
+        with self._lock:
+            return self._get_meta(key)
+
+    def set_meta(self, key: str, value: str):
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def has_priref(self, priref: str) -> bool:
+        self.flush()
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM saved_items WHERE priref = ?", (priref,)).fetchone()
+        return row is not None
+
+    def has_object_number(self, object_number: str) -> bool:
+        self.flush()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM saved_items WHERE object_number = ? LIMIT 1", (object_number,)
+            ).fetchone()
+        return row is not None
+
+    # ---- recent searches -----------------------------------------------
+
+    def load_recent_searches(self) -> List[Dict[str, Any]]:
+        """Recent searches, newest first"""
+        self.flush()
+        with self._lock:
+            rows = self._conn.execute("SELECT data FROM recent_searches ORDER BY seq DESC").fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def put_recent_search(self, item: Dict[str, Any], keep: int = 10, obj: Optional[Dict[str, Any]] = None):
+        """Make one search the newest (with its full object, if given) and drop the ones beyond keep"""
+        seq = self._recent_seq
+        self._recent_seq += 1
+        data = self._dumps(item)
+        packed = pack_record(obj) if obj else None
+
+        def write():
+            self._conn.execute(
+                "INSERT OR REPLACE INTO recent_searches (object_number, seq, data, object) VALUES (?, ?, ?, ?)",
+                (item.get('objectNumber', ''), seq, data, packed)
+            )
+            self._conn.execute(
+                "DELETE FROM recent_searches WHERE seq NOT IN "
+                "(SELECT seq FROM recent_searches ORDER BY seq DESC LIMIT ?)", (keep,)
+            )
+
+        self._queue('recent', item.get('objectNumber', ''), write)
+
+    def get_recent_object(self, object_number: str) -> Optional[Dict[str, Any]]:
+        """Full object stored with a recent search, or None"""
+        self.flush()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT object FROM recent_searches WHERE object_number = ?", (object_number,)
+            ).fetchone()
+        return unpack_record(row[0]) if row and row[0] else None
+
+    def put_recent_object(self, object_number: str, obj: Dict[str, Any]):
+        """Replace the full object of a recent search (no-op when the search is gone)"""
+        packed = pack_record(obj)
+        self._queue('recent_object', object_number, lambda: self._conn.execute(
+            "UPDATE recent_searches SET object = ? WHERE object_number = ?", (packed, object_number)
+        ))
+
+    def replace_recent_searches(self, items: List[Dict[str, Any]]):
+        """Store the whole (short) recent list; stored objects of searches still in it are kept"""
+        rows = []
+        for item in reversed(items):
+            rows.append((item.get('objectNumber', ''), self._recent_seq, self._dumps(item)))
+            self._recent_seq += 1
+
+        def write():
+            kept = [row[0] for row in rows]
+            self._conn.execute(
+                f"DELETE FROM recent_searches WHERE object_number NOT IN ({', '.join('?' * len(kept))})", kept
+            )
+            self._conn.executemany(
+                "INSERT INTO recent_searches (object_number, seq, data) VALUES (?, ?, ?) "
+                "ON CONFLICT(object_number) DO UPDATE SET seq = excluded.seq, data = excluded.data", rows
+            )
+
+        # Not a '*' change: queued row changes still run first and bring their objects
+        self._queue('recent', 'list', write)
+
+    def replace_saved_items(self, items: List[Dict[str, Any]]):
+        """Store a whole saved list of full objects (newest first)"""
+        rows = []
+        search_rows = []
+        for item in reversed(items):
+            if not item.get('priref'):
+                continue
+            rows.append(self._saved_row(item, self._saved_seq))
+            search_rows.append(self._search_row(item))
+            self._saved_seq += 1
+
+        def write():
+            self._conn.execute("DELETE FROM saved_items")
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO saved_items (priref, object_number, seq, data, summary) VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            self._conn.execute("DELETE FROM saved_search")
+            for search_row in search_rows:
+                self._index_saved(search_row)
+
+        self._queue('saved', '*', write)
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            self._conn.close()
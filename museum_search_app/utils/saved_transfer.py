@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Saved Transfer for SARA Museum App
+Streaming export of saved items (JSON Lines, CSV, zip bundle with cached images) and resumable import
+"""
+
+import csv
+import hashlib
+import io
+import json
+import os
+import shutil
+import time
+import zipfile
+from pathlib import Path
+from typing import Dict, Any, Iterator, Optional, Tuple
+
+from utils.image_cache import get_cache_dir, get_data_dir
+
+
+# Records per import transaction - also the granularity of resuming
+IMPORT_BATCH_SIZE = 500
+
+# Fields that may hold local image paths (a path or a list of paths)
+IMAGE_FIELDS = ('primaryImage', 'primaryImageSmall', 'additionalImages', 'images')
+
+# Spreadsheet columns, in order. Lists are joined with '; '
+CSV_FIELDS = (
+    'priref', 'objectNumber', 'title', 'objectName', 'dating', 'objectDate',
+    'description', 'department', 'classification', 'artistDisplayName', 'craftsman',
+    'medium', 'technique', 'dimensions', 'culture', 'currentLocation', 'location_name',
+    'location_context', 'acquisition_number', 'acquisition_source', 'acquisition_date',
+    'provenance', 'creditLine', 'primaryImageRef', 'objectURL',
+)
+
+BUNDLE_ITEMS = 'items.jsonl'
+BUNDLE_IMAGES = 'images/'
+
+# Exports are named gemte_objekter_<date>_<time>.zip in the transfer directory
+EXPORT_PREFIX = 'gemte_objekter_'
+IMPORT_EXTENSIONS = ('.zip', '.jsonl')
+
+
+def _dumps(item: Dict[str, Any]) -> str:
+    return json.dumps(item, ensure_ascii=False, separators=(',', ':'))
+
+
+# ---- transfer directory ------------------------------------------------
+
+def get_transfer_dir() -> Path:
+    """
+    Where exports are written and imports are looked for
+
+    On Android the shared Download/SARA folder, so the file can be copied to
+    another device; the app data directory elsewhere.
+    """
+    try:
+        from android.storage import primary_external_storage_path
+        transfer_dir = Path(primary_external_storage_path()) / 'Download' / 'SARA'
+    except ImportError:
+        transfer_dir = get_data_dir() / 'exports'
+    transfer_dir.mkdir(parents=True, exist_ok=True)
+    return transfer_dir
+
+
+def new_export_path(extension: str = '.zip') -> str:
+    """Path for a new export in the transfer directory"""
+    name = EXPORT_PREFIX + time.strftime('%Y-%m-%d_%H%M%S') + extension
+    return str(get_transfer_dir() / name)
+
+
+def find_latest_export() -> Optional[str]:
+    """Newest .zip or .jsonl file in the transfer directory, None when there is none"""
+    candidates = [path for path in get_transfer_dir().iterdir()
+                  if path.is_file() and path.suffix.lower() in IMPORT_EXTENSIONS]
+    if not candidates:
+        return None
+    return str(max(candidates, key=lambda path: path.stat().st_mtime))
+
+
+# ---- export ------------------------------------------------------------
+
+def export_saved(store, path: str) -> int:
+    """Export all saved items; the format follows the extension (.jsonl, .csv, .zip). Returns the count"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        return export_csv(store, path)
+    if extension == '.zip':
+        return export_bundle(store, path)
+    return export_jsonl(store, path)
+
+
+def export_jsonl(store, path: str) -> int:
+    """One full saved object per line, newest first"""
+    count = 0
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        for item in store.iter_saved_items():
+            f.write(_dumps(item) + '\n')
+            count += 1
+    os.replace(path + '.tmp', path)
+    print(f"SavedTransfer: exported {count} items to {path}")
+    return count
+
+
+def export_csv(store, path: str) -> int:
+    """Spreadsheet export of the main fields (utf-8 with BOM, so Excel shows æøå)"""
+    count = 0
+    with open(path + '.tmp', 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_FIELDS)
+        for item in store.iter_saved_items():
+            row = []
+            for field in CSV_FIELDS:
+                value = item.get(field, '')
+                if isinstance(value, (list, tuple)):
+                    value = '; '.join(str(part) for part in value)
+                row.append(value)
+            writer.writerow(row)
+            count += 1
+    os.replace(path + '.tmp', path)
+    print(f"SavedTransfer: exported {count} items to {path}")
+    return count
+
+
+def export_bundle(store, path: str) -> int:
+    """
+    Zip with items.jsonl and the cached images the items refer to
+
+    Image paths in the records are rewritten to their name inside the zip. The
+    records are streamed into the archive first; the images follow, stored
+    without recompression.
+    """
+    count = 0
+    image_names = {}  # Local path -> name in the zip
+    with zipfile.ZipFile(path + '.tmp', 'w', compression=zipfile.ZIP_DEFLATED) as bundle:
+        with bundle.open(BUNDLE_ITEMS, 'w') as raw, io.TextIOWrapper(raw, encoding='utf-8') as f:
+            for item in store.iter_saved_items():
+                f.write(_dumps(_bundle_image_paths(item, image_names)) + '\n')
+                count += 1
+        for local_path, name in image_names.items():
+            try:
+                bundle.write(local_path, name, compress_type=zipfile.ZIP_STORED)
+            except OSError as e:
+                print(f"SavedTransfer: could not add {local_path}: {e}")
+    os.replace(path + '.tmp', path)
+    print(f"SavedTransfer: exported {count} items and {len(image_names)} images to {path}")
+    return count
+
+
+def _bundle_image_paths(item: Dict[str, Any], image_names: Dict[str, str]) -> Dict[str, Any]:
+    """Copy of item with cached image paths replaced by their name in the bundle"""
+    def bundle_name(value):
+        if not isinstance(value, str) or not value or not os.path.isfile(value):
+            return value
+        name = image_names.get(value)
+        if name is None:
+            digest = hashlib.sha1(os.path.abspath(value).encode('utf-8')).hexdigest()[:16]
+            name = BUNDLE_IMAGES + digest + os.path.splitext(value)[1]
+            image_names[value] = name
+        return name
+
+    item = dict(item)
+    for field in IMAGE_FIELDS:
+        value = item.get(field)
+        if isinstance(value, list):
+            item[field] = [bundle_name(part) for part in value]
+        elif value:
+            item[field] = bundle_name(value)
+    return item
+
+
+# ---- import ------------------------------------------------------------
+
+def import_saved(store, path: str) -> int:
+    """
+    Import a JSON Lines file or zip bundle into the saved items
+
+    Items with a priref that is already saved are skipped. Records are inserted
+    in batches; if the import is interrupted, running it again on the same file
+    continues after the last committed batch. Returns the number of new items.
+    """
+    import_key = f"import:{os.path.basename(path)}:{os.path.getsize(path)}"
+    start = store.get_import_position(import_key)
+    if start:
+        print(f"SavedTransfer: resuming import of {path} at record {start}")
+
+    imported = 0
+    with _open_records(path) as (lines, resolve_image):
+        batch = []
+        position = 0
+        for line in lines:
+            position += 1
+            if position <= start or not line.strip():
+                continue
+            try:
+                item = json.loads(line)
+            except ValueError as e:
+                print(f"SavedTransfer: skipping bad record {position}: {e}")
+                continue
+            if not isinstance(item, dict) or not item.get('priref'):
+                continue
+            batch.append(_imported_item(item, resolve_image))
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                imported += store.import_saved_batch(batch, import_key, position)
+                batch = []
+        imported += store.import_saved_batch(batch, import_key, position)
+    store.finish_import(import_key)
+    print(f"SavedTransfer: imported {imported} new items from {path}")
+    return imported
+
+
+def _imported_item(item: Dict[str, Any], resolve_image) -> Dict[str, Any]:
+    """Prepare an imported record: local image paths, no offline pack on this device"""
+    item.pop('offlinePinned', None)
+    for field in IMAGE_FIELDS:
+        value = item.get(field)
+        if isinstance(value, list):
+            item[field] = [path for path in (resolve_image(part) for part in value) if path]
+        elif isinstance(value, str):
+            item[field] = resolve_image(value)
+    return item
+
+
+class _open_records:
+    """Context manager giving (lines, resolve_image) for a .jsonl file or a zip bundle"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+        self._bundle = None
+
+    def __enter__(self) -> Tuple[Iterator[str], Any]:
+        if zipfile.is_zipfile(self.path):
+            self._bundle = zipfile.ZipFile(self.path)
+            self._file = io.TextIOWrapper(self._bundle.open(BUNDLE_ITEMS), encoding='utf-8')
+            return self._file, self._extract_image
+        self._file = open(self.path, 'r', encoding='utf-8')
+        return self._file, lambda value: value
+
+    def __exit__(self, *exc_info):
+        self._file.close()
+        if self._bundle is not None:
+            self._bundle.close()
+        return False
+
+    def _extract_image(self, value: str) -> str:
+        """Bundle image name -> file in the image cache ('' when it is not in the bundle)"""
+        if not value or not value.startswith(BUNDLE_IMAGES):
+            return value
+        target = get_cache_dir() / ('import_' + os.path.basename(value))
+        if not target.exists():
+            try:
+                with self._bundle.open(value) as source, open(str(target) + '.tmp', 'wb') as dest:
+                    shutil.copyfileobj(source, dest)
+                os.replace(str(target) + '.tmp', str(target))
+            except (KeyError, OSError) as e:
+                print(f"SavedTransfer: could not extract {value}: {e}")
+                return ''
+        return str(target)
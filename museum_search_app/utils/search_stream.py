@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Search Stream for SARA Museum App
+Streams search results to the UI record by record; images are filled in afterwards
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from kivy.clock import Clock
+
+from utils.image_fetcher import mark_download_pending, unmark_download_pending
+
+
+# Shared background executor for searches. Two workers, so a new search does not
+# wait for a cancelled one that is still stuck in its current HTTP request.
+_search_executor = ThreadPoolExecutor(max_workers=2)
+
+
+class CancelToken:
+    """Cancellation flag shared between the UI thread and a search worker"""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+
+class SearchStream:
+    """
+    One streaming object number search
+
+    The worker fetches the search response, then parses and pushes one record at
+    a time (without images) and finally downloads the images of each record.
+    All callbacks run on the UI thread:
+
+        on_start(total)            number of records in the response (0 = no hits)
+        on_record(obj, index)      a parsed record, ready to show as a card
+        on_images(obj, index)      the record's image fields have been filled in
+        on_done(results)           all records and images are processed
+
+    cancel() stops the worker before its next record or image download. Callbacks
+    are checked against the token on the UI thread, so once a stream is cancelled
+    none of its results are shown - not even ones already scheduled.
+    """
+
+    def __init__(self, sara_api, query, on_start=None, on_record=None, on_images=None, on_done=None):
+        self.sara_api = sara_api
+        self.query = query
+        self.on_start = on_start
+        self.on_record = on_record
+        self.on_images = on_images
+        self.on_done = on_done
+        self.results = []
+        self._pending_prirefs = []  # Records whose images are still to be downloaded
+        self.cancel_token = CancelToken()
+        self.started_at = None
+        self.time_to_first_card = None  # Seconds from start until the first card was handed to the UI
+
+    def start(self):
+        """Start the search on the background executor"""
+        self.started_at = time.monotonic()
+        _search_executor.submit(self._run)
+        return self
+
+    def cancel(self):
+        """Cancel the search and its pending image downloads"""
+        if not self.cancel_token.cancelled:
+            print(f"SearchStream: cancelled '{self.query}'")
+        self.cancel_token.cancel()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel_token.cancelled
+
+    def _run(self):
+        """Worker thread"""
+        try:
+            self._stream()
+        except Exception as e:
+            print(f"SearchStream: search for '{self.query}' failed: {e}")
+            if not self.results:
+                self._dispatch(self._handle_start, 0)
+            self._dispatch(self.on_done, self.results)
+        finally:
+            # Cancelled or failed - the images left are up for healing again
+            for priref in self._pending_prirefs:
+                unmark_download_pending(priref)
+            self._pending_prirefs = []
+
+    def _stream(self):
+        if self.cancelled:
+            return
+        records = self.sara_api.fetch_records_by_number(self.query)
+        if self.cancelled:
+            return
+        self._dispatch(self._handle_start, len(records))
+
+        for record in records:
+            if self.cancelled:
+                return
+            try:
+                obj = self.sara_api.parse_search_record(record)
+            except Exception as e:
+                print(f"SearchStream: could not parse record: {e}")
+                continue
+            if obj:
+                if obj.get('imageRefs') and obj.get('priref'):
+                    # Marked before the card is shown, so it does not fetch the image itself
+                    mark_download_pending(obj['priref'])
+                    self._pending_prirefs.append(obj['priref'])
+                self.results.append(obj)
+                self._dispatch(self._handle_record, obj, len(self.results) - 1)
+
+        # Images last - cards are already visible with placeholders
+        for index, obj in enumerate(list(self.results)):
+            if self.cancelled:
+                return
+            if not obj.get('imageRefs'):
+                continue
+            try:
+                self.sara_api.attach_images(obj, self.cancel_token)
+            except Exception as e:
+                print(f"SearchStream: could not fetch images for {obj.get('priref', '')}: {e}")
+                self._release_pending(obj.get('priref', ''))
+                continue
+            self._dispatch(self.on_images, obj, index)
+            # After on_images has stored the new paths (scheduled callbacks run in order)
+            self._release_pending(obj.get('priref', ''), on_ui_thread=True)
+
+        self._dispatch(self.on_done, self.results)
+
+    def _release_pending(self, priref, on_ui_thread=False):
+        """The search is done with this record's images - it may be healed again"""
+        if priref not in self._pending_prirefs:
+            return
+        self._pending_prirefs.remove(priref)
+        if on_ui_thread:
+            Clock.schedule_once(lambda dt: unmark_download_pending(priref), 0)
+        else:
+            unmark_download_pending(priref)
+
+    def _dispatch(self, callback, *args):
+        """Run a callback on the UI thread, unless the stream was cancelled meanwhile"""
+        if callback:
+            def run(dt):
+                if not self.cancelled:
+                    callback(*args)
+            Clock.schedule_once(run, 0)
+
+    def _handle_start(self, total):
+        if self.on_start:
+            self.on_start(total)
+
+    def _handle_record(self, obj, index):
+        if self.on_record:
+            self.on_record(obj, index)
+        if index == 0:
+            self.time_to_first_card = time.monotonic() - self.started_at
+            print(f"SearchStream: time to first card {self.time_to_first_card * 1000:.0f} ms for '{self.query}'")
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Thumbnail Atlas for SARA Museum App
+Packs grid thumbnails into shared textures and resolves static UI icons from the icon atlas
+"""
+
+import os
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from kivy.clock import Clock
+from kivy.graphics.texture import Texture
+
+
+# Build-time atlas with the static UI icons (see tools/build_icon_atlas.py)
+ICON_ATLAS_FILE = 'utils/Images/icons.atlas'
+
+
+def icon_source(name: str) -> str:
+    """Image source for a UI icon - atlas region if the atlas was built, plain PNG otherwise"""
+    if os.path.exists(ICON_ATLAS_FILE):
+        return f'atlas://utils/Images/icons/{name}'
+    return f'utils/Images/{name}.png'
+
+
+class ThumbnailAtlas:
+    """Runtime atlas that packs visible grid thumbnails into a few shared textures (Singleton)"""
+
+    _instance = None
+    _initialized = False
+
+    # Set to False to make grid cards load their own textures again
+    enabled = True
+
+    PAGE_SIZE = 1024  # Texture page width/height in pixels
+    CELL_SIZE = 128  # Thumbnail cell size in pixels (100dp cards on xhdpi)
+    MAX_PAGES = 4
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(ThumbnailAtlas, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        # Only initialize once
+        if ThumbnailAtlas._initialized:
+            return
+
+        ThumbnailAtlas._initialized = True
+
+        self._pages = []  # Shared Texture pages
+        self._free_cells = []  # (page_index, x, y) never used or released
+        self._slots = OrderedDict()  # path -> slot dict, ordered by last use
+        self._pending = {}  # path -> WeakSet of owners waiting for decode
+        self._executor = ThreadPoolExecutor(max_workers=2)
+
+        try:
+            from PIL import Image  # noqa: F401
+            self._pillow_available = True
+        except ImportError:
+            self._pillow_available = False
+
+    def is_available(self) -> bool:
+        """Check if the atlas can be used (enabled and Pillow installed)"""
+        return self.enabled and self._pillow_available
+
+    def request(self, path: str, owner) -> bool:
+        """
+        Request a thumbnail region for a local image path
+
+        The owner gets on_atlas_region(path, region) called on the UI thread; region is
+        None if the image could not be packed. Returns False if the atlas is unavailable
+        and the caller should load the image itself.
+        """
+        if not path or not self.is_available():
+            return False
+
+        slot = self._slots.get(path)
+        if slot is not None:
+            slot['owners'].add(owner)
+            self._slots.move_to_end(path)
+            owner.on_atlas_region(path, slot['region'])
+            return True
+
+        if path in self._pending:
+            self._pending[path].add(owner)
+            return True
+
+        owners = weakref.WeakSet()
+        owners.add(owner)
+        self._pending[path] = owners
+        self._executor.submit(self._decode, path)
+        return True
+
+    def release(self, path: str, owner):
+        """Owner no longer shows the thumbnail - its cell may be reused"""
+        slot = self._slots.get(path)
+        if slot is not None:
+            slot['owners'].discard(owner)
+        pending = self._pending.get(path)
+        if pending is not None:
+            pending.discard(owner)
+
+    def _decode(self, path):
+        """Decode and crop a thumbnail to the cell size (worker thread)"""
+        pixels = None
+        try:
+            from PIL import Image, ImageOps
+            with Image.open(path) as source:
+                source.draft('RGB', (self.CELL_SIZE * 2, self.CELL_SIZE * 2))
+                thumbnail = ImageOps.fit(source.convert('RGBA'), (self.CELL_SIZE, self.CELL_SIZE))
+            # GL textures are filled bottom-up
+            pixels = thumbnail.transpose(Image.FLIP_TOP_BOTTOM).tobytes()
+        except Exception as e:
+            print(f"ThumbnailAtlas: could not decode {path}: {e}")
+        Clock.schedule_once(lambda dt: self._on_decoded(path, pixels), 0)
+
+    def _on_decoded(self, path, pixels):
+        """Blit decoded pixels into a free cell and hand out the region (UI thread)"""
+        owners = self._pending.pop(path, None)
+        if owners is None or not len(owners):
+            return  # Nobody is waiting any more
+
+        cell = self._allocate_cell() if pixels else None
+        if cell is None:
+            for owner in list(owners):
+                owner.on_atlas_region(path, None)
+            return
+
+        page_index, x, y = cell
+        texture = self._pages[page_index]
+        texture.blit_buffer(pixels, pos=(x, y), size=(self.CELL_SIZE, self.CELL_SIZE),
+                            colorfmt='rgba', bufferfmt='ubyte')
+        region = texture.get_region(x, y, self.CELL_SIZE, self.CELL_SIZE)
+
+        self._slots[path] = {
+            'cell': cell,
+            'region': region,
+            'pixels': pixels,  # Kept to restore the page after a GL context loss
+            'owners': owners,
+        }
+        for owner in list(owners):
+            owner.on_atlas_region(path, region)
+
+    def _allocate_cell(self):
+        """Find a free cell: unused, new page, or least recently used unowned slot"""
+        if not self._free_cells and len(self._pages) < self.MAX_PAGES:
+            self._add_page()
+
+        if self._free_cells:
+            return self._free_cells.pop()
+
+        for path, slot in self._slots.items():
+            if not len(slot['owners']):
+                del self._slots[path]
+                return slot['cell']
+
+        return None
+
+    def _add_page(self):
+        """Create a new shared texture page and split it into cells"""
+        texture = Texture.create(size=(self.PAGE_SIZE, self.PAGE_SIZE), colorfmt='rgba')
+        page_index = len(self._pages)
+        texture.add_reload_observer(lambda tex, index=page_index: self._reload_page(index))
+        self._pages.append(texture)
+
+        cells_per_row = self.PAGE_SIZE // self.CELL_SIZE
+        for row in range(cells_per_row):
+            for col in range(cells_per_row):
+                self._free_cells.append((page_index, col * self.CELL_SIZE, row * self.CELL_SIZE))
+
+    def _reload_page(self, page_index):
+        """Re-upload a page's thumbnails after the GL context was recreated (Android resume)"""
+        texture = self._pages[page_index]
+        for slot in self._slots.values():
+            index, x, y = slot['cell']
+            if index == page_index:
+                texture.blit_buffer(slot['pixels'], pos=(x, y), size=(self.CELL_SIZE, self.CELL_SIZE),
+                                    colorfmt='rgba', bufferfmt='ubyte')
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Tile Pyramid for SARA Museum App
+Builds deep-zoom tile pyramids from cached reproductions with Pillow
+"""
+
+import hashlib
+import json
+import math
+import os
+import shutil
+import threading
+import warnings
+from pathlib import Path
+from typing import Dict, Any, Optional
+from kivy.clock import Clock
+
+from utils.image_cache import get_data_dir, get_directory_size
+
+
+TILE_SIZE = 256
+MANIFEST_NAME = 'manifest.json'
+
+# Largest image decoded in memory (~96 MB as RGB). Bigger masters are decoded at
+# a reduced JPEG scale, so the pyramid's full resolution is at most this size.
+MAX_DECODE_PIXELS = 32 * 1000 * 1000
+# Upper bound on tile pyramids on disk; least recently viewed pyramids are evicted
+TILE_CACHE_BYTES = 100 * 1024 * 1024
+
+
+def get_tiles_root() -> Path:
+    """Directory where all tile pyramids are stored"""
+    return get_data_dir() / "tiles"
+
+
+def get_pyramid_dir(source_path: str) -> Path:
+    """Pyramid directory for a source image (changes if the source file changes)"""
+    stat = os.stat(source_path)
+    key = f"{os.path.abspath(source_path)}:{stat.st_size}:{int(stat.st_mtime)}"
+    return get_tiles_root() / hashlib.md5(key.encode()).hexdigest()[:12]
+
+
+def get_tile_path(pyramid_dir: Path, level: int, tile_x: int, tile_y: int) -> Path:
+    """Path of a single tile; level 0 is full resolution, each level halves the size"""
+    return pyramid_dir / str(level) / f"{tile_x}_{tile_y}.jpg"
+
+
+def load_manifest(pyramid_dir: Path) -> Optional[Dict[str, Any]]:
+    """Load a finished pyramid manifest, or None if the pyramid is not complete"""
+    manifest_path = pyramid_dir / MANIFEST_NAME
+    try:
+        if manifest_path.exists():
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            manifest['dir'] = str(pyramid_dir)
+            os.utime(manifest_path)  # Marks the pyramid as recently used for eviction
+            return manifest
+    except Exception as e:
+        print(f"TilePyramid: could not read manifest {manifest_path}: {e}")
+    return None
+
+
+def build_pyramid(source_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Build (or reuse) a tile pyramid for an image. Runs on a worker thread.
+
+    The source is decoded once, at a reduced JPEG scale if it is bigger than
+    MAX_DECODE_PIXELS; each following level is produced with a 2x box reduction
+    of the previous one, so only one level is held in memory at a time.
+
+    Returns:
+        Manifest dict with width, height, tile_size, levels and dir - or None on error
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        print("TilePyramid: Pillow not available, deep zoom disabled")
+        return None
+
+    try:
+        pyramid_dir = get_pyramid_dir(source_path)
+        manifest = load_manifest(pyramid_dir)
+        if manifest:
+            return manifest
+
+        image = _decode_source(Image, source_path)
+        if image is None:
+            return None
+
+        width, height = image.size
+        num_levels = max(1, int(math.ceil(math.log2(max(width, height) / TILE_SIZE))) + 1)
+        levels = []
+
+        for level in range(num_levels):
+            if level > 0:
+                image = image.reduce(2)
+            level_width, level_height = image.size
+            levels.append([level_width, level_height])
+
+            level_dir = pyramid_dir / str(level)
+            level_dir.mkdir(parents=True, exist_ok=True)
+            for tile_y in range(int(math.ceil(level_height / TILE_SIZE))):
+                for tile_x in range(int(math.ceil(level_width / TILE_SIZE))):
+                    box = (
+                        tile_x * TILE_SIZE,
+                        tile_y * TILE_SIZE,
+                        min((tile_x + 1) * TILE_SIZE, level_width),
+                        min((tile_y + 1) * TILE_SIZE, level_height)
+                    )
+                    image.crop(box).save(get_tile_path(pyramid_dir, level, tile_x, tile_y), 'JPEG', quality=85)
+
+        manifest = {
+            'width': width,
+            'height': height,
+            'tile_size': TILE_SIZE,
+            'levels': levels,
+        }
+
+        # Manifest is written last and atomically - its presence marks a complete pyramid
+        temp_path = pyramid_dir / (MANIFEST_NAME + '.part')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f)
+        temp_path.replace(pyramid_dir / MANIFEST_NAME)
+
+        manifest['dir'] = str(pyramid_dir)
+        print(f"TilePyramid: built {num_levels} levels for {width}x{height} image")
+        trim_tiles(TILE_CACHE_BYTES, keep=pyramid_dir)
+        return manifest
+
+    except Exception as e:
+        print(f"TilePyramid: failed to build pyramid for {source_path}: {e}")
+        return None
+
+
+def _decode_source(Image, source_path: str):
+    """
+    Decode the source as RGB with at most MAX_DECODE_PIXELS pixels
+
+    Pillow's decompression-bomb limit stays in force: sizes up to its hard limit
+    are accepted for this decode (the warning is silenced here only), anything
+    above it is refused. JPEG masters are decoded directly at 1/2, 1/4 or 1/8
+    scale (draft mode), so the full-size bitmap is never in memory.
+    """
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', Image.DecompressionBombWarning)
+            source = Image.open(source_path)
+    except Image.DecompressionBombError as e:
+        print(f"TilePyramid: {source_path} is too large for deep zoom: {e}")
+        return None
+
+    with source:
+        width, height = source.size
+        scale = 1
+        while scale < 8 and (width // scale) * (height // scale) > MAX_DECODE_PIXELS:
+            scale *= 2
+        if scale > 1:
+            source.draft('RGB', (int(math.ceil(width / scale)), int(math.ceil(height / scale))))
+        image = source.convert('RGB') if source.mode != 'RGB' else source.copy()
+
+    # Non-JPEG sources (or masters beyond 8x) are reduced after decoding
+    while image.size[0] * image.size[1] > MAX_DECODE_PIXELS:
+        image = image.reduce(2)
+    return image
+
+
+def trim_tiles(max_bytes: int, keep: Optional[Path] = None) -> int:
+    """
+    Delete least recently used pyramids until all tiles fit in max_bytes
+
+    Returns:
+        Number of bytes freed
+    """
+    tiles_root = get_tiles_root()
+    if not tiles_root.exists():
+        return 0
+    pyramids = []
+    total = 0
+    for entry in os.scandir(tiles_root):
+        if not entry.is_dir():
+            continue
+        manifest_path = os.path.join(entry.path, MANIFEST_NAME)
+        try:
+            last_used = os.path.getmtime(manifest_path)
+        except OSError:
+            last_used = entry.stat().st_mtime  # Incomplete pyramid
+        size = get_directory_size(Path(entry.path))
+        pyramids.append((last_used, size, entry.path))
+        total += size
+
+    freed = 0
+    for _, size, path in sorted(pyramids):
+        if total - freed <= max_bytes:
+            break
+        if keep is not None and Path(path) == Path(keep):
+            continue
+        shutil.rmtree(path, ignore_errors=True)
+        freed += size
+
+    if freed:
+        print(f"TilePyramid: evicted {freed // 1024} kB of tiles")
+    return freed
+
+
+def get_tiles_bytes() -> int:
+    """Disk space used by all tile pyramids"""
+    tiles_root = get_tiles_root()
+    return get_directory_size(tiles_root) if tiles_root.exists() else 0
+
+
+def build_pyramid_async(resolve_source, callback):
+    """
+    Resolve the source image and build its pyramid on a worker thread
+
+    Args:
+        resolve_source: Callable returning the local source path (may download)
+        callback: Called on the UI thread with the manifest, or None on failure
+    """
+    def worker():
+        source_path = resolve_source()
+        manifest = build_pyramid(source_path) if source_path else None
+        Clock.schedule_once(lambda dt: callback(manifest), 0)
+
+    threading.Thread(target=worker, daemon=True).start()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Build the UI icon atlas for SARA Museum App
+Packs the static icons from utils/Images into one texture (utils/Images/icons.atlas)
+
+Run before buildozer:  python tools/build_icon_atlas.py
+"""
+
+import os
+import sys
+import tempfile
+
+from PIL import Image
+from kivy.atlas import Atlas
+
+
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'museum_search_app')
+IMAGES_DIR = os.path.join(APP_DIR, 'utils', 'Images')
+
+# Icons are drawn at 24dp - 128px covers xxxhdpi screens
+ICONS = ['back.png', 'home.png', 'bookmark-white.png', 'search.png']
+ICON_SIZE = 128
+ATLAS_SIZE = 512
+
+
+def main():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        filenames = []
+        for icon in ICONS:
+            with Image.open(os.path.join(IMAGES_DIR, icon)) as image:
+                image = image.convert('RGBA')
+                image.thumbnail((ICON_SIZE, ICON_SIZE), Image.LANCZOS)
+                target = os.path.join(temp_dir, icon)
+                image.save(target)
+                filenames.append(target)
+
+        result = Atlas.create(os.path.join(IMAGES_DIR, 'icons'), filenames, ATLAS_SIZE)
+        if not result:
+            print("Icon atlas could not be created")
+            return 1
+
+    print(f"Icon atlas written to {os.path.join(IMAGES_DIR, 'icons.atlas')}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())